@@ -0,0 +1,344 @@
+"""Asyncio WebDriver client.
+
+A minimal W3C WebDriver client on asyncio streams, so one event loop can
+drive many browser sessions concurrently: each session keeps its own
+HTTP connection to the driver service, and while one session waits for
+its browser the loop serves the others. There are no threads and no
+client dependency besides Selenium, which is used to locate and start
+the driver service and to map WebDriver errors to the usual exceptions
+(NoSuchElementException, TimeoutException, ...).
+
+Covers the commands the async page objects use (see
+pages/async_base_page.py): navigation, element lookup and interaction,
+and synchronous and asynchronous scripts.
+"""
+
+import asyncio
+import json
+from typing import Any
+from urllib.parse import urlsplit
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+
+from core.driver_manager import DriverManager
+
+# W3C web element reference key
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class AsyncElement:
+    """Element of an AsyncWebDriver session.
+
+    Uses OOP pattern as an element is a remote reference bound to the
+    session that found it.
+    """
+
+    def __init__(self, driver: "AsyncWebDriver", element_id: str) -> None:
+        """Initialize element reference.
+
+        Args:
+            driver: Session that found the element.
+            element_id: WebDriver element id.
+        """
+        self.driver = driver
+        self.id = element_id
+
+    async def _execute(
+        self, method: str, command: str, payload: dict | None = None
+    ) -> Any:
+        """Run an element command (e.g., 'click', 'text')."""
+        return await self.driver.execute(
+            method, f"/element/{self.id}/{command}", payload
+        )
+
+    async def click(self) -> None:
+        """Click the element (trusted event)."""
+        await self._execute("POST", "click", {})
+
+    async def clear(self) -> None:
+        """Clear a text input."""
+        await self._execute("POST", "clear", {})
+
+    async def send_keys(self, text: str) -> None:
+        """Type text into the element (trusted key events)."""
+        await self._execute("POST", "value", {"text": text})
+
+    async def text(self) -> str:
+        """Get the rendered text."""
+        return await self._execute("GET", "text")
+
+    async def get_attribute(self, name: str) -> str | None:
+        """Get a DOM attribute."""
+        return await self._execute("GET", f"attribute/{name}")
+
+    async def is_displayed(self) -> bool:
+        """Check if the element is rendered visibly."""
+        return await self._execute("GET", "displayed")
+
+    async def is_enabled(self) -> bool:
+        """Check if the element is enabled."""
+        return await self._execute("GET", "enabled")
+
+
+class AsyncWebDriver:
+    """One browser session driven from an asyncio event loop.
+
+    Uses OOP pattern as a session owns its id and keep-alive connection to
+    the driver service.
+    """
+
+    def __init__(self, server_url: str) -> None:
+        """Initialize client (no session yet, see start).
+
+        Args:
+            server_url: Driver service URL (e.g., http://localhost:9515).
+        """
+        url = urlsplit(server_url)
+        self.host = url.hostname or "localhost"
+        self.port = url.port or 80
+        self.base_path = url.path.rstrip("/")
+        self.session_id: str | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        # One request in flight per connection
+        self._lock = asyncio.Lock()
+        self._locators = LocatorConverter()
+
+    async def start(self, capabilities: dict[str, Any]) -> "AsyncWebDriver":
+        """Create the browser session.
+
+        Args:
+            capabilities: Capabilities (e.g., ChromeOptions.to_capabilities()).
+
+        Returns:
+            This driver, with session_id set.
+        """
+        value = await self._command(
+            "POST", "/session", {"capabilities": {"alwaysMatch": capabilities}}
+        )
+        self.session_id = value["sessionId"]
+        return self
+
+    async def execute(self, method: str, path: str, payload: dict | None = None) -> Any:
+        """Run a session command.
+
+        Args:
+            method: HTTP method.
+            path: Command path relative to the session (e.g., '/url').
+            payload: JSON body (AsyncElement values are serialized).
+
+        Returns:
+            Command value (element references as AsyncElement).
+
+        Raises:
+            WebDriverException: Subclass matching the WebDriver error.
+        """
+        return await self._command(method, f"/session/{self.session_id}{path}", payload)
+
+    async def get(self, url: str) -> None:
+        """Navigate to a URL and wait for the page load."""
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        """Get the current page URL."""
+        return await self.execute("GET", "/url")
+
+    async def refresh(self) -> None:
+        """Reload the current page."""
+        await self.execute("POST", "/refresh", {})
+
+    async def find_element(self, by: str, value: str) -> AsyncElement:
+        """Find the first element matching a locator.
+
+        Raises:
+            NoSuchElementException: If no element matches.
+        """
+        by, value = self._locators.convert(by, value)
+        return await self.execute("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by: str, value: str) -> list[AsyncElement]:
+        """Find all elements matching a locator."""
+        by, value = self._locators.convert(by, value)
+        return await self.execute("POST", "/elements", {"using": by, "value": value})
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        """Run a synchronous script in the page."""
+        return await self.execute(
+            "POST", "/execute/sync", {"script": script, "args": list(args)}
+        )
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        """Run a script that reports its result through its last argument."""
+        return await self.execute(
+            "POST", "/execute/async", {"script": script, "args": list(args)}
+        )
+
+    async def delete_all_cookies(self) -> None:
+        """Delete all cookies of the current domain."""
+        await self.execute("DELETE", "/cookie")
+
+    async def quit(self) -> None:
+        """End the session (closes the browser) and the connection."""
+        try:
+            if self.session_id is not None:
+                await self._command("DELETE", f"/session/{self.session_id}")
+        finally:
+            self.session_id = None
+            self._close()
+
+    async def _command(
+        self, method: str, path: str, payload: dict | None = None
+    ) -> Any:
+        """Send a command and unwrap its value, raising WebDriver errors."""
+        body = b"" if payload is None else json.dumps(self._wrap(payload)).encode()
+        async with self._lock:
+            try:
+                status, data = await self._request(method, path, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Keep-alive connection closed by the service: reconnect once
+                self._close()
+                status, data = await self._request(method, path, body)
+
+        if status >= 400:
+            ErrorHandler().check_response({"status": status, "value": data.decode()})
+        return self._unwrap(json.loads(data)["value"]) if data else None
+
+    async def _request(self, method: str, path: str, body: bytes) -> tuple[int, bytes]:
+        """Send one HTTP/1.1 request on the session connection."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        self._writer.write(
+            (
+                f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json;charset=UTF-8\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode("latin-1")
+            + body
+        )
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Driver service closed the connection")
+        headers = {}
+        while (line := await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            data = b""
+            while size := int((await self._reader.readline()).strip(), 16):
+                data += await self._reader.readexactly(size + 2)
+                data = data[:-2]
+            await self._reader.readline()
+        else:
+            data = await self._reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection") == "close":
+            self._close()
+        return int(status_line.split()[1]), data
+
+    def _close(self) -> None:
+        """Close the connection (a new one is opened on the next command)."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    def _wrap(self, value: Any) -> Any:
+        """Serialize element arguments as W3C element references."""
+        if isinstance(value, AsyncElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        """Turn W3C element references into AsyncElement."""
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+
+class AsyncDriverManager:
+    """Starts one driver service and opens async browser sessions on it.
+
+    Uses OOP pattern as the service and the open sessions are shared by
+    all sessions of an event loop until quit.
+    """
+
+    def __init__(self, browser_config: dict[str, Any], server_url: str | None = None):
+        """Initialize manager (the service starts on the first session).
+
+        Args:
+            browser_config: Browser configuration (name, headless, ...).
+            server_url: Running driver service or Selenium Grid URL; a local
+                chromedriver/geckodriver is started when omitted.
+        """
+        self.browser_config = browser_config
+        self.server_url = server_url
+        self.sessions: list[AsyncWebDriver] = []
+        self._service: ChromeService | FirefoxService | None = None
+        self._browser_path: str | None = None
+        # Sessions opened concurrently (asyncio.gather) share one service
+        self._service_lock = asyncio.Lock()
+
+    async def new_session(self) -> AsyncWebDriver:
+        """Start a browser session with the configured options.
+
+        The first call starts the driver service; concurrent calls (e.g.,
+        asyncio.gather) wait for it and share it, so quit() stops it.
+
+        Returns:
+            Started AsyncWebDriver.
+
+        Raises:
+            ValueError: If the browser is not chrome or firefox.
+        """
+        options = DriverManager(self.browser_config).browser_options()
+        async with self._service_lock:
+            if self.server_url is None:
+                self.server_url = await asyncio.to_thread(self._start_service, options)
+        if self._browser_path:
+            options.binary_location = self._browser_path
+
+        driver = AsyncWebDriver(self.server_url)
+        await driver.start(options.to_capabilities())
+        self.sessions.append(driver)
+        return driver
+
+    async def quit(self) -> None:
+        """End all sessions concurrently and stop the local service."""
+        await asyncio.gather(
+            *(session.quit() for session in self.sessions), return_exceptions=True
+        )
+        self.sessions = []
+        if self._service is not None:
+            await asyncio.to_thread(self._service.stop)
+            self._service = None
+
+    def _start_service(self, options: Any) -> str:
+        """Start chromedriver/geckodriver (Selenium Manager finds binaries).
+
+        Returns:
+            Service URL.
+        """
+        is_chrome = self.browser_config.get("name", "chrome").lower() == "chrome"
+        service = ChromeService() if is_chrome else FirefoxService()
+        finder = DriverFinder(service, options)
+        self._browser_path = finder.get_browser_path() or None
+        service.path = service.env_path() or finder.get_driver_path()
+        service.start()
+        self._service = service
+        return service.service_url
@@ -0,0 +1,204 @@
+"""Combinatorial cart/checkout scenario generation.
+
+Expands product subsets x users x checkout data into test cases, reduced
+to an n-wise covering set: every combination of values of any ``strength``
+parameters (pairs by default) appears in at least one case, so coverage
+grows with the number of values instead of their product.
+
+Each catalog product is a yes/no parameter (in the cart or not), so the
+pairwise set also covers every pair of products together, apart and with
+every user and checkout data set. The cases are rendered as a Behave
+scenario outline (scripts/generate_scenarios.py) or used as a pytest
+parametrization (tests/integration, run in parallel with ``-n auto``).
+"""
+
+from itertools import combinations, product
+from typing import Any
+
+DEFAULT_USERS = ("standard_user",)
+
+DEFAULT_CHECKOUT_DATA = (
+    {"first_name": "John", "last_name": "Doe", "zip_code": "12345"},
+)
+
+# Value of the products column for an empty cart
+NO_PRODUCTS = "none"
+
+
+def covering_rows(
+    parameters: dict[str, list[Any]], strength: int = 2
+) -> list[dict[str, Any]]:
+    """Build a set of rows covering every n-wise value combination.
+
+    Greedy construction: each row starts from an uncovered combination and
+    every other parameter takes the value covering the most uncovered
+    combinations (ties: least used value, then first). The result is
+    deterministic.
+
+    Args:
+        parameters: Parameter name to its values (in preference order).
+        strength: Number of parameters whose value combinations must all
+            appear (2 = pairwise; len(parameters) = full product).
+
+    Returns:
+        Rows mapping every parameter name to a value.
+
+    Raises:
+        ValueError: If a parameter has no values or strength is out of range.
+
+    Examples:
+        >>> rows = covering_rows({"a": [0, 1], "b": [0, 1], "c": [0, 1]})
+        >>> len(rows)  # instead of 8
+        4
+        >>> len(covering_rows({"a": [0, 1], "b": [0, 1]}, strength=2))
+        4
+    """
+    names = list(parameters)
+    if not 1 <= strength <= len(names):
+        raise ValueError(f"Strength must be between 1 and {len(names)}: {strength}")
+    empty = [name for name in names if not parameters[name]]
+    if empty:
+        raise ValueError(f"Parameters without values: {', '.join(empty)}")
+
+    sizes = [len(parameters[name]) for name in names]
+    # A combination is a tuple of (parameter index, value index) pairs
+    uncovered = {
+        tuple(zip(indexes, values))
+        for indexes in combinations(range(len(names)), strength)
+        for values in product(*(range(sizes[index]) for index in indexes))
+    }
+
+    # Times each value was used, to balance values on ties
+    uses = [[0] * size for size in sizes]
+    rows = []
+    while uncovered:
+        row = dict(min(uncovered))
+        for index in range(len(names)):
+            if index not in row:
+                row[index] = max(
+                    range(sizes[index]),
+                    key=lambda value: (
+                        _newly_covered(row, index, value, strength, uncovered),
+                        -uses[index][value],
+                        -value,
+                    ),
+                )
+        for index, value in row.items():
+            uses[index][value] += 1
+        uncovered -= _covered(row, strength)
+        rows.append(
+            {name: parameters[name][row[index]] for index, name in enumerate(names)}
+        )
+    return rows
+
+
+def _covered(row: dict[int, int], strength: int) -> set[tuple]:
+    """List the combinations a complete row covers."""
+    return {
+        tuple((index, row[index]) for index in indexes)
+        for indexes in combinations(sorted(row), strength)
+    }
+
+
+def _newly_covered(
+    row: dict[int, int], index: int, value: int, strength: int, uncovered: set
+) -> int:
+    """Count uncovered combinations gained by assigning a value."""
+    assigned = sorted(row)
+    return sum(
+        tuple(sorted([*((other, row[other]) for other in others), (index, value)]))
+        in uncovered
+        for others in combinations(assigned, strength - 1)
+    )
+
+
+def checkout_combinations(
+    products: list[str],
+    users: list[str] | None = None,
+    checkout_data: list[dict[str, str]] | None = None,
+    strength: int = 2,
+) -> list[dict[str, Any]]:
+    """Generate covering cart/checkout cases.
+
+    Args:
+        products: Catalog product names (e.g., InventoryPage.PRODUCT_NAMES).
+        users: Users able to check out.
+        checkout_data: Checkout forms (first_name, last_name, zip_code).
+        strength: Covering strength (see covering_rows).
+
+    Returns:
+        Cases with 'user', 'products' (list, catalog order, may be empty)
+        and the checkout data fields.
+    """
+    users = list(users or DEFAULT_USERS)
+    checkout_data = list(checkout_data or DEFAULT_CHECKOUT_DATA)
+
+    parameters: dict[str, list[Any]] = {
+        "user": users,
+        "checkout_data": list(range(len(checkout_data))),
+    }
+    parameters.update({name: [True, False] for name in products})
+
+    cases = []
+    for row in covering_rows(parameters, min(strength, len(parameters))):
+        cases.append(
+            {
+                "user": row["user"],
+                "products": [name for name in products if row[name]],
+                **checkout_data[row["checkout_data"]],
+            }
+        )
+    return cases
+
+
+def render_outline(cases: list[dict[str, Any]], strength: int = 2) -> str:
+    """Render cases as a Behave scenario outline.
+
+    Args:
+        cases: Cases from checkout_combinations.
+        strength: Covering strength (shown in the feature description).
+
+    Returns:
+        Feature file text.
+    """
+    columns = ["user", "products", "first_name", "last_name", "zip_code"]
+    table = [columns] + [
+        [
+            case["user"],
+            ", ".join(case["products"]) or NO_PRODUCTS,
+            case["first_name"],
+            case["last_name"],
+            case["zip_code"],
+        ]
+        for case in cases
+    ]
+    widths = [max(len(row[column]) for row in table) for column in range(len(columns))]
+    examples = "\n".join(
+        "      | "
+        + " | ".join(cell.ljust(width) for cell, width in zip(row, widths))
+        + " |"
+        for row in table
+    )
+    return f"""# Generated by scripts/generate_scenarios.py - do not edit
+@generated @combinatorial @checkout
+Feature: Combinatorial cart and checkout
+  {len(cases)} cases covering every {strength}-wise combination of products in
+  the cart, users and checkout data.
+
+  Scenario Outline: <user> checks out <products>
+    Given I am logged in as "<user>"
+    When I add products "<products>" to the cart
+    And I click the shopping cart icon
+    And I click "Checkout"
+    And I enter checkout information:
+      | field      | value        |
+      | first_name | <first_name> |
+      | last_name  | <last_name>  |
+      | zip_code   | <zip_code>   |
+    And I click continue to review order
+    Then the order summary should list "<products>"
+    And the order totals should add up
+
+    Examples:
+{examples}
+"""
@@ -56,3 +56,111 @@ def get_browser_config(config: dict[str, Any]) -> dict[str, Any]:
         Browser configuration dictionary.
     """
     return config["browser"]
+
+
+def get_performance_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract performance metrics configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Performance configuration dictionary (empty if section is missing).
+    """
+    return config.get("performance", {})
+
+
+def get_load_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract load-generation configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Load configuration dictionary (empty if section is missing).
+    """
+    return config.get("load", {})
+
+
+def get_impact_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract test impact analysis configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Impact configuration dictionary (empty if section is missing).
+    """
+    return config.get("impact", {})
+
+
+def get_result_cache_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract scenario result cache configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Result cache configuration dictionary (empty if section is missing).
+    """
+    return config.get("result_cache", {})
+
+
+def get_history_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract test history (ordering and fail-fast) configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        History configuration dictionary (empty if section is missing).
+    """
+    return config.get("history", {})
+
+
+def get_retry_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract transient failure retry configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Retry configuration dictionary (empty if section is missing).
+    """
+    return config.get("retry", {})
+
+
+def get_combinatorial_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract combinatorial scenario generation configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Combinatorial configuration dictionary (empty if section is missing).
+    """
+    return config.get("combinatorial", {})
+
+
+def get_resources_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract browser resource governor configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Resources configuration dictionary (empty if section is missing).
+    """
+    return config.get("resources", {})
+
+
+def get_memory_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Extract browser memory monitoring configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Memory configuration dictionary (empty if section is missing).
+    """
+    return config.get("memory", {})
@@ -10,6 +10,25 @@ Uses functional approach - pure functions without side effects.
 
 from typing import Any
 
+from core.history import ORDER_POLICIES
+
+# Opt-in boolean options resolved with the CLI > ENV > config hierarchy
+FLAG_KEYS = (
+    "capture_events",
+    "capture_timing",
+    "capture_impact",
+    "cache_results",
+    "force_run",
+    "fast_actions",
+    "user_contexts",
+    "govern_workers",
+    "monitor_memory",
+    "record_history",
+)
+
+# Non-negative integer options (0 disables) resolved with the same hierarchy
+COUNT_KEYS = ("fail_fast_after", "retry_budget", "threads")
+
 
 def resolve_headless_mode(
     cli_value: str | None, env_value: str | None, config_value: bool
@@ -77,6 +96,112 @@ def resolve_browser_name(
     return str(effective_value).strip().lower()
 
 
+def resolve_base_url(
+    cli_value: str | None, env_value: str | None, config_value: str
+) -> str:
+    """Resolve target base URL from multiple configuration sources.
+
+    Allows pointing the same scenarios at another deployment (e.g., a local
+    stand-in of the application) without editing config.yaml.
+
+    Args:
+        cli_value: Value from CLI parameter (-Dbase_url=http://...) or None.
+        env_value: Value from environment variable (BASE_URL=http://...) or None.
+        config_value: Value from config file (config.yaml).
+
+    Returns:
+        str: Base URL without trailing slash.
+
+    Examples:
+        >>> resolve_base_url("http://localhost:8000/", None, "https://www.saucedemo.com")
+        'http://localhost:8000'
+        >>> resolve_base_url(None, None, "https://www.saucedemo.com")
+        'https://www.saucedemo.com'
+    """
+    effective_value = cli_value or env_value or config_value
+    return str(effective_value).strip().rstrip("/")
+
+
+def resolve_flag(
+    cli_value: str | None, env_value: str | None, config_value: bool
+) -> bool:
+    """Resolve an opt-in boolean option from multiple configuration sources.
+
+    Same hierarchy as headless mode (CLI > ENV > config file), used for
+    feature switches such as browser event capture.
+
+    Args:
+        cli_value: Value from CLI parameter (-Dcapture_events=true) or None.
+        env_value: Value from environment variable (CAPTURE_EVENTS=true) or None.
+        config_value: Value from config file (config.yaml).
+
+    Returns:
+        bool: Resolved flag value.
+
+    Examples:
+        >>> resolve_flag("true", None, False)
+        True
+        >>> resolve_flag(None, None, False)
+        False
+    """
+    effective_value = cli_value or env_value or str(config_value)
+    return _str_to_bool(effective_value)
+
+
+def resolve_test_order(
+    cli_value: str | None, env_value: str | None, config_value: str
+) -> str:
+    """Resolve test ordering policy from multiple configuration sources.
+
+    Args:
+        cli_value: Value from CLI parameter (-Dtest_order=failed) or None.
+        env_value: Value from environment variable (TEST_ORDER=failed) or None.
+        config_value: Value from config file (config.yaml).
+
+    Returns:
+        str: Normalized policy name (lowercase).
+
+    Raises:
+        ValueError: If the policy is not supported.
+
+    Examples:
+        >>> resolve_test_order(None, "Flaky", "none")
+        'flaky'
+        >>> resolve_test_order(None, None, "none")
+        'none'
+    """
+    effective_value = str(cli_value or env_value or config_value).strip().lower()
+    if effective_value not in ORDER_POLICIES:
+        raise ValueError(
+            f"Unsupported test order: {effective_value} "
+            f"(expected one of {', '.join(ORDER_POLICIES)})"
+        )
+    return effective_value
+
+
+def resolve_count(
+    cli_value: str | None, env_value: str | None, config_value: int
+) -> int:
+    """Resolve a non-negative count (0 disables) from configuration sources.
+
+    Args:
+        cli_value: Value from CLI parameter (-Dfail_fast_after=3) or None.
+        env_value: Value from environment variable (FAIL_FAST_AFTER=3) or None.
+        config_value: Value from config file (config.yaml).
+
+    Returns:
+        int: Resolved count (negative values are treated as 0).
+
+    Examples:
+        >>> resolve_count("3", None, 0)
+        3
+        >>> resolve_count(None, None, 0)
+        0
+    """
+    effective_value = cli_value or env_value or config_value
+    return max(int(effective_value), 0)
+
+
 def _str_to_bool(value: str) -> bool:
     """Convert string value to boolean.
 
@@ -125,7 +250,8 @@ def apply_config_hierarchy(
     Notes:
         This function modifies the config dict in place and will set
         sensible defaults when keys are missing (e.g., headless=False,
-        name='chrome').
+        name='chrome', flags in FLAG_KEYS=False, test_order='none',
+        counts in COUNT_KEYS=0).
     """
     if key == "headless":
         config[key] = resolve_headless_mode(
@@ -137,4 +263,16 @@ def apply_config_hierarchy(
             cli_value, env_value, config.get(key, "chrome")
         )
 
+    if key == "base_url":
+        config[key] = resolve_base_url(cli_value, env_value, config.get(key, ""))
+
+    if key == "test_order":
+        config[key] = resolve_test_order(cli_value, env_value, config.get(key, "none"))
+
+    if key in COUNT_KEYS:
+        config[key] = resolve_count(cli_value, env_value, config.get(key, 0))
+
+    if key in FLAG_KEYS:
+        config[key] = resolve_flag(cli_value, env_value, config.get(key, False))
+
     return config
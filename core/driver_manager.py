@@ -2,15 +2,37 @@
 
 Manages Selenium WebDriver lifecycle using OOP approach.
 Handles browser initialization, configuration, and cleanup.
+
+With user contexts enabled, one browser process serves many isolated
+sessions: each new_context() opens a window in its own WebDriver BiDi user
+context (separate cookies, storage and cache, like an incognito profile)
+and returns a driver bound to that window.
+
+A manager may be shared by threads (see the thread pool of core/runner.py):
+the driver is created, quit and its contexts opened and closed under a
+lock, and thread_context() binds one context to each calling thread.
+Contexts share one WebDriver session, which runs one command at a time:
+a command holds the lock until it returns, including in-page waits
+(execute_async_script, e.g. fast_actions) and implicit waits, so these
+serialize across contexts.
 """
 
+import copy
+import threading
 from typing import Any
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from core.event_capture import DEFAULT_MAX_EVENTS, EventCapture
+from core.memory_monitor import read_js_heap_mb
+from core.resource_governor import tree_usage
+from core.http_driver import HttpDriver
+
 
 class DriverManager:
     """Manages WebDriver instances with proper lifecycle handling.
@@ -27,19 +49,188 @@ class DriverManager:
         """
         self.browser_config = browser_config
         self._driver: WebDriver | None = None
+        self.event_capture: EventCapture | None = None
+        # Open user contexts: id(context driver) -> (window, user context)
+        self._contexts: dict[int, tuple[str, str]] = {}
+        # Classic commands of all contexts share one session: each command
+        # switches to its context's window while holding the lock
+        self._lock = threading.RLock()
+        self._current_window: str | None = None
+        # Context driver bound to each thread by thread_context
+        self._local = threading.local()
 
     def get_driver(self) -> WebDriver:
         """Get or create WebDriver instance.
 
         Implements lazy initialization - driver is created only when needed.
+        Threads calling this at the same time get the same driver. When
+        browser event capture is enabled, the BiDi event channel is opened
+        as soon as the driver exists; if the browser cannot stream events, a
+        warning is printed and event_capture stays None.
 
         Returns:
             Configured WebDriver instance.
         """
-        if self._driver is None:
-            self._driver = self._create_driver()
+        driver = self._driver
+        if driver is not None:
+            return driver
+
+        with self._lock:
+            if self._driver is None:
+                driver = self._create_driver()
+                if self._capture_events_enabled():
+                    self.event_capture = EventCapture(
+                        self.browser_config.get("event_buffer_size", DEFAULT_MAX_EVENTS)
+                    )
+                    if not self.event_capture.attach(driver):
+                        print(
+                            "[browser] capture_events is enabled but this "
+                            "browser/Selenium does not stream BiDi events; "
+                            "no events are captured"
+                        )
+                        self.event_capture = None
+                self._driver = driver
+            return self._driver
+
+    def new_context(self) -> WebDriver:
+        """Open an isolated browsing session in the shared browser.
+
+        The window is created in a new user context, so cookies,
+        localStorage and cache are not shared with other contexts. The
+        returned driver (and its elements) switch to that window for every
+        command; quit() closes only the context. Commands of concurrent
+        contexts are serialized for their whole duration, scripts that wait
+        in the page included; only page work between commands (loading,
+        rendering, timers) overlaps.
+
+        Returns:
+            Driver bound to the new context (a separate HttpDriver in HTTP
+            mode, which has no browser to share).
+        """
+        driver = self.get_driver()
+        if isinstance(driver, HttpDriver):
+            return self._create_http_driver()
+
+        with self._lock:
+            user_context = driver.browser.create_user_context()
+            window = driver.browsing_context.create(
+                type="window", user_context=user_context
+            )
+
+        context_driver = copy.copy(driver)
+        context_driver._switch_to = SwitchTo(context_driver)
+
+        def execute(command: str, params: dict | None = None) -> Any:
+            # The window must stay current until the command returns
+            with self._lock:
+                if self._current_window != window:
+                    type(driver).execute(
+                        context_driver, Command.SWITCH_TO_WINDOW, {"handle": window}
+                    )
+                    self._current_window = window
+                return type(driver).execute(context_driver, command, params)
+
+        context_driver.execute = execute
+        context_driver.quit = lambda: self.close_context(context_driver)
+        with self._lock:
+            self._contexts[id(context_driver)] = (window, user_context)
+        return context_driver
+
+    def thread_context(self) -> WebDriver:
+        """Get the calling thread's context, opening it on first use.
+
+        Each thread gets its own isolated context (see new_context) and the
+        same one on every call until it is closed, so code running in
+        worker threads needs no driver passed around.
+
+        Returns:
+            Driver bound to the calling thread's context.
+        """
+        context_driver = getattr(self._local, "driver", None)
+        if context_driver is None or (
+            not isinstance(context_driver, HttpDriver)
+            and id(context_driver) not in self._contexts
+        ):
+            context_driver = self._local.driver = self.new_context()
+        return context_driver
+
+    def close_context(self, context_driver: WebDriver) -> None:
+        """Close a context opened by new_context (browser keeps running).
+
+        Args:
+            context_driver: Driver returned by new_context.
+        """
+        if getattr(self._local, "driver", None) is context_driver:
+            self._local.driver = None
+        if isinstance(context_driver, HttpDriver):
+            context_driver.quit()
+            return
+
+        with self._lock:
+            window, user_context = self._contexts.pop(id(context_driver), (None, None))
+            if user_context is None or self._driver is None:
+                return
+            # Removing the user context closes its windows
+            self._driver.browser.remove_user_context(user_context)
+            if self._current_window == window:
+                self._current_window = None
+
+    @property
+    def browser_pid(self) -> int | None:
+        """PID of the local driver service, parent of the browser processes.
+
+        None without a driver, for remote drivers and in HTTP mode.
+        """
+        service = getattr(self._driver, "service", None)
+        process = getattr(service, "process", None)
+        return getattr(process, "pid", None)
+
+    def memory_usage(self, driver: WebDriver | None = None) -> dict[str, Any]:
+        """Measure browser memory (see core/memory_monitor.py).
+
+        Args:
+            driver: Driver of the page whose JS heap is read (e.g., a
+                context driver); defaults to the managed driver.
+
+        Returns:
+            'rss_mb' of the driver and browser process tree and
+            'js_heap_mb' of the page (None when not measurable).
+        """
+        pid = self.browser_pid
+        usage = tree_usage(pid) if pid is not None else None
+        driver = driver or self._driver
+        return {
+            "rss_mb": usage["rss_mb"] if usage else None,
+            "js_heap_mb": read_js_heap_mb(driver) if driver is not None else None,
+        }
+
+    def recycle(self) -> None:
+        """Quit the browser; the next get_driver/new_context starts a new one.
+
+        Drivers of contexts opened before must not be used afterwards.
+        """
+        self.quit()
 
-        return self._driver
+    @property
+    def open_contexts(self) -> int:
+        """Number of contexts opened by new_context and not closed."""
+        return len(self._contexts)
+
+    def _user_contexts_enabled(self) -> bool:
+        """Check if isolated user contexts per browser are configured.
+
+        Returns:
+            True if user_contexts is enabled in browser config.
+        """
+        return bool(self.browser_config.get("user_contexts", False))
+
+    def _capture_events_enabled(self) -> bool:
+        """Check if BiDi browser event capture is configured.
+
+        Returns:
+            True if capture_events is enabled in browser config.
+        """
+        return bool(self.browser_config.get("capture_events", False))
 
     def _create_driver(self) -> WebDriver:
         """Create and configure WebDriver instance.
@@ -56,15 +247,47 @@ class DriverManager:
             return self._create_chrome_driver()
         elif browser_name == "firefox":
             return self._create_firefox_driver()
+        elif browser_name == "http":
+            return self._create_http_driver()
         else:
             raise ValueError(f"Unsupported browser: {browser_name}")
 
+    def browser_options(self) -> ChromeOptions | FirefoxOptions:
+        """Build the browser options of the configured browser.
+
+        Returns:
+            Chrome or Firefox options (also used by async sessions).
+
+        Raises:
+            ValueError: If the browser has no WebDriver options (e.g., http).
+        """
+        browser_name = self.browser_config.get("name", "chrome").lower()
+        if browser_name == "chrome":
+            return self._chrome_options()
+        if browser_name == "firefox":
+            return self._firefox_options()
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
     def _create_chrome_driver(self) -> WebDriver:
         """Create Chrome WebDriver with configuration.
 
         Returns:
             Configured Chrome WebDriver.
         """
+        # Create driver (Selenium Manager will handle driver binary)
+        driver = webdriver.Chrome(options=self._chrome_options())
+
+        # Maximize window for better visibility
+        driver.maximize_window()
+
+        return driver
+
+    def _chrome_options(self) -> ChromeOptions:
+        """Build Chrome options from browser config.
+
+        Returns:
+            Configured Chrome options.
+        """
         options = ChromeOptions()
 
         # Apply headless mode if configured
@@ -103,19 +326,31 @@ class DriverManager:
         options.add_argument("--disable-infobars")
         options.add_argument("--disable-notifications")
 
-        # Create driver (Selenium Manager will handle driver binary)
-        driver = webdriver.Chrome(options=options)
+        # Open WebDriver BiDi channel for event streaming and user contexts
+        if self._capture_events_enabled() or self._user_contexts_enabled():
+            options.enable_bidi = True
+
+        return options
+
+    def _create_firefox_driver(self) -> WebDriver:
+        """Create Firefox WebDriver with configuration.
+
+        Returns:
+            Configured Firefox WebDriver.
+        """
+        # Create driver (Selenium Manager will handle geckodriver binary)
+        driver = webdriver.Firefox(options=self._firefox_options())
 
         # Maximize window for better visibility
         driver.maximize_window()
 
         return driver
 
-    def _create_firefox_driver(self) -> WebDriver:
-        """Create Firefox WebDriver with configuration.
+    def _firefox_options(self) -> FirefoxOptions:
+        """Build Firefox options from browser config.
 
         Returns:
-            Configured Firefox WebDriver.
+            Configured Firefox options.
         """
         options = FirefoxOptions()
 
@@ -134,19 +369,33 @@ class DriverManager:
         options.set_preference("signon.rememberSignons", False)
         options.set_preference("signon.autofillForms", False)
 
-        # Create driver (Selenium Manager will handle geckodriver binary)
-        driver = webdriver.Firefox(options=options)
+        # Open WebDriver BiDi channel for event streaming and user contexts
+        if self._capture_events_enabled() or self._user_contexts_enabled():
+            options.enable_bidi = True
 
-        # Maximize window for better visibility
-        driver.maximize_window()
+        return options
 
-        return driver
+    def _create_http_driver(self) -> HttpDriver:
+        """Create HTTP-level driver for non-visual assertions.
+
+        Fetches and parses HTML with requests instead of driving a browser,
+        so only server-rendered pages can be checked.
+
+        Returns:
+            HttpDriver exposing the WebDriver find/text surface.
+        """
+        return HttpDriver(timeout=self.browser_config.get("request_timeout", 10))
 
     def quit(self) -> None:
         """Quit the WebDriver and clean up resources.
 
-        Safe to call multiple times - only quits if driver exists.
+        Safe to call multiple times and from several threads - only the
+        first call quits the driver. Closes the browser of all contexts
+        opened by new_context.
         """
-        if self._driver is not None:
-            self._driver.quit()
-            self._driver = None
+        with self._lock:
+            driver, self._driver = self._driver, None
+            self._contexts.clear()
+            self._current_window = None
+            if driver is not None:
+                driver.quit()
@@ -0,0 +1,223 @@
+"""Browser event capture module.
+
+Streams network timings, console messages and JavaScript exceptions from a
+WebDriver BiDi session into bounded in-memory buffers. Events are pushed by
+the browser over the BiDi WebSocket and recorded from Selenium's listener
+thread, so reading them never costs an extra WebDriver round-trip.
+"""
+
+import threading
+from collections import deque
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+DEFAULT_MAX_EVENTS = 1000
+
+CHANNELS = ("network", "console", "errors")
+
+
+def _field(payload: Any, *names: str, default: Any = None) -> Any:
+    """Read a field from a BiDi payload regardless of its representation.
+
+    Depending on the Selenium version, BiDi events arrive either as raw
+    dictionaries (camelCase keys) or as generated dataclasses (snake_case
+    attributes). The first matching name wins.
+
+    Args:
+        payload: Event payload (dict or object).
+        *names: Candidate key/attribute names, in priority order.
+        default: Value returned when no name matches.
+
+    Returns:
+        The field value, or default when absent.
+
+    Examples:
+        >>> _field({"url": "https://example.com"}, "url")
+        'https://example.com'
+        >>> _field({}, "status", default=0)
+        0
+    """
+    if payload is None:
+        return default
+
+    for name in names:
+        if isinstance(payload, dict):
+            if payload.get(name) is not None:
+                return payload[name]
+        elif getattr(payload, name, None) is not None:
+            return getattr(payload, name)
+
+    return default
+
+
+def network_event_from_payload(payload: Any) -> dict[str, Any]:
+    """Normalize a BiDi ``network.responseCompleted`` payload.
+
+    Args:
+        payload: Raw event payload from the BiDi session.
+
+    Returns:
+        Dictionary with url, method, status, duration_ms and timestamp.
+        duration_ms is measured in-browser (request start to response end)
+        and is None when the browser does not report fetch timings.
+    """
+    request = _field(payload, "request", default={})
+    response = _field(payload, "response", default={})
+    timings = _field(request, "timings", default={})
+
+    start = _field(timings, "requestStart", "request_start") or _field(
+        timings, "fetchStart", "fetch_start"
+    )
+    end = _field(timings, "responseEnd", "response_end")
+    duration_ms = end - start if start and end else None
+
+    return {
+        "url": _field(request, "url", default=""),
+        "method": _field(request, "method", default=""),
+        "status": _field(response, "status", default=0),
+        "duration_ms": duration_ms,
+        "timestamp": _field(payload, "timestamp"),
+    }
+
+
+def console_event_from_payload(payload: Any) -> dict[str, Any]:
+    """Normalize a BiDi console log entry.
+
+    Args:
+        payload: Console entry from the BiDi session.
+
+    Returns:
+        Dictionary with level, text and timestamp.
+    """
+    return {
+        "level": _field(payload, "level", default="info"),
+        "text": _field(payload, "text", default=""),
+        "timestamp": _field(payload, "timestamp"),
+    }
+
+
+def error_event_from_payload(payload: Any) -> dict[str, Any]:
+    """Normalize a BiDi JavaScript error log entry.
+
+    Args:
+        payload: JavaScript error entry from the BiDi session.
+
+    Returns:
+        Dictionary with text, stack_trace and timestamp.
+    """
+    return {
+        "text": _field(payload, "text", "message", default=""),
+        "stack_trace": _field(payload, "stacktrace", "stack_trace"),
+        "timestamp": _field(payload, "timestamp"),
+    }
+
+
+class EventCapture:
+    """Bounded, thread-safe buffer of browser events for one scenario.
+
+    Uses OOP pattern as the buffer is shared state written by Selenium's
+    WebSocket listener thread and read by the test thread.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        """Initialize empty event buffers.
+
+        Args:
+            max_events: Maximum events kept per channel. Oldest events are
+                discarded first once the limit is reached.
+        """
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._buffers: dict[str, deque] = {
+            channel: deque(maxlen=max_events) for channel in CHANNELS
+        }
+        self._dropped: dict[str, int] = dict.fromkeys(CHANNELS, 0)
+        self.attached = False
+
+    def attach(self, driver: WebDriver) -> bool:
+        """Subscribe to BiDi events on the given driver.
+
+        Requires the driver to be created with BiDi enabled
+        (``options.enable_bidi = True``).
+
+        Args:
+            driver: WebDriver instance with an active BiDi session.
+
+        Returns:
+            True if subscriptions were registered, False if the browser or
+            Selenium version does not support BiDi event streaming.
+        """
+        try:
+            driver.script.add_console_message_handler(
+                lambda entry: self.record("console", console_event_from_payload(entry))
+            )
+            driver.script.add_javascript_error_handler(
+                lambda entry: self.record("errors", error_event_from_payload(entry))
+            )
+            driver.network.add_event_handler(
+                "response_completed",
+                lambda event: self.record("network", network_event_from_payload(event)),
+            )
+        except (AttributeError, WebDriverException):
+            self.attached = False
+            return False
+
+        self.attached = True
+        return True
+
+    def record(self, channel: str, event: dict[str, Any]) -> None:
+        """Append an event to a channel buffer.
+
+        Args:
+            channel: One of 'network', 'console' or 'errors'.
+            event: Normalized event dictionary.
+        """
+        with self._lock:
+            buffer = self._buffers[channel]
+            if len(buffer) == buffer.maxlen:
+                self._dropped[channel] += 1
+            buffer.append(event)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all buffered events without clearing them.
+
+        Returns:
+            Dictionary with one list per channel plus a 'dropped' counter map.
+        """
+        with self._lock:
+            events: dict[str, Any] = {
+                channel: list(buffer) for channel, buffer in self._buffers.items()
+            }
+            events["dropped"] = dict(self._dropped)
+        return events
+
+    def drain(self) -> dict[str, Any]:
+        """Return all buffered events and reset the buffers.
+
+        Returns:
+            Same structure as snapshot().
+        """
+        with self._lock:
+            events: dict[str, Any] = {
+                channel: list(buffer) for channel, buffer in self._buffers.items()
+            }
+            events["dropped"] = dict(self._dropped)
+            for buffer in self._buffers.values():
+                buffer.clear()
+            self._dropped = dict.fromkeys(CHANNELS, 0)
+        return events
+
+    def console_errors(self) -> list[dict[str, Any]]:
+        """Get console messages logged at error level.
+
+        Returns:
+            List of console events with level 'error'.
+        """
+        with self._lock:
+            return [
+                event
+                for event in self._buffers["console"]
+                if event.get("level") == "error"
+            ]
@@ -0,0 +1,131 @@
+"""Parsed feature file cache.
+
+Stores Behave's parsed Feature models on disk, keyed by a hash of the file
+content, so repeated runs (tag-filtered runs, dry-runs, the README metrics
+validator, load journeys) skip re-parsing unchanged .feature files.
+
+Behave runs use it through core.runner.FrameworkRunner.
+"""
+
+import copyreg
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from behave.model import Feature, Tag
+from behave.parser import parse_feature
+from behave.runner_util import FeatureScenarioLocationCollector2, FileLocation
+from behave.version import VERSION as BEHAVE_VERSION
+
+DEFAULT_CACHE_DIR = ".uat_cache/features"
+
+
+def _reduce_tag(tag: Tag) -> tuple:
+    """Pickle Tag (str subclass whose constructor also needs the line)."""
+    return (Tag, (str(tag), tag.line))
+
+
+copyreg.pickle(Tag, _reduce_tag)
+
+
+def feature_cache_key(filename: str, content: bytes, language: str | None) -> str:
+    """Build the cache key for a feature file.
+
+    The Behave version and language are part of the key, so upgrading Behave
+    or parsing with another language never returns a stale model.
+
+    Args:
+        filename: Feature file name as passed to the parser.
+        content: Raw file content.
+        language: Gherkin language (None for default).
+
+    Returns:
+        Hex digest identifying the parsed model.
+    """
+    digest = hashlib.sha256()
+    for part in (BEHAVE_VERSION, language or "", filename):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def load_feature(
+    filename: str, language: str | None = None, cache_dir: str = DEFAULT_CACHE_DIR
+) -> Feature | None:
+    """Parse a feature file, reusing the cached model when unchanged.
+
+    Args:
+        filename: Path to the .feature file.
+        language: Gherkin language (None for default).
+        cache_dir: Directory holding cached models.
+
+    Returns:
+        Parsed Feature (a fresh copy on every call), or None for a file
+        without a feature.
+
+    Raises:
+        ParserError: If the feature file is invalid.
+    """
+    content = Path(filename).read_bytes()
+    cache_file = (
+        Path(cache_dir) / f"{feature_cache_key(filename, content, language)}.pickle"
+    )
+
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass  # Corrupt or incompatible entry: re-parse and overwrite
+
+    feature = parse_feature(content.decode("utf8"), language, filename)
+
+    # Write atomically so concurrent runs never read a partial entry
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    temp_file.write_bytes(pickle.dumps(feature, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(temp_file, cache_file)
+
+    return feature
+
+
+def parse_features(
+    feature_files: list, language: str | None = None, cache_dir: str = DEFAULT_CACHE_DIR
+) -> list[Feature]:
+    """Cached equivalent of behave.runner_util.parse_features.
+
+    Supports plain file names and FileLocation objects with line numbers
+    (from "login.feature:10" on the command line), selecting scenarios
+    exactly like Behave.
+
+    Args:
+        feature_files: Feature file names or FileLocation objects.
+        language: Gherkin language (None for default).
+        cache_dir: Directory holding cached models.
+
+    Returns:
+        List of parsed Feature objects.
+    """
+    scenario_collector = FeatureScenarioLocationCollector2()
+    features = []
+    for location in feature_files:
+        if not isinstance(location, FileLocation):
+            location = FileLocation(os.path.normpath(location))
+
+        if location.filename == scenario_collector.filename:
+            scenario_collector.add_location(location)
+            continue
+        if scenario_collector.feature:
+            features.append(scenario_collector.build_feature())
+            scenario_collector.clear()
+
+        feature = load_feature(
+            os.path.abspath(location.filename), language=language, cache_dir=cache_dir
+        )
+        if feature:
+            scenario_collector.feature = feature
+            scenario_collector.add_location(location)
+
+    if scenario_collector.feature:
+        features.append(scenario_collector.build_feature())
+    return features
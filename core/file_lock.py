@@ -0,0 +1,48 @@
+"""Exclusive locks for run-level files shared by concurrent processes.
+
+Files under .uat_cache (test history, impact map, browser footprint) are
+updated by reading the stored entries, merging this run's entries and
+replacing the file. Several processes do this at once (pytest-xdist
+workers, parallel Behave runs); without a lock around the whole sequence
+the last replace wins and the other processes' entries are lost.
+
+Locks use fcntl.flock on a ``<file>.lock`` sibling (Linux and macOS, as on
+CI agents); where fcntl is unavailable updates run unlocked.
+"""
+
+import contextlib
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+@contextlib.contextmanager
+def file_lock(path: str | Path) -> Iterator[None]:
+    """Hold an exclusive lock for updating a shared file.
+
+    Blocks until no other process holds the lock of the same file.
+
+    Args:
+        path: File about to be read, merged and replaced.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     with file_lock(Path(directory) / "history.json"):
+        ...         sorted(p.name for p in Path(directory).iterdir())
+        ['history.json.lock']
+    """
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a", encoding="utf-8") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
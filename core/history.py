@@ -0,0 +1,213 @@
+"""Local outcome and duration history for test ordering.
+
+When enabled (see recording_enabled), every Behave scenario and pytest
+test records whether it passed and how long it took into a local history
+file. Entry points use it to run the
+tests most likely to fail first, shortening the time to the first failure
+on a red build:
+
+- ``failed``: tests that failed on their last run first.
+- ``flaky``: tests that both passed and failed recently first, then
+  tests that failed on their last run.
+- ``shortest``: fastest tests first.
+
+Tests without history (new tests) run right after the prioritized ones
+(``shortest``: first). Ties keep the original order.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+from core.file_lock import file_lock
+
+DEFAULT_HISTORY_PATH = ".uat_cache/test_history.json"
+
+# Recent outcomes kept per test (flakiness window)
+HISTORY_WINDOW = 10
+
+ORDER_POLICIES = ("none", "failed", "flaky", "shortest")
+
+# Map sections: one per test runner
+KINDS = ("behave", "pytest")
+
+PASSED = "P"
+FAILED = "F"
+
+Item = TypeVar("Item")
+
+
+def recording_enabled(history_config: dict[str, Any]) -> bool:
+    """Check whether a run records outcomes into the history file.
+
+    Recording is opt-in: record_history, an ordering policy other than
+    'none' or a fail-fast limit enable it, so plain runs leave the file
+    untouched.
+
+    Args:
+        history_config: Resolved history configuration.
+
+    Returns:
+        True if outcomes are recorded and saved.
+
+    Examples:
+        >>> recording_enabled({"test_order": "none", "fail_fast_after": 0})
+        False
+        >>> recording_enabled({"test_order": "flaky", "fail_fast_after": 0})
+        True
+        >>> recording_enabled({"record_history": True})
+        True
+    """
+    return bool(
+        history_config.get("record_history")
+        or history_config.get("test_order", "none") != "none"
+        or history_config.get("fail_fast_after")
+    )
+
+
+class OutcomeHistory:
+    """Outcome and duration history of tests across runs.
+
+    Uses OOP pattern as history is stateful (entries loaded once per run,
+    outcomes recorded during the run, merged back on save).
+    """
+
+    def __init__(
+        self, path: str = DEFAULT_HISTORY_PATH, window: int = HISTORY_WINDOW
+    ) -> None:
+        """Initialize history.
+
+        Args:
+            path: History file path.
+            window: Recent outcomes kept per test.
+        """
+        self.path = Path(path)
+        self.window = window
+        self.entries = self._load()
+        self.failures = 0
+        self._recorded: dict[str, dict[str, dict[str, Any]]] = {
+            kind: {} for kind in KINDS
+        }
+
+    def record(self, kind: str, test_id: str, passed: bool, duration: float) -> None:
+        """Record a test outcome.
+
+        Args:
+            kind: 'behave' or 'pytest'.
+            test_id: Scenario location or pytest node id.
+            passed: Whether the test passed.
+            duration: Duration in seconds.
+        """
+        outcome = PASSED if passed else FAILED
+        recorded = self._recorded[kind].setdefault(test_id, {"outcomes": ""})
+        recorded["outcomes"] += outcome
+        recorded["duration"] = round(duration, 3)
+        if not passed:
+            self.failures += 1
+
+    def outcomes(self, kind: str, test_id: str) -> str | None:
+        """Get recent outcomes, oldest first ('PPF...'), or None if unknown."""
+        entry = self.entries.get(kind, {}).get(test_id)
+        return None if entry is None else entry["outcomes"]
+
+    def sort_key(self, kind: str, test_id: str, policy: str) -> tuple:
+        """Get the ordering key of a test under a policy (lowest runs first).
+
+        Args:
+            kind: 'behave' or 'pytest'.
+            test_id: Scenario location or pytest node id.
+            policy: One of ORDER_POLICIES.
+
+        Returns:
+            Sortable tuple.
+
+        Raises:
+            ValueError: If policy is not supported.
+        """
+        if policy not in ORDER_POLICIES:
+            raise ValueError(f"Unsupported test order: {policy}")
+
+        outcomes = self.outcomes(kind, test_id)
+        if policy == "none":
+            return ()
+        if policy == "shortest":
+            entry = self.entries[kind].get(test_id, {})
+            return (entry.get("duration", 0.0),)
+
+        if outcomes is None:
+            return (2,)
+        last_failed = outcomes.endswith(FAILED)
+        if policy == "flaky":
+            flaky = PASSED in outcomes and FAILED in outcomes
+            return (0 if flaky else 1 if last_failed else 3,)
+        return (0 if last_failed else 3,)
+
+    def order(
+        self,
+        kind: str,
+        items: Iterable[Item],
+        policy: str,
+        test_id: Callable[[Item], str] = str,
+    ) -> list[Item]:
+        """Order tests by policy (stable: ties keep the original order).
+
+        Args:
+            kind: 'behave' or 'pytest'.
+            items: Tests to order.
+            policy: One of ORDER_POLICIES.
+            test_id: Function returning an item's test id.
+
+        Returns:
+            Ordered list.
+
+        Examples:
+            >>> history = OutcomeHistory("/nonexistent/history.json")
+            >>> history.entries["pytest"] = {
+            ...     "a": {"outcomes": "PPP", "duration": 0.5},
+            ...     "b": {"outcomes": "PPF", "duration": 2.0},
+            ...     "c": {"outcomes": "PFP", "duration": 0.1},
+            ... }
+            >>> history.order("pytest", ["a", "b", "c", "new"], "failed")
+            ['b', 'new', 'a', 'c']
+            >>> history.order("pytest", ["a", "b", "c", "new"], "flaky")
+            ['b', 'c', 'new', 'a']
+            >>> history.order("pytest", ["a", "b", "c", "new"], "shortest")
+            ['new', 'c', 'a', 'b']
+        """
+        return sorted(
+            items, key=lambda item: self.sort_key(kind, test_id(item), policy)
+        )
+
+    def save(self) -> None:
+        """Merge this run's outcomes into the stored history (atomic replace).
+
+        The file is re-read and replaced under an exclusive file lock (see
+        core/file_lock.py), so concurrent runs and pytest-xdist workers keep
+        each other's entries.
+        """
+        with file_lock(self.path):
+            entries = self._load()
+            for kind, recorded in self._recorded.items():
+                section = entries.setdefault(kind, {})
+                for test_id, update in recorded.items():
+                    previous = section.get(test_id, {}).get("outcomes", "")
+                    section[test_id] = {
+                        "outcomes": (previous + update["outcomes"])[-self.window :],
+                        "duration": update["duration"],
+                    }
+
+            temp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(entries, indent=1), encoding="utf-8")
+            os.replace(temp_file, self.path)
+        self.entries = entries
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Read the history file (empty sections if missing or unreadable)."""
+        entries: dict[str, dict[str, dict[str, Any]]] = {kind: {} for kind in KINDS}
+        if self.path.exists():
+            try:
+                entries.update(json.loads(self.path.read_text(encoding="utf-8")))
+            except ValueError:
+                pass
+        return entries
@@ -0,0 +1,566 @@
+"""HTTP-level WebDriver backend.
+
+Implements the subset of the Selenium WebDriver/WebElement surface used by
+the page objects (find_element(s), text, attributes, click, typing) on top
+of ``requests`` and the standard library HTML parser. Page objects can then
+run non-visual checks (titles, product lists, sort order, cart contents)
+against server-rendered pages without starting a browser.
+
+There is no JavaScript engine: execute_script is a no-op, so pages that
+render their content client-side need a real browser.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urljoin
+
+import requests
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+)
+from selenium.webdriver.common.by import By
+
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Elements whose content never contributes to visible text
+NON_TEXT_ELEMENTS = frozenset({"script", "style", "head", "template", "noscript"})
+
+_COMPOUND_PART = re.compile(
+    r"#(?P<id>[\w-]+)"
+    r"|\.(?P<cls>[\w-]+)"
+    r"|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~*^$]?=)\s*"
+    r"(?:\"(?P<dq>[^\"]*)\"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]"
+)
+_TAG = re.compile(r"^(?P<tag>\*|[a-zA-Z][\w-]*)")
+
+
+class Node:
+    """Lightweight DOM node built from parsed HTML."""
+
+    def __init__(
+        self, tag: str, attrs: dict[str, str], parent: "Node | None" = None
+    ) -> None:
+        """Initialize node.
+
+        Args:
+            tag: Lowercase tag name ('#document' for the root).
+            attrs: Element attributes.
+            parent: Parent node (None for the root).
+        """
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: list["Node | str"] = []
+
+    def elements(self) -> list["Node"]:
+        """Return all descendant elements in document order."""
+        found = []
+        for child in self.children:
+            if isinstance(child, Node):
+                found.append(child)
+                found.extend(child.elements())
+        return found
+
+    def text(self) -> str:
+        """Return whitespace-normalized text content (rendered-like)."""
+        pieces: list[str] = []
+        self._collect_text(pieces)
+        return " ".join(" ".join(pieces).split())
+
+    def _collect_text(self, pieces: list[str]) -> None:
+        """Collect text pieces from this node and descendants."""
+        if self.tag in NON_TEXT_ELEMENTS:
+            return
+        for child in self.children:
+            if isinstance(child, Node):
+                child._collect_text(pieces)
+            else:
+                pieces.append(child)
+
+    def classes(self) -> list[str]:
+        """Return the element's class list."""
+        return self.attrs.get("class", "").split()
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds a Node tree from HTML, tolerating unclosed tags."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        node = Node(tag, {k: v if v is not None else "" for k, v in attrs})
+        node.parent = self._stack[-1]
+        self._stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> Node:
+    """Parse an HTML document into a Node tree.
+
+    Args:
+        html: HTML source.
+
+    Returns:
+        Root '#document' node.
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def _parse_compound(selector: str) -> dict[str, Any]:
+    """Parse a compound selector like 'button#id.cls[data-test="x"]'.
+
+    Raises:
+        InvalidSelectorException: If the selector uses unsupported syntax.
+    """
+    compound: dict[str, Any] = {"tag": None, "id": None, "classes": [], "attrs": []}
+    rest = selector
+    tag_match = _TAG.match(rest)
+    if tag_match:
+        compound["tag"] = tag_match.group("tag").lower()
+        rest = rest[tag_match.end() :]
+
+    while rest:
+        match = _COMPOUND_PART.match(rest)
+        if not match:
+            raise InvalidSelectorException(
+                f"Unsupported CSS selector in HTTP mode: {selector}"
+            )
+        if match.group("id"):
+            compound["id"] = match.group("id")
+        elif match.group("cls"):
+            compound["classes"].append(match.group("cls"))
+        else:
+            value = next(
+                (
+                    match.group(g)
+                    for g in ("dq", "sq", "bare")
+                    if match.group(g) is not None
+                ),
+                None,
+            )
+            compound["attrs"].append((match.group("attr"), match.group("op"), value))
+        rest = rest[match.end() :]
+
+    return compound
+
+
+def _split_selector(selector: str) -> list[tuple[str, str]]:
+    """Split a complex selector into (combinator, compound) steps.
+
+    Whitespace inside attribute brackets is preserved.
+    """
+    steps: list[tuple[str, str]] = []
+    current, depth, combinator = "", 0, " "
+    for char in selector.strip() + " ":
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        if depth == 0 and (char.isspace() or char == ">"):
+            if current:
+                steps.append((combinator, current))
+                current, combinator = "", " "
+            if char == ">":
+                combinator = ">"
+            continue
+        current += char
+    return steps
+
+
+def _matches_compound(node: Node, compound: dict[str, Any]) -> bool:
+    """Check a node against a parsed compound selector."""
+    if compound["tag"] not in (None, "*") and node.tag != compound["tag"]:
+        return False
+    if compound["id"] is not None and node.attrs.get("id") != compound["id"]:
+        return False
+    if any(cls not in node.classes() for cls in compound["classes"]):
+        return False
+    for name, op, value in compound["attrs"]:
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if op == "=" and actual != value:
+            return False
+        if op == "~=" and value not in actual.split():
+            return False
+        if op == "*=" and value not in actual:
+            return False
+        if op == "^=" and not actual.startswith(value):
+            return False
+        if op == "$=" and not actual.endswith(value):
+            return False
+    return True
+
+
+def _matches_steps(node: Node, steps: list[tuple[str, dict]], scope: Node) -> bool:
+    """Check a node against selector steps, walking ancestors up to scope."""
+    combinator, compound = steps[-1]
+    if not _matches_compound(node, compound):
+        return False
+    if len(steps) == 1:
+        return True
+
+    ancestor = node.parent
+    while ancestor is not None and ancestor is not scope:
+        if _matches_steps(ancestor, steps[:-1], scope):
+            return True
+        if combinator == ">":
+            return False
+        ancestor = ancestor.parent
+    return False
+
+
+def select(scope: Node, by: str, value: str) -> list[Node]:
+    """Find descendant elements of scope matching a Selenium locator.
+
+    Args:
+        scope: Node to search within.
+        by: Selenium By strategy.
+        value: Locator value.
+
+    Returns:
+        Matching nodes in document order.
+
+    Raises:
+        InvalidSelectorException: For unsupported strategies (e.g., XPath).
+    """
+    candidates = scope.elements()
+    if by == By.ID:
+        return [n for n in candidates if n.attrs.get("id") == value]
+    if by == By.CLASS_NAME:
+        return [n for n in candidates if value in n.classes()]
+    if by == By.TAG_NAME:
+        return [n for n in candidates if n.tag == value.lower()]
+    if by == By.NAME:
+        return [n for n in candidates if n.attrs.get("name") == value]
+    if by == By.LINK_TEXT:
+        return [n for n in candidates if n.tag == "a" and n.text() == value]
+    if by == By.CSS_SELECTOR:
+        matches: list[Node] = []
+        for group in value.split(","):
+            steps = [(c, _parse_compound(s)) for c, s in _split_selector(group)]
+            matches.extend(
+                n
+                for n in candidates
+                if n not in matches and _matches_steps(n, steps, scope)
+            )
+        return [n for n in candidates if n in matches]
+    raise InvalidSelectorException(f"Locator strategy not supported in HTTP mode: {by}")
+
+
+class HttpElement:
+    """WebElement-compatible wrapper around a parsed Node."""
+
+    def __init__(self, driver: "HttpDriver", node: Node) -> None:
+        """Initialize element.
+
+        Args:
+            driver: Owning HttpDriver.
+            node: Parsed DOM node.
+        """
+        self._driver = driver
+        self._node = node
+
+    @property
+    def tag_name(self) -> str:
+        """Lowercase tag name."""
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        """Visible text content of the element."""
+        if not self.is_displayed():
+            return ""
+        return self._node.text()
+
+    def get_attribute(self, name: str) -> str | None:
+        """Get attribute value (resolving href/src against current URL)."""
+        value = self._node.attrs.get(name)
+        if value is not None and name in ("href", "src"):
+            return urljoin(self._driver.current_url, value)
+        if value is None and name == "value" and self.tag_name == "select":
+            options = self._options()
+            selected = [o for o in options if "selected" in o.attrs] or options
+            return selected[0].attrs.get("value") if selected else None
+        return value
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        """Get raw attribute value as written in the HTML."""
+        return self._node.attrs.get(name)
+
+    def get_property(self, name: str) -> Any:
+        """Get a DOM property (mapped to attributes)."""
+        return self.get_attribute(name)
+
+    def is_displayed(self) -> bool:
+        """Approximate visibility from hidden/style/type attributes."""
+        node: Node | None = self._node
+        while node is not None and node.tag != "#document":
+            style = node.attrs.get("style", "").replace(" ", "").lower()
+            if (
+                "hidden" in node.attrs
+                or "display:none" in style
+                or "visibility:hidden" in style
+                or (node.tag == "input" and node.attrs.get("type") == "hidden")
+            ):
+                return False
+            node = node.parent
+        return True
+
+    def is_enabled(self) -> bool:
+        """Check the element is not disabled."""
+        return "disabled" not in self._node.attrs
+
+    def is_selected(self) -> bool:
+        """Check checked/selected state of options, checkboxes and radios."""
+        if self.tag_name == "option":
+            select_node = self._enclosing("select")
+            if select_node is not None:
+                options = [n for n in select_node.elements() if n.tag == "option"]
+                if not any("selected" in o.attrs for o in options):
+                    return bool(options) and options[0] is self._node
+            return "selected" in self._node.attrs
+        return "checked" in self._node.attrs
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> "HttpElement":
+        """Find first descendant element matching locator."""
+        return self._driver._first(self._node, by, value)
+
+    def find_elements(
+        self, by: str = By.ID, value: str | None = None
+    ) -> list["HttpElement"]:
+        """Find all descendant elements matching locator."""
+        return [HttpElement(self._driver, n) for n in select(self._node, by, value)]
+
+    def clear(self) -> None:
+        """Clear the element's value."""
+        self._node.attrs["value"] = ""
+
+    def send_keys(self, *value: str) -> None:
+        """Append text to the element's value."""
+        self._node.attrs["value"] = self._node.attrs.get("value", "") + "".join(value)
+
+    def click(self) -> None:
+        """Emulate a click: follow links, submit forms, select options.
+
+        Buttons without a form or link are no-ops (no JavaScript engine).
+        """
+        node = self._node
+        if node.tag == "option":
+            select_node = self._enclosing("select")
+            for option in select_node.elements() if select_node else []:
+                option.attrs.pop("selected", None)
+            node.attrs["selected"] = ""
+            return
+        if node.tag == "input" and node.attrs.get("type") in ("checkbox", "radio"):
+            if "checked" in node.attrs:
+                node.attrs.pop("checked")
+            else:
+                node.attrs["checked"] = ""
+            return
+
+        link = node if node.tag == "a" else self._enclosing("a")
+        if link is not None and link.attrs.get("href"):
+            self._driver.get(urljoin(self._driver.current_url, link.attrs["href"]))
+            return
+
+        is_submit = (
+            node.tag == "button" and node.attrs.get("type", "submit") == "submit"
+        ) or (node.tag == "input" and node.attrs.get("type") in ("submit", "image"))
+        form = self._enclosing("form")
+        if is_submit and form is not None:
+            self._driver._submit(form, node)
+
+    def submit(self) -> None:
+        """Submit the enclosing form."""
+        form = self._node if self.tag_name == "form" else self._enclosing("form")
+        if form is not None:
+            self._driver._submit(form, None)
+
+    def _enclosing(self, tag: str) -> Node | None:
+        """Return the closest ancestor with the given tag."""
+        node = self._node.parent
+        while node is not None and node.tag != tag:
+            node = node.parent
+        return node
+
+    def _options(self) -> list[Node]:
+        """Return option nodes of a select element."""
+        return [n for n in self._node.elements() if n.tag == "option"]
+
+
+class HttpDriver:
+    """WebDriver-compatible client that fetches and parses pages over HTTP.
+
+    Uses OOP pattern as it keeps session state (cookies, current document),
+    mirroring a browser session.
+    """
+
+    def __init__(self, timeout: float = 10) -> None:
+        """Initialize HTTP session.
+
+        Args:
+            timeout: Request timeout in seconds.
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self._document = parse_html("")
+        self._history: list[str] = []
+
+    @property
+    def title(self) -> str:
+        """Document title."""
+        titles = select(self._document, By.TAG_NAME, "title")
+        if not titles:
+            return ""
+        text = "".join(c for c in titles[0].children if isinstance(c, str))
+        return " ".join(text.split())
+
+    def get(self, url: str) -> None:
+        """Load a page with HTTP GET.
+
+        Args:
+            url: Absolute URL.
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        self._load(response)
+
+    def refresh(self) -> None:
+        """Reload the current page."""
+        self.get(self.current_url)
+
+    def back(self) -> None:
+        """Navigate to the previous page in history."""
+        if len(self._history) > 1:
+            self._history.pop()
+            self.get(self._history.pop())
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> HttpElement:
+        """Find first element matching locator.
+
+        Raises:
+            NoSuchElementException: If no element matches.
+        """
+        return self._first(self._document, by, value)
+
+    def find_elements(
+        self, by: str = By.ID, value: str | None = None
+    ) -> list[HttpElement]:
+        """Find all elements matching locator."""
+        return [HttpElement(self, n) for n in select(self._document, by, value)]
+
+    def execute_script(self, script: str, *args: Any) -> None:
+        """No-op: HTTP mode has no JavaScript engine.
+
+        Returns None so optional in-page helpers (scrolling, timing probes)
+        degrade gracefully.
+        """
+        return None
+
+    def execute_async_script(self, script: str, *args: Any) -> None:
+        """No-op: HTTP mode has no JavaScript engine (see execute_script)."""
+        return None
+
+    def get_cookies(self) -> list[dict[str, Any]]:
+        """Return session cookies in WebDriver format."""
+        return [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+            for c in self.session.cookies
+        ]
+
+    def delete_all_cookies(self) -> None:
+        """Clear session cookies."""
+        self.session.cookies.clear()
+
+    def maximize_window(self) -> None:
+        """No-op for API compatibility."""
+
+    def quit(self) -> None:
+        """Close the HTTP session."""
+        self.session.close()
+
+    def _first(self, scope: Node, by: str, value: str | None) -> HttpElement:
+        """Return the first match within scope or raise NoSuchElementException."""
+        matches = select(scope, by, value or "")
+        if not matches:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return HttpElement(self, matches[0])
+
+    def _load(self, response: requests.Response) -> None:
+        """Replace the current document with a response."""
+        self.current_url = response.url
+        self.page_source = response.text
+        self._document = parse_html(response.text)
+        self._history.append(response.url)
+
+    def _submit(self, form: Node, submitter: Node | None) -> None:
+        """Submit a form with the current field values."""
+        data: dict[str, str] = {}
+        for field in form.elements():
+            name = field.attrs.get("name")
+            if not name or "disabled" in field.attrs:
+                continue
+            if field.tag == "input":
+                field_type = field.attrs.get("type", "text")
+                if field_type in ("submit", "button", "image", "reset"):
+                    continue
+                if field_type in ("checkbox", "radio") and "checked" not in field.attrs:
+                    continue
+                data[name] = field.attrs.get(
+                    "value", "on" if field_type in ("checkbox", "radio") else ""
+                )
+            elif field.tag == "select":
+                element = HttpElement(self, field)
+                data[name] = element.get_attribute("value") or ""
+            elif field.tag == "textarea":
+                data[name] = field.attrs.get("value", field.text())
+        if submitter is not None and submitter.attrs.get("name"):
+            data[submitter.attrs["name"]] = submitter.attrs.get("value", "")
+
+        action = urljoin(self.current_url, form.attrs.get("action", ""))
+        if form.attrs.get("method", "get").lower() == "post":
+            response = self.session.post(action, data=data, timeout=self.timeout)
+        else:
+            response = self.session.get(action, params=data, timeout=self.timeout)
+        self._load(response)
@@ -0,0 +1,311 @@
+"""Test impact analysis.
+
+Records which framework functions (page objects, step definitions, core
+modules) each Behave scenario and pytest test exercises, using a
+lightweight profile hook, and stores the map locally. Given a git diff,
+selects only the scenarios and tests affected by the change.
+
+The map is updated incrementally: every traced run replaces the entries of
+the tests it ran and keeps the rest.
+"""
+
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from core.file_lock import file_lock
+
+DEFAULT_MAP_PATH = ".uat_cache/impact_map.json"
+
+# Directories whose functions are traced (relative to the repo root)
+TRACED_DIRS = ("core", "pages", "features/steps")
+
+# Map sections: one per test runner
+KINDS = ("behave", "pytest")
+
+# Changed files outside traced code that still affect every test of a kind
+RUN_ALL_FILES = {
+    "behave": ("features/environment.py", "config.yaml"),
+    "pytest": ("tests/conftest.py", "tests/integration/conftest.py", "pyproject.toml"),
+}
+
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class ImpactTracer:
+    """Records the traced functions called while a test runs.
+
+    Uses OOP pattern as tracing is stateful (profile hook installed between
+    start and stop, calls accumulated per test).
+    """
+
+    def __init__(self, root: str = ".", traced_dirs: tuple = TRACED_DIRS) -> None:
+        """Initialize tracer.
+
+        Args:
+            root: Repository root; recorded paths are relative to it.
+            traced_dirs: Directories whose functions are recorded.
+        """
+        self.root = os.path.abspath(root)
+        self.traced_prefixes = tuple(
+            os.path.join(self.root, directory) + os.sep for directory in traced_dirs
+        )
+        self.entries: dict[str, dict[str, list[str]]] = {kind: {} for kind in KINDS}
+        self._calls: set[str] = set()
+        # Code object -> recorded key (None: not traced, e.g. stop() itself)
+        self._keys: dict[Any, str | None] = {ImpactTracer.stop.__code__: None}
+        self._previous_profile: Any = None
+
+    def start(self) -> None:
+        """Start recording calls for a new test."""
+        self._calls = set()
+        self._previous_profile = sys.getprofile()
+        sys.setprofile(self._profile)
+
+    def stop(self, kind: str, test_id: str) -> None:
+        """Stop recording and store the calls for a test.
+
+        Args:
+            kind: 'behave' or 'pytest'.
+            test_id: Scenario location or pytest node id.
+        """
+        sys.setprofile(self._previous_profile)
+        self.entries[kind][test_id] = sorted(self._calls)
+
+    def _profile(self, frame: Any, event: str, arg: Any) -> None:
+        """Profile hook: record traced function calls (cached per code)."""
+        if event != "call":
+            return
+        code = frame.f_code
+        key = self._keys.get(code, False)
+        if key is False:
+            key = None
+            if code.co_filename.startswith(self.traced_prefixes):
+                path = os.path.relpath(code.co_filename, self.root)
+                key = f"{Path(path).as_posix()}::{code.co_qualname}"
+            self._keys[code] = key
+        if key is not None:
+            self._calls.add(key)
+
+
+def load_impact_map(path: str = DEFAULT_MAP_PATH) -> dict[str, dict[str, list[str]]]:
+    """Load the impact map.
+
+    Args:
+        path: Map file path.
+
+    Returns:
+        Dictionary with one section per kind (empty if no map exists yet).
+    """
+    impact_map: dict[str, dict[str, list[str]]] = {kind: {} for kind in KINDS}
+    map_file = Path(path)
+    if map_file.exists():
+        impact_map.update(json.loads(map_file.read_text(encoding="utf-8")))
+    return impact_map
+
+
+def save_impact_map(
+    entries: dict[str, dict[str, list[str]]], path: str = DEFAULT_MAP_PATH
+) -> None:
+    """Merge traced entries into the stored map.
+
+    The map is re-read and replaced under an exclusive file lock (see
+    core/file_lock.py): an entry lost to a concurrent pytest-xdist worker
+    would make impact selection skip a test whose modules changed.
+
+    Args:
+        entries: Entries from ImpactTracer.entries.
+        path: Map file path.
+    """
+    map_file = Path(path)
+    with file_lock(map_file):
+        impact_map = load_impact_map(path)
+        for kind, kind_entries in entries.items():
+            impact_map.setdefault(kind, {}).update(kind_entries)
+
+        temp_file = map_file.with_suffix(f".{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps(impact_map, indent=1), encoding="utf-8")
+        os.replace(temp_file, map_file)
+
+
+def parse_diff_lines(diff_text: str) -> dict[str, set[int]]:
+    """Extract changed line numbers (new file side) from a unified diff.
+
+    Pure deletions are recorded as the line where the deletion happened.
+
+    Args:
+        diff_text: Output of ``git diff -U0``.
+
+    Returns:
+        Mapping of file path to changed line numbers.
+
+    Examples:
+        >>> diff = "+++ b/pages/a.py\\n@@ -10,2 +10,3 @@\\n"
+        >>> parse_diff_lines(diff)
+        {'pages/a.py': {10, 11, 12}}
+    """
+    changes: dict[str, set[int]] = {}
+    current = None
+    for line in diff_text.splitlines():
+        if line.startswith("+++ "):
+            target = line[4:]
+            current = None if target == "/dev/null" else target.removeprefix("b/")
+            if current is not None:
+                changes.setdefault(current, set())
+            continue
+        match = _HUNK.match(line)
+        if match and current is not None:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            changes[current].update(range(start, start + max(count, 1)))
+    return changes
+
+
+def changed_functions(source: str, lines: set[int]) -> set[str] | None:
+    """Map changed lines to the qualified names of enclosing functions.
+
+    Args:
+        source: New content of a Python file.
+        lines: Changed line numbers.
+
+    Returns:
+        Set of qualified names (as in code.co_qualname), or None when a
+        change touches module or class level code (whole file affected).
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    spans: list[tuple[int, int, str]] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = f"{prefix}{child.name}"
+                start = min([d.lineno for d in child.decorator_list] + [child.lineno])
+                spans.append((start, child.end_lineno, qualname))
+                visit(child, f"{qualname}.<locals>.")
+            elif isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+
+    functions = set()
+    for line in lines:
+        enclosing = [s for s in spans if s[0] <= line <= s[1]]
+        if not enclosing:
+            return None
+        # Innermost function (latest start) owns the line
+        functions.add(max(enclosing)[2])
+    return functions
+
+
+def git_changes(base: str = "HEAD", root: str = ".") -> dict[str, set[str] | None]:
+    """Collect changes against a git revision (working tree included).
+
+    Args:
+        base: Revision to diff against (e.g., 'origin/master').
+        root: Repository root.
+
+    Returns:
+        Mapping of changed file to changed function names, or None for
+        whole-file changes (non-Python, module-level, deleted or untracked).
+    """
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+
+    changes: dict[str, set[str] | None] = {}
+    names = git("diff", "--name-only", base).splitlines()
+    diff_lines = parse_diff_lines(git("diff", "-U0", base))
+    for name in names:
+        file_path = Path(root) / name
+        if name.endswith(".py") and name in diff_lines and file_path.exists():
+            source = file_path.read_text(encoding="utf-8")
+            changes[name] = changed_functions(source, diff_lines[name])
+        else:
+            changes[name] = None
+    for name in git("ls-files", "--others", "--exclude-standard").splitlines():
+        changes[name] = None
+    return changes
+
+
+def _is_traced(path: str) -> bool:
+    """Check if a file is covered by tracing."""
+    return path.endswith(".py") and any(
+        path.startswith(f"{directory}/") for directory in TRACED_DIRS
+    )
+
+
+def select_impacted(
+    impact_map: dict[str, dict[str, list[str]]],
+    changes: dict[str, set[str] | None],
+) -> dict[str, Any]:
+    """Select the scenarios and tests affected by a change.
+
+    Rules:
+        - Traced code (core/, pages/, features/steps/): tests that called a
+          changed function (any function of the file for whole-file changes).
+        - .feature files: the whole feature (recorded line numbers may be
+          stale and added scenarios are not recorded yet).
+        - tests/test_*.py: the whole test module, for the same reason.
+        - Untraced files in RUN_ALL_FILES: everything of that kind.
+
+    Args:
+        impact_map: Map from load_impact_map.
+        changes: Changes from git_changes.
+
+    Returns:
+        Dictionary with 'behave' and 'pytest' selections (sorted ids) and
+        'run_all' listing kinds that must run completely.
+    """
+    selected: dict[str, set[str]] = {kind: set() for kind in KINDS}
+    run_all = {
+        kind
+        for kind, files in RUN_ALL_FILES.items()
+        if any(f in changes for f in files)
+    }
+
+    for path, functions in changes.items():
+        if _is_traced(path):
+            keys = None if functions is None else {f"{path}::{f}" for f in functions}
+            for kind in KINDS:
+                for test_id, calls in impact_map.get(kind, {}).items():
+                    hit = (
+                        any(c.startswith(f"{path}::") for c in calls)
+                        if keys is None
+                        else not keys.isdisjoint(calls)
+                    )
+                    if hit:
+                        selected[kind].add(test_id)
+        elif path.endswith(".feature"):
+            # Recorded line numbers are stale after an edit and new
+            # scenarios have none: select the whole feature
+            selected["behave"].add(path)
+        elif path.startswith("tests/") and Path(path).name.startswith("test_"):
+            selected["pytest"].add(path)
+
+    # Ids inside a file that is selected whole would run twice
+    for kind, separator in (("behave", ":"), ("pytest", "::")):
+        selected[kind] = {
+            test_id
+            for test_id in selected[kind]
+            if separator not in test_id
+            or test_id.split(separator, 1)[0] not in selected[kind]
+        }
+
+    return {
+        "behave": sorted(selected["behave"]),
+        "pytest": sorted(selected["pytest"]),
+        "run_all": sorted(run_all),
+    }
@@ -0,0 +1,313 @@
+"""Load generation module.
+
+Turns Behave user journeys into the sequence of page paths each scenario
+visits and requests those paths with lightweight HTTP-level virtual users,
+while a small pool of real browsers runs the same scenarios end to end.
+Reports throughput, latency percentiles and error rates.
+
+The virtual users only GET the page paths: the application renders in the
+browser, so login, cart and checkout actions are not replayed over HTTP
+(the browser samples are the only full journeys). HTTP load measures how
+the server serves the pages and assets of the journeys.
+
+Load is only sent to local hosts unless remote targets are allowed
+explicitly (see check_load_target), so a default run never floods a
+third-party site.
+"""
+
+import ipaddress
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from core.feature_cache import load_feature
+from core.performance import percentile, summarize
+from core.runner import RUNNER_CLASS_NAME
+
+
+def check_load_target(base_url: str, allow_remote: bool = False) -> None:
+    """Refuse to send load to a non-local host unless explicitly allowed.
+
+    Args:
+        base_url: Target base URL.
+        allow_remote: Allow hosts other than localhost/loopback addresses.
+
+    Raises:
+        ValueError: If the host is remote and allow_remote is False.
+
+    Examples:
+        >>> check_load_target("http://localhost:8000")
+        >>> check_load_target("http://127.0.0.1:3000/app")
+        >>> check_load_target("https://www.saucedemo.com", allow_remote=True)
+        >>> check_load_target("https://www.saucedemo.com")
+        Traceback (most recent call last):
+        ...
+        ValueError: Refusing to send load to remote host www.saucedemo.com (use --allow-remote for a host you own)
+    """
+    host = urlsplit(base_url).hostname or ""
+    if allow_remote or host == "localhost" or host.endswith(".localhost"):
+        return
+    try:
+        if ipaddress.ip_address(host).is_loopback:
+            return
+    except ValueError:
+        pass
+    raise ValueError(
+        f"Refusing to send load to remote host {host} "
+        "(use --allow-remote for a host you own)"
+    )
+
+
+def step_route(step_text: str, route_rules: list[tuple[str, str]]) -> str | None:
+    """Map a Gherkin step to the URL path it lands on.
+
+    Args:
+        step_text: Step text without keyword.
+        route_rules: Ordered (regex, path) pairs; the first match wins.
+
+    Returns:
+        URL path, or None if the step does not navigate.
+
+    Examples:
+        >>> step_route("I click the shopping cart icon", [("cart", "/cart.html")])
+        '/cart.html'
+        >>> step_route("the cart should have 1 item", [("^I click", "/x")]) is None
+        True
+    """
+    for pattern, path in route_rules:
+        if re.search(pattern, step_text, re.IGNORECASE):
+            return path
+    return None
+
+
+def build_journeys(
+    feature_paths: list[str], route_rules: list[tuple[str, str]]
+) -> list[dict[str, Any]]:
+    """Convert feature scenarios into HTTP journeys.
+
+    Scenario outlines are expanded and background steps included, so each
+    journey mirrors what Behave would execute.
+
+    Args:
+        feature_paths: Paths to .feature files.
+        route_rules: Ordered (regex, path) pairs passed to step_route.
+
+    Returns:
+        List of journeys with feature, name and ordered URL paths (repeated
+        consecutive paths collapsed).
+    """
+    journeys = []
+    for feature_path in feature_paths:
+        feature = load_feature(feature_path)
+        for scenario in feature.walk_scenarios():
+            paths: list[str] = []
+            for step in scenario.all_steps:
+                path = step_route(step.name, route_rules)
+                if path is not None and (not paths or paths[-1] != path):
+                    paths.append(path)
+            if paths:
+                journeys.append(
+                    {"feature": feature_path, "name": scenario.name, "paths": paths}
+                )
+    return journeys
+
+
+def run_virtual_user(
+    base_url: str,
+    journeys: list[dict[str, Any]],
+    user_index: int,
+    iterations: int,
+    timeout: float,
+) -> list[dict[str, Any]]:
+    """Request the page paths of journeys as a single virtual user.
+
+    Each virtual user keeps its own session (cookies, connection pool) and
+    starts at a different journey so load is spread across scenarios. Only
+    the paths are requested (GET); the journey's actions are not performed.
+
+    Args:
+        base_url: Target base URL.
+        journeys: Journeys from build_journeys.
+        user_index: Virtual user number (used to stagger journeys).
+        iterations: Number of journeys to replay.
+        timeout: Per-request timeout in seconds.
+
+    Returns:
+        One sample per request with journey, path, status, ok, latency_ms
+        and error.
+    """
+    samples = []
+    with requests.Session() as session:
+        for iteration in range(iterations):
+            journey = journeys[(user_index + iteration) % len(journeys)]
+            for path in journey["paths"]:
+                start = time.perf_counter()
+                status, error = 0, None
+                try:
+                    response = session.get(f"{base_url}{path}", timeout=timeout)
+                    status = response.status_code
+                except requests.RequestException as exc:
+                    error = type(exc).__name__
+                samples.append(
+                    {
+                        "journey": journey["name"],
+                        "path": path,
+                        "status": status,
+                        "ok": error is None and status < 400,
+                        "latency_ms": (time.perf_counter() - start) * 1000,
+                        "error": error,
+                    }
+                )
+    return samples
+
+
+def run_http_load(
+    base_url: str,
+    journeys: list[dict[str, Any]],
+    users: int,
+    iterations: int,
+    timeout: float = 10,
+) -> dict[str, Any]:
+    """Request journey page paths with concurrent HTTP virtual users.
+
+    Args:
+        base_url: Target base URL.
+        journeys: Journeys from build_journeys.
+        users: Number of concurrent virtual users.
+        iterations: Journeys replayed per virtual user.
+        timeout: Per-request timeout in seconds.
+
+    Returns:
+        Summary from summarize_load.
+
+    Raises:
+        ValueError: If there are no journeys to replay.
+    """
+    if not journeys:
+        raise ValueError("No journeys to replay (check feature paths/route rules)")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        futures = [
+            executor.submit(
+                run_virtual_user, base_url, journeys, index, iterations, timeout
+            )
+            for index in range(users)
+        ]
+        samples = [sample for future in futures for sample in future.result()]
+    elapsed_s = time.perf_counter() - start
+
+    return summarize_load(samples, elapsed_s)
+
+
+def summarize_load(samples: list[dict[str, Any]], elapsed_s: float) -> dict[str, Any]:
+    """Aggregate request samples into throughput, latency and error rates.
+
+    Args:
+        samples: Samples from run_virtual_user.
+        elapsed_s: Wall-clock duration of the load run.
+
+    Returns:
+        Dictionary with overall totals and a per-path breakdown.
+    """
+
+    def _stats(group: list[dict[str, Any]]) -> dict[str, Any]:
+        latencies = [s["latency_ms"] for s in group]
+        errors = sum(1 for s in group if not s["ok"])
+        latency = summarize(latencies)
+        latency["p99"] = round(percentile(latencies, 99), 2)
+        return {
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4) if group else 0.0,
+            "latency_ms": latency,
+        }
+
+    by_path: dict[str, list[dict[str, Any]]] = {}
+    for sample in samples:
+        by_path.setdefault(sample["path"], []).append(sample)
+
+    summary = _stats(samples)
+    summary["elapsed_s"] = round(elapsed_s, 3)
+    summary["throughput_rps"] = (
+        round(len(samples) / elapsed_s, 2) if elapsed_s > 0 else 0.0
+    )
+    summary["paths"] = {path: _stats(group) for path, group in sorted(by_path.items())}
+    return summary
+
+
+def run_browser_sample(feature_path: str, scenario_name: str, base_url: str) -> dict:
+    """Run one scenario end-to-end in a real browser via Behave.
+
+    Args:
+        feature_path: Feature file containing the scenario.
+        scenario_name: Exact scenario name.
+        base_url: Target base URL (passed as -Dbase_url).
+
+    Returns:
+        Sample with scenario, ok and duration_s.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "behave",
+            feature_path,
+            f"--runner={RUNNER_CLASS_NAME}",
+            "--name",
+            f"^{re.escape(scenario_name)}$",
+            f"-Dbase_url={base_url}",
+            "--format",
+            "null",
+            "--no-summary",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return {
+        "scenario": scenario_name,
+        "ok": result.returncode == 0,
+        "duration_s": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_browser_samples(
+    journeys: list[dict[str, Any]], base_url: str, samples: int, pool_size: int
+) -> dict[str, Any]:
+    """Sample journeys in a small pool of real browsers.
+
+    Args:
+        journeys: Journeys from build_journeys.
+        base_url: Target base URL.
+        samples: Runs per journey.
+        pool_size: Maximum concurrent browsers.
+
+    Returns:
+        Dictionary with runs, failures and duration percentiles (seconds).
+    """
+    tasks = [journey for journey in journeys for _ in range(samples)]
+    if not tasks:
+        return {"runs": 0, "failures": 0, "duration_s": summarize([])}
+
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        results = list(
+            executor.map(
+                lambda j: run_browser_sample(j["feature"], j["name"], base_url),
+                tasks,
+            )
+        )
+
+    return {
+        "runs": len(results),
+        "failures": sum(1 for r in results if not r["ok"]),
+        "duration_s": summarize([r["duration_s"] for r in results]),
+        "results": results,
+    }
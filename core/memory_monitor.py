@@ -0,0 +1,207 @@
+"""Browser memory monitoring per scenario.
+
+Records the resident memory of the browser process tree (driver, browser,
+renderers) and the JavaScript heap of the scenario's page before and after
+each scenario. A long-lived browser (shared by user contexts) whose
+memory crosses a threshold is recycled: quit and started again for the
+next scenario.
+
+The per-scenario report lists memory growth so that leaking scenarios
+stand out, and how often the browser was recycled, to tune thresholds for
+the most reuse without bloat.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Used JS heap of the page in bytes (performance.memory: Chromium only)
+JS_HEAP_SCRIPT = """
+return performance.memory ? performance.memory.usedJSHeapSize : null;
+"""
+
+# Scenarios listed as leak suspects in the summary
+LEAK_SUSPECTS = 5
+
+
+def read_js_heap_mb(driver: WebDriver) -> float | None:
+    """Read the used JavaScript heap of the current page.
+
+    Args:
+        driver: WebDriver instance on the page.
+
+    Returns:
+        Heap size in MB, or None if the browser does not report it.
+    """
+    try:
+        used = driver.execute_script(JS_HEAP_SCRIPT)
+    except WebDriverException:
+        return None
+    if not isinstance(used, (int, float)):
+        return None
+    return round(used / (1024 * 1024), 1)
+
+
+def growth(before: dict[str, Any], after: dict[str, Any], key: str) -> float | None:
+    """Compute how much a memory measurement grew during a scenario.
+
+    Args:
+        before: Measurement at scenario start.
+        after: Measurement at scenario end.
+        key: 'rss_mb' or 'js_heap_mb'.
+
+    Returns:
+        Growth in MB (negative if freed), or None if either is unknown.
+
+    Examples:
+        >>> growth({"rss_mb": 400.0}, {"rss_mb": 650.5}, "rss_mb")
+        250.5
+        >>> growth({"rss_mb": None}, {"rss_mb": 650.5}, "rss_mb") is None
+        True
+    """
+    if before.get(key) is None or after.get(key) is None:
+        return None
+    return round(after[key] - before[key], 1)
+
+
+class MemoryMonitor:
+    """Collects per-scenario browser memory and decides browser recycling.
+
+    Uses OOP pattern as measurements accumulate across scenarios until the
+    report is written at the end of the run.
+    """
+
+    def __init__(self, recycle_rss_mb: float = 0, recycle_heap_mb: float = 0) -> None:
+        """Initialize monitor.
+
+        Args:
+            recycle_rss_mb: Browser process tree RSS that triggers a
+                recycle (0 = never).
+            recycle_heap_mb: Page JS heap that triggers a recycle (0 = never).
+        """
+        self.recycle_rss_mb = recycle_rss_mb
+        self.recycle_heap_mb = recycle_heap_mb
+        self.scenarios: list[dict[str, Any]] = []
+        self._current: dict[str, Any] | None = None
+
+    def start_scenario(self, name: str, memory: dict[str, Any]) -> None:
+        """Record memory at scenario start.
+
+        Args:
+            name: Scenario name.
+            memory: 'rss_mb' and 'js_heap_mb' (see DriverManager.memory_usage).
+        """
+        self._current = {"name": name, "before": memory}
+
+    def end_scenario(self, status: str, memory: dict[str, Any]) -> str | None:
+        """Record memory at scenario end and decide on recycling.
+
+        Args:
+            status: Scenario status (passed, failed, ...).
+            memory: 'rss_mb' and 'js_heap_mb' after the scenario.
+
+        Returns:
+            Reason to recycle the browser, or None to keep it.
+        """
+        if self._current is None:
+            return None
+
+        before = self._current["before"]
+        reason = self.recycle_reason(memory)
+        self._current.update(
+            {
+                "status": status,
+                "after": memory,
+                "rss_growth_mb": growth(before, memory, "rss_mb"),
+                "js_heap_growth_mb": growth(before, memory, "js_heap_mb"),
+                "recycled": reason,
+            }
+        )
+        self.scenarios.append(self._current)
+        self._current = None
+        return reason
+
+    def recycle_reason(self, memory: dict[str, Any]) -> str | None:
+        """Check memory against the recycle thresholds.
+
+        Args:
+            memory: 'rss_mb' and 'js_heap_mb' measurement.
+
+        Returns:
+            Threshold crossed (e.g., 'rss 2100 MB > 2048 MB'), or None.
+
+        Examples:
+            >>> monitor = MemoryMonitor(recycle_rss_mb=2048)
+            >>> monitor.recycle_reason({"rss_mb": 2100.0, "js_heap_mb": 80.0})
+            'rss 2100 MB > 2048 MB'
+            >>> monitor.recycle_reason({"rss_mb": None, "js_heap_mb": None}) is None
+            True
+        """
+        for key, label, limit in (
+            ("rss_mb", "rss", self.recycle_rss_mb),
+            ("js_heap_mb", "js heap", self.recycle_heap_mb),
+        ):
+            value = memory.get(key)
+            if limit and value is not None and value > limit:
+                return f"{label} {value:.0f} MB > {limit:.0f} MB"
+        return None
+
+    def leak_suspects(self, limit: int = LEAK_SUSPECTS) -> list[dict[str, Any]]:
+        """List the scenarios whose browser memory grew the most.
+
+        Args:
+            limit: Maximum scenarios listed.
+
+        Returns:
+            Scenario entries with positive RSS growth, largest first.
+        """
+        grown = [
+            scenario
+            for scenario in self.scenarios
+            if (scenario["rss_growth_mb"] or 0) > 0
+        ]
+        return sorted(grown, key=lambda s: s["rss_growth_mb"], reverse=True)[:limit]
+
+    def summary_lines(self) -> list[str]:
+        """Format the leak suspects and recycles for the console.
+
+        Returns:
+            One line per suspect and recycle (empty if nothing to report).
+        """
+        lines = [
+            f"[memory] {scenario['name']}: browser RSS +{scenario['rss_growth_mb']} MB"
+            for scenario in self.leak_suspects()
+        ]
+        recycled = [s for s in self.scenarios if s["recycled"]]
+        for scenario in recycled:
+            lines.append(
+                f"[memory] browser recycled after {scenario['name']}: "
+                f"{scenario['recycled']}"
+            )
+        return lines
+
+    def write_report(self, report_path: str) -> Path:
+        """Write the per-scenario memory report as JSON.
+
+        Args:
+            report_path: Destination file path (parent dirs are created).
+
+        Returns:
+            Path of the written report.
+        """
+        path = Path(report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "thresholds": {
+                "recycle_rss_mb": self.recycle_rss_mb,
+                "recycle_heap_mb": self.recycle_heap_mb,
+            },
+            "recycles": sum(1 for s in self.scenarios if s["recycled"]),
+            "leak_suspects": [s["name"] for s in self.leak_suspects()],
+            "scenarios": self.scenarios,
+        }
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return path
@@ -0,0 +1,332 @@
+"""Navigation performance metrics module.
+
+Collects PerformanceNavigationTiming and resource timings from the browser
+in a single script call and aggregates them per page object into p50/p95
+tables written as a machine-readable JSON report. Also provides in-page
+probes that time clicks and client-side route changes for budget assertions.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Reads the navigation entry and all resource entries buffered since the
+# previous call, then clears the resource buffer so each call only returns
+# new requests (and the browser's 250-entry buffer never overflows).
+NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource').map(r => ({
+    name: r.name,
+    initiator_type: r.initiatorType,
+    start_ms: r.startTime,
+    duration_ms: r.duration,
+    transfer_size: r.transferSize || 0
+}));
+performance.clearResourceTimings();
+return {
+    path: location.pathname,
+    time_origin: performance.timeOrigin,
+    navigation: nav ? {
+        dns_ms: nav.domainLookupEnd - nav.domainLookupStart,
+        connect_ms: nav.connectEnd - nav.connectStart,
+        ttfb_ms: nav.responseStart - nav.requestStart,
+        response_ms: nav.responseEnd - nav.responseStart,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+        load_ms: nav.loadEventEnd - nav.startTime,
+        duration_ms: nav.duration
+    } : null,
+    resources: resources
+};
+"""
+
+# Installs (once per document) in-page listeners that timestamp user
+# interactions and client-side route changes with the high-resolution
+# performance clock. Clicks are stamped with event.timeStamp (captured before
+# the app's handlers run); a MutationObserver stamps the DOM updates that
+# follow, so durations exclude WebDriver round-trips entirely.
+INTERACTION_PROBE_SCRIPT = """
+if (window.__uatPerf) { return false; }
+const state = window.__uatPerf = {interaction: null, routes: {}};
+document.addEventListener('click', function (event) {
+    state.interaction = {start: event.timeStamp, first: null, last: null};
+}, true);
+new MutationObserver(function () {
+    const now = performance.now();
+    const interaction = state.interaction;
+    if (interaction) {
+        if (interaction.first === null) { interaction.first = now; }
+        interaction.last = now;
+    }
+    const route = state.routes[location.pathname];
+    if (route && route.interaction === state.interaction) { route.end = now; }
+}).observe(document, {childList: true, subtree: true, characterData: true});
+const pushState = history.pushState;
+history.pushState = function () {
+    const start = state.interaction ? state.interaction.start : performance.now();
+    const result = pushState.apply(this, arguments);
+    state.routes[location.pathname] = {
+        start: start, end: null, interaction: state.interaction
+    };
+    return result;
+};
+return true;
+"""
+
+# Returns how long a page took to render, in milliseconds: client-side
+# routes use the probe (triggering click -> last DOM update before the next
+# click),
+# full document loads use the PerformanceNavigationTiming entry.
+PAGE_LOAD_SCRIPT = """
+const path = arguments[0];
+const state = window.__uatPerf;
+if (state && state.routes[path] && state.routes[path].end !== null) {
+    return state.routes[path].end - state.routes[path].start;
+}
+const nav = performance.getEntriesByType('navigation')[0];
+if (nav && nav.loadEventEnd > 0 && new URL(nav.name).pathname === path) {
+    return nav.loadEventEnd - nav.startTime;
+}
+return null;
+"""
+
+# Returns the time from the last click to the first DOM update it caused.
+INTERACTION_RESPONSE_SCRIPT = """
+const state = window.__uatPerf;
+if (!state || !state.interaction || state.interaction.first === null) {
+    return null;
+}
+return state.interaction.first - state.interaction.start;
+"""
+
+NAVIGATION_METRICS = (
+    "dns_ms",
+    "connect_ms",
+    "ttfb_ms",
+    "response_ms",
+    "dom_content_loaded_ms",
+    "load_ms",
+    "duration_ms",
+)
+
+
+def collect_navigation_timing(driver: WebDriver) -> dict[str, Any]:
+    """Collect navigation and resource timings in one WebDriver round-trip.
+
+    Args:
+        driver: WebDriver instance on the page to measure.
+
+    Returns:
+        Dictionary with path, time_origin, navigation metrics (or None when
+        the document has not finished loading) and new resource entries.
+    """
+    return driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+
+
+def install_interaction_probe(driver: WebDriver) -> bool:
+    """Install in-page interaction/route timing listeners.
+
+    Idempotent per document; must be re-installed after full page loads.
+
+    Args:
+        driver: WebDriver instance.
+
+    Returns:
+        True if the probe was installed, False if already present.
+    """
+    return driver.execute_script(INTERACTION_PROBE_SCRIPT)
+
+
+def read_page_load_ms(driver: WebDriver, path: str) -> float | None:
+    """Read in-browser load time of a page.
+
+    Args:
+        driver: WebDriver instance.
+        path: URL path of the page (page object PAGE_PATH).
+
+    Returns:
+        Load time in milliseconds, or None if no timing is available yet.
+    """
+    return driver.execute_script(PAGE_LOAD_SCRIPT, path)
+
+
+def read_interaction_response_ms(driver: WebDriver) -> float | None:
+    """Read in-browser response time of the last click.
+
+    Args:
+        driver: WebDriver instance.
+
+    Returns:
+        Milliseconds from click to first DOM update, or None if unavailable.
+    """
+    return driver.execute_script(INTERACTION_RESPONSE_SCRIPT)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Calculate a percentile using linear interpolation.
+
+    Args:
+        values: Sample values (any order).
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        Interpolated percentile value, 0.0 for an empty sample.
+
+    Examples:
+        >>> percentile([10, 20, 30, 40], 50)
+        25.0
+        >>> percentile([10, 20, 30, 40], 95)
+        38.5
+        >>> percentile([], 95)
+        0.0
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower))
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize samples into count/p50/p95/max.
+
+    Args:
+        samples: Sample values in milliseconds.
+
+    Returns:
+        Dictionary with count, p50, p95 and max.
+    """
+    return {
+        "count": len(samples),
+        "p50": round(percentile(samples, 50), 2),
+        "p95": round(percentile(samples, 95), 2),
+        "max": round(max(samples), 2) if samples else 0.0,
+    }
+
+
+class PerformanceRecorder:
+    """Aggregates navigation timings per page object across a test run.
+
+    Uses OOP pattern as samples accumulate across scenarios until the
+    report is written at the end of the run.
+    """
+
+    def __init__(self, page_names: dict[str, str] | None = None) -> None:
+        """Initialize empty recorder.
+
+        Args:
+            page_names: Mapping of URL path to page object name used to
+                attribute samples (e.g., '/cart.html' -> 'CartPage'). Unknown
+                paths are reported under the path itself.
+        """
+        self.page_names = page_names or {}
+        self._samples: dict[str, dict[str, list[float]]] = {}
+        self._seen_documents: set[float] = set()
+        self.scenarios: list[dict[str, Any]] = []
+        self._current: dict[str, Any] | None = None
+
+    def page_name(self, path: str) -> str:
+        """Resolve the page object name for a URL path.
+
+        Args:
+            path: URL path (location.pathname).
+
+        Returns:
+            Page object name, or the path itself when unknown.
+        """
+        return self.page_names.get(path, path)
+
+    def start_scenario(self, name: str) -> None:
+        """Begin attributing samples to a scenario.
+
+        Args:
+            name: Scenario name.
+        """
+        self._current = {"name": name, "navigations": [], "resource_count": 0}
+
+    def end_scenario(self, status: str, duration_s: float) -> None:
+        """Close the current scenario with its outcome and wall-clock time.
+
+        Comparing duration_s (framework + app) with the summed in-browser
+        navigation time tells whether a slow scenario is the app's fault.
+
+        Args:
+            status: Scenario status (passed, failed, skipped).
+            duration_s: Scenario wall-clock duration in seconds.
+        """
+        if self._current is None:
+            return
+
+        browser_ms = sum(n["duration_ms"] for n in self._current["navigations"])
+        self._current.update(
+            {
+                "status": status,
+                "duration_s": round(duration_s, 3),
+                "browser_navigation_ms": round(browser_ms, 2),
+            }
+        )
+        self.scenarios.append(self._current)
+        self._current = None
+
+    def record(self, timing: dict[str, Any]) -> None:
+        """Record a timing payload returned by collect_navigation_timing.
+
+        Each document's navigation entry is recorded only once, even when
+        the same page is measured after several steps.
+
+        Args:
+            timing: Payload from collect_navigation_timing.
+        """
+        page = self.page_name(timing.get("path", ""))
+        samples = self._samples.setdefault(page, {})
+
+        navigation = timing.get("navigation")
+        time_origin = timing.get("time_origin")
+        if (
+            navigation
+            and navigation.get("load_ms", 0) > 0
+            and time_origin not in self._seen_documents
+        ):
+            self._seen_documents.add(time_origin)
+            for metric in NAVIGATION_METRICS:
+                samples.setdefault(metric, []).append(navigation[metric])
+            if self._current is not None:
+                self._current["navigations"].append(
+                    {"page": page, "duration_ms": navigation["duration_ms"]}
+                )
+
+        resources = timing.get("resources") or []
+        for resource in resources:
+            samples.setdefault("resource_ms", []).append(resource["duration_ms"])
+        if self._current is not None:
+            self._current["resource_count"] += len(resources)
+
+    def summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Aggregate recorded samples into p50/p95 tables per page object.
+
+        Returns:
+            Mapping of page name -> metric -> {count, p50, p95, max}.
+        """
+        return {
+            page: {metric: summarize(values) for metric, values in metrics.items()}
+            for page, metrics in sorted(self._samples.items())
+        }
+
+    def write_report(self, report_path: str) -> Path:
+        """Write the aggregated report as JSON.
+
+        Args:
+            report_path: Destination file path (parent dirs are created).
+
+        Returns:
+            Path of the written report.
+        """
+        path = Path(report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"pages": self.summary(), "scenarios": self.scenarios}
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return path
@@ -0,0 +1,323 @@
+"""Browser resource governor for parallel runs.
+
+A real browser per worker costs hundreds of MB of RAM and a share of a
+CPU core. Starting more browsers than the machine holds makes the kernel
+kill renderers (and Chrome fall back from /dev/shm to /tmp), which shows
+up as flaky "session lost" failures instead of a slower run.
+
+The governor measures the resident memory and CPU use of the first
+browsers of a run (the driver service process and all of its children)
+and keeps the recent measurements in a local footprint file. From the
+footprint, available memory and CPU cores it:
+
+- sizes the worker count (``pytest -n auto``, see tests/conftest.py);
+- holds back a worker about to start a browser while memory is short
+  (wait_for_memory), so the effective concurrency shrinks under pressure
+  and grows back as memory is freed.
+
+Memory and CPU use are read from /proc (Linux, as on CI agents); where it
+is unavailable only the core count limits the workers.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from core.file_lock import file_lock
+
+DEFAULT_FOOTPRINT_PATH = ".uat_cache/browser_footprint.json"
+
+# Assumed footprint of one browser before any measurement
+DEFAULT_BROWSER_RSS_MB = 600.0
+DEFAULT_BROWSER_CPU = 0.5
+
+# Memory left free for the OS, test runner and page spikes
+DEFAULT_RESERVE_MB = 1024.0
+
+# Browsers measured per run, and measurements kept across runs
+DEFAULT_SAMPLE_BROWSERS = 5
+FOOTPRINT_WINDOW = 20
+
+# Max seconds a worker waits for memory before starting a browser anyway
+DEFAULT_ADMISSION_TIMEOUT = 120.0
+
+PROC = Path("/proc")
+
+
+def available_memory_mb() -> float | None:
+    """Read the memory available for new processes (MemAvailable).
+
+    Returns:
+        Available memory in MB, or None without /proc/meminfo.
+    """
+    try:
+        meminfo = (PROC / "meminfo").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in meminfo.splitlines():
+        if line.startswith("MemAvailable:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+def cpu_cores() -> int:
+    """Count the CPU cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _proc_stat(pid: int) -> list[str] | None:
+    """Read /proc/<pid>/stat fields after the command name, or None."""
+    try:
+        stat = (PROC / str(pid) / "stat").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    # The command name is in parentheses and may contain spaces
+    return stat[stat.rindex(")") + 2 :].split()
+
+
+def process_tree(pid: int) -> list[int]:
+    """List a process and all of its descendants.
+
+    Args:
+        pid: Root process id.
+
+    Returns:
+        Process ids, root first (empty if the root is gone).
+    """
+    children: dict[int, list[int]] = {}
+    for entry in PROC.iterdir():
+        if entry.name.isdigit():
+            fields = _proc_stat(int(entry.name))
+            if fields is not None:
+                children.setdefault(int(fields[1]), []).append(int(entry.name))
+
+    tree = [pid] if _proc_stat(pid) is not None else []
+    for parent in tree:
+        tree.extend(children.get(parent, []))
+    return tree
+
+
+def tree_usage(pid: int) -> dict[str, float] | None:
+    """Measure the memory and CPU use of a process tree.
+
+    Args:
+        pid: Root process id (e.g., the chromedriver/geckodriver service).
+
+    Returns:
+        'rss_mb' (resident memory of the tree) and 'cpu' (cores used on
+        average since the root started), or None if the root is gone.
+    """
+    tree = process_tree(pid)
+    if not tree:
+        return None
+
+    ticks = os.sysconf("SC_CLK_TCK")
+    page_mb = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    rss_pages = cpu_ticks = 0
+    for process in tree:
+        fields = _proc_stat(process)
+        if fields is None:
+            continue
+        # utime, stime, cutime, cstime (exited children included) and rss
+        cpu_ticks += sum(int(value) for value in fields[11:15])
+        rss_pages += int(fields[21])
+
+    root = _proc_stat(pid)
+    uptime = float((PROC / "uptime").read_text(encoding="utf-8").split()[0])
+    age = uptime - int(root[19]) / ticks if root else 0.0
+    return {
+        "rss_mb": round(rss_pages * page_mb, 1),
+        "cpu": round(cpu_ticks / ticks / age, 3) if age > 0 else 0.0,
+    }
+
+
+class ResourceGovernor:
+    """Sizes browser concurrency from measured footprints and free resources.
+
+    Uses OOP pattern as footprint samples are state loaded once per run,
+    extended while browsers run and merged back on save.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_FOOTPRINT_PATH,
+        reserve_mb: float = DEFAULT_RESERVE_MB,
+        max_workers: int = 0,
+        sample_browsers: int = DEFAULT_SAMPLE_BROWSERS,
+        window: int = FOOTPRINT_WINDOW,
+        admission_timeout: float = DEFAULT_ADMISSION_TIMEOUT,
+    ) -> None:
+        """Initialize governor.
+
+        Args:
+            path: Footprint file path.
+            reserve_mb: Memory kept free besides the browsers.
+            max_workers: Upper bound of workers (0 = memory and cores only).
+            sample_browsers: Browsers measured per run.
+            window: Recent measurements kept across runs.
+            admission_timeout: Max seconds wait_for_memory waits.
+        """
+        self.path = Path(path)
+        self.reserve_mb = reserve_mb
+        self.max_workers = max_workers
+        self.sample_browsers = sample_browsers
+        self.window = window
+        self.admission_timeout = admission_timeout
+        self.samples = self._load()
+        self._new_samples: list[dict[str, float]] = []
+
+    @property
+    def sampling(self) -> bool:
+        """Check if this run still measures browsers."""
+        return len(self._new_samples) < self.sample_browsers
+
+    def footprint(self) -> dict[str, float]:
+        """Get the per-browser footprint used for sizing.
+
+        The largest recent measurement is used (not the average): the
+        cost of underestimating is an out-of-memory crash.
+
+        Returns:
+            'rss_mb' and 'cpu' of one browser.
+        """
+        samples = (self.samples + self._new_samples)[-self.window :]
+        if not samples:
+            return {"rss_mb": DEFAULT_BROWSER_RSS_MB, "cpu": DEFAULT_BROWSER_CPU}
+        return {
+            "rss_mb": max(sample["rss_mb"] for sample in samples),
+            # A worker always needs some CPU besides its browser
+            "cpu": max(0.1, max(sample["cpu"] for sample in samples)),
+        }
+
+    def worker_limit(
+        self, available_mb: float | None = None, cores: int | None = None
+    ) -> int:
+        """Compute how many browsers can run at once.
+
+        Args:
+            available_mb: Available memory (default: read from /proc).
+            cores: CPU cores (default: cores of this process).
+
+        Returns:
+            Worker count, at least 1.
+
+        Examples:
+            >>> governor = ResourceGovernor("/nonexistent/footprint.json")
+            >>> governor.samples = [{"rss_mb": 700.0, "cpu": 0.4}]
+            >>> governor.worker_limit(available_mb=6000, cores=8)  # memory bound
+            7
+            >>> governor.worker_limit(available_mb=32000, cores=2)  # CPU bound
+            5
+            >>> governor.worker_limit(available_mb=500, cores=8)
+            1
+        """
+        if available_mb is None:
+            available_mb = available_memory_mb()
+        if cores is None:
+            cores = cpu_cores()
+
+        footprint = self.footprint()
+        limits = [int(cores / footprint["cpu"])]
+        if available_mb is not None:
+            limits.append(int((available_mb - self.reserve_mb) // footprint["rss_mb"]))
+        if self.max_workers:
+            limits.append(self.max_workers)
+        return max(1, min(limits))
+
+    def wait_for_memory(self, poll: float = 1.0) -> float:
+        """Wait until one more browser fits in available memory.
+
+        Called before starting a browser: while other workers' browsers
+        hold the memory this worker pauses instead of pushing the machine
+        into swapping or out-of-memory kills.
+
+        Args:
+            poll: Seconds between memory checks.
+
+        Returns:
+            Seconds waited.
+        """
+        needed = self.footprint()["rss_mb"] + self.reserve_mb
+        start = time.monotonic()
+        while True:
+            available = available_memory_mb()
+            waited = time.monotonic() - start
+            if (
+                available is None
+                or available >= needed
+                or waited >= self.admission_timeout
+            ):
+                return waited
+            time.sleep(poll)
+
+    def measure(self, pid: int | None) -> dict[str, float] | None:
+        """Measure a running browser while this run is sampling.
+
+        Args:
+            pid: Driver service process id (see DriverManager.browser_pid).
+
+        Returns:
+            The measurement, or None if not sampling or not measurable.
+        """
+        if pid is None or not self.sampling:
+            return None
+        usage = tree_usage(pid)
+        if usage is not None and usage["rss_mb"] > 0:
+            self._new_samples.append(usage)
+        return usage
+
+    def save(self) -> None:
+        """Merge this run's measurements into the footprint file (atomic).
+
+        The file is re-read and replaced under an exclusive file lock (see
+        core/file_lock.py), so concurrent workers keep each other's
+        measurements.
+        """
+        if not self._new_samples:
+            return
+        with file_lock(self.path):
+            samples = (self._load() + self._new_samples)[-self.window :]
+            temp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps({"samples": samples}), encoding="utf-8")
+            os.replace(temp_file, self.path)
+        self.samples = samples
+        self._new_samples = []
+
+    def _load(self) -> list[dict[str, Any]]:
+        """Read stored measurements (empty if missing or unreadable)."""
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                return list(data.get("samples", []))[-self.window :]
+            except (ValueError, AttributeError):
+                pass
+        return []
+
+
+def governor_from_config(resources_config: dict[str, Any]) -> ResourceGovernor | None:
+    """Create a governor from the resolved resources config section.
+
+    Args:
+        resources_config: Resources section with govern_workers resolved.
+
+    Returns:
+        ResourceGovernor, or None if govern_workers is disabled.
+    """
+    if not resources_config.get("govern_workers", False):
+        return None
+    return ResourceGovernor(
+        resources_config.get("footprint_path", DEFAULT_FOOTPRINT_PATH),
+        reserve_mb=resources_config.get("reserve_mb", DEFAULT_RESERVE_MB),
+        max_workers=resources_config.get("max_workers", 0),
+        sample_browsers=resources_config.get(
+            "sample_browsers", DEFAULT_SAMPLE_BROWSERS
+        ),
+        admission_timeout=resources_config.get(
+            "admission_timeout", DEFAULT_ADMISSION_TIMEOUT
+        ),
+    )
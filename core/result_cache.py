@@ -0,0 +1,238 @@
+"""Scenario result cache.
+
+Skips scenarios that already passed with exactly the same inputs. Each
+scenario is fingerprinted from its transitive inputs:
+
+- The feature file text (scenario, background and tags).
+- The step and page modules it uses, when the pass was traced in the same
+  run (see core/impact.py); otherwise every traced module, since an impact
+  map entry from an earlier run may miss modules the steps call now.
+- Files shared by all scenarios (config.yaml, hooks, locked dependencies).
+- The resolved run environment (browser settings, target URL) and the
+  installed browser version.
+
+Only passes are stored: a failing or changed scenario always runs again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+from core.impact import TRACED_DIRS
+
+DEFAULT_RESULTS_PATH = ".uat_cache/scenario_results.json"
+
+# Inputs of every scenario that are not traced per scenario
+SHARED_INPUTS = ("config.yaml", "features/environment.py", "poetry.lock")
+
+# Executables probed (in order) for the installed browser version
+BROWSER_EXECUTABLES = {
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"),
+    "firefox": ("firefox",),
+    "edge": ("microsoft-edge", "microsoft-edge-stable"),
+}
+
+
+def browser_version(browser_name: str) -> str | None:
+    """Get the installed browser version without starting a WebDriver.
+
+    Args:
+        browser_name: Browser name from config (chrome, firefox, edge, http).
+
+    Returns:
+        Version string (e.g., 'Google Chrome 126.0.6478.126'), or None if
+        the browser executable cannot be found or queried.
+    """
+    if browser_name == "http":
+        import requests
+
+        return f"requests {requests.__version__}"
+
+    for executable in BROWSER_EXECUTABLES.get(browser_name, ()):
+        path = shutil.which(executable)
+        if path is None:
+            continue
+        try:
+            result = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return None
+
+
+def scenario_inputs(
+    feature_file: str, impact_calls: list[str] | None, root: str = "."
+) -> list[str]:
+    """List the files a scenario depends on.
+
+    Args:
+        feature_file: Feature file path (relative to root).
+        impact_calls: Functions recorded for the scenario in the impact map
+            ('path::qualname'), or None if the scenario was never traced.
+        root: Repository root.
+
+    Returns:
+        Sorted relative file paths.
+
+    Examples:
+        >>> files = scenario_inputs(
+        ...     "features/cart.feature",
+        ...     ["pages/cart_page.py::CartPage.get_items"],
+        ...     root="/nonexistent",
+        ... )
+        >>> files[:2]
+        ['config.yaml', 'features/cart.feature']
+        >>> "pages/cart_page.py" in files
+        True
+    """
+    files = {feature_file, *SHARED_INPUTS}
+    if impact_calls is None:
+        for directory in TRACED_DIRS:
+            files.update(
+                path.relative_to(root).as_posix()
+                for path in Path(root, directory).rglob("*.py")
+            )
+    else:
+        files.update(call.split("::", 1)[0] for call in impact_calls)
+    return sorted(files)
+
+
+class ScenarioResultCache:
+    """Stores fingerprints of passed scenarios and detects unchanged ones.
+
+    Uses OOP pattern as the cache keeps state for a whole run (stored
+    results, file hashes computed once, scenarios reported as cached).
+    """
+
+    def __init__(
+        self,
+        environment: dict[str, Any],
+        impact_map: dict[str, dict[str, list[str]]],
+        path: str = DEFAULT_RESULTS_PATH,
+        root: str = ".",
+        force: bool = False,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            environment: Resolved run settings included in every fingerprint
+                (browser config, base URL, browser version).
+            impact_map: Map from core.impact.load_impact_map.
+            path: Results file path.
+            root: Repository root.
+            force: Never report scenarios as cached (results are still
+                recorded, refreshing the cache).
+        """
+        self.environment = json.dumps(environment, sort_keys=True, default=str)
+        self.impact_map = impact_map
+        self.path = Path(path)
+        self.root = root
+        self.force = force
+        self.results: dict[str, str] = {}
+        if self.path.exists():
+            try:
+                self.results = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                self.results = {}
+        self.cached: list[str] = []
+        self._file_hashes: dict[str, str] = {}
+
+    def fingerprint(
+        self,
+        scenario_id: str,
+        feature_file: str,
+        impact_calls: list[str] | None = None,
+    ) -> str:
+        """Compute a scenario's fingerprint.
+
+        Args:
+            scenario_id: Scenario location ('features/cart.feature:11').
+            feature_file: Feature file path.
+            impact_calls: Functions traced for the scenario ('path::qualname');
+                None makes every traced module an input.
+
+        Returns:
+            Hex digest over the scenario's inputs and the run environment.
+        """
+        digest = hashlib.sha256()
+        digest.update(scenario_id.encode())
+        digest.update(self.environment.encode())
+        for file_path in scenario_inputs(feature_file, impact_calls, self.root):
+            digest.update(f"\0{file_path}\0{self._hash_file(file_path)}".encode())
+        return digest.hexdigest()
+
+    def is_cached(self, scenario_id: str, feature_file: str) -> bool:
+        """Check if a scenario passed before with unchanged inputs.
+
+        A stored pass matches either the fingerprint over every traced
+        module or, when it was traced, the one over the modules in its
+        impact map entry (recorded by that same traced run). File hashes
+        are kept for the run, so a later record() sees the same contents.
+        Cached scenarios are remembered for the run report.
+
+        Args:
+            scenario_id: Scenario location.
+            feature_file: Feature file path.
+
+        Returns:
+            True if the scenario can be skipped (never when forced).
+        """
+        stored = self.results.get(scenario_id)
+        if self.force or stored is None:
+            return False
+        candidates = {self.fingerprint(scenario_id, feature_file)}
+        impact_calls = self.impact_map.get("behave", {}).get(scenario_id)
+        if impact_calls is not None:
+            candidates.add(self.fingerprint(scenario_id, feature_file, impact_calls))
+        if stored not in candidates:
+            return False
+        self.cached.append(scenario_id)
+        return True
+
+    def record(
+        self,
+        scenario_id: str,
+        feature_file: str,
+        passed: bool,
+        traced_calls: list[str] | None = None,
+    ) -> None:
+        """Store a pass, or forget the scenario if it did not pass.
+
+        Args:
+            scenario_id: Scenario location.
+            feature_file: Feature file path.
+            passed: Whether the scenario passed.
+            traced_calls: Functions traced for the scenario in this run, or
+                None if it was not traced (every traced module is an input).
+        """
+        if passed:
+            self.results[scenario_id] = self.fingerprint(
+                scenario_id, feature_file, traced_calls
+            )
+        else:
+            self.results.pop(scenario_id, None)
+
+    def save(self) -> None:
+        """Write stored results (atomic replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps(self.results, indent=1), encoding="utf-8")
+        os.replace(temp_file, self.path)
+
+    def _hash_file(self, file_path: str) -> str:
+        """Hash a file's content once per run ('missing' if absent)."""
+        if file_path not in self._file_hashes:
+            full_path = Path(self.root, file_path)
+            self._file_hashes[file_path] = (
+                hashlib.sha256(full_path.read_bytes()).hexdigest()
+                if full_path.is_file()
+                else "missing"
+            )
+        return self._file_hashes[file_path]
@@ -0,0 +1,201 @@
+"""Retry of transient browser failures.
+
+A scenario or integration test that fails only because of browser
+flakiness (an element that did not become clickable in time, an element
+re-rendered between lookup and use, a browser session that died) is run
+again on a fresh browser instead of failing the whole job. Assertion
+failures and other errors are never retried.
+
+Retries are bounded per test (max_attempts) and per run (budget), and
+every retry is reported so that flakiness stays visible.
+"""
+
+from typing import Any
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+# Messages of WebDriverException raised when the browser session is gone
+SESSION_LOST_MARKERS = (
+    "invalid session id",
+    "session deleted",
+    "not reachable",
+    "disconnected",
+    "target window already closed",
+    "browsing context has been discarded",
+)
+
+
+def classify_failure(exception: BaseException | None) -> str | None:
+    """Classify a failure as transient.
+
+    Args:
+        exception: Exception raised by the failing step or test.
+
+    Returns:
+        Short reason if the failure is transient, None otherwise.
+
+    Examples:
+        >>> classify_failure(TimeoutException("Message: "))
+        'TimeoutException'
+        >>> classify_failure(WebDriverException("chrome not reachable"))
+        'session lost'
+        >>> classify_failure(AssertionError("Expected 2 items")) is None
+        True
+    """
+    if isinstance(exception, (TimeoutException, StaleElementReferenceException)):
+        return type(exception).__name__
+    if isinstance(exception, (InvalidSessionIdException, NoSuchWindowException)):
+        return "session lost"
+    if isinstance(exception, WebDriverException):
+        message = (exception.msg or "").lower()
+        if any(marker in message for marker in SESSION_LOST_MARKERS):
+            return "session lost"
+    return None
+
+
+class RetryPolicy:
+    """Decides which failures are retried and keeps the run's retry report.
+
+    Uses OOP pattern as the retry budget and per-test attempts are state
+    shared by every scenario or test of a run.
+    """
+
+    def __init__(self, budget: int = 0, max_attempts: int = 2) -> None:
+        """Initialize policy.
+
+        Args:
+            budget: Maximum retries in the whole run (0 disables retries).
+            max_attempts: Maximum runs of one test, including the first.
+        """
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.retries: list[dict[str, Any]] = []
+        self._attempts: dict[str, int] = {}
+        self._pending: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if retries are enabled."""
+        return self.budget > 0 and self.max_attempts > 1
+
+    def should_retry(self, test_id: str, reason: str | None) -> bool:
+        """Decide whether a failed test is retried, consuming budget.
+
+        Args:
+            test_id: Scenario location or pytest node id.
+            reason: Transient failure reason from classify_failure, or None.
+
+        Returns:
+            True if the test should run again.
+        """
+        attempt = self._attempts.get(test_id, 1)
+        if (
+            reason is None
+            or attempt >= self.max_attempts
+            or len(self.retries) >= self.budget
+        ):
+            return False
+
+        self._attempts[test_id] = attempt + 1
+        self.retries.append(
+            {"test_id": test_id, "attempt": attempt, "reason": reason, "passed": None}
+        )
+        self._pending.add(test_id)
+        return True
+
+    def take_pending(self, test_id: str) -> bool:
+        """Check and clear a retry decision made for a test.
+
+        Args:
+            test_id: Scenario location or pytest node id.
+
+        Returns:
+            True if the test was scheduled for a retry.
+        """
+        if test_id in self._pending:
+            self._pending.remove(test_id)
+            return True
+        return False
+
+    def record_outcome(self, test_id: str, passed: bool) -> None:
+        """Record the outcome of a retried attempt.
+
+        Args:
+            test_id: Scenario location or pytest node id.
+            passed: Whether the attempt passed.
+        """
+        for retry in reversed(self.retries):
+            if retry["test_id"] == test_id:
+                if retry["passed"] is None:
+                    retry["passed"] = passed
+                return
+
+    def summary_lines(self) -> list[str]:
+        """Format the retry report.
+
+        Returns:
+            One line per retry plus a totals line (empty if nothing retried).
+        """
+        if not self.retries:
+            return []
+
+        lines = []
+        for retry in self.retries:
+            outcome = {True: "passed", False: "failed", None: "not run"}[
+                retry["passed"]
+            ]
+            lines.append(
+                f"[retry] {retry['test_id']}: {retry['reason']} on attempt "
+                f"{retry['attempt']}, retry {outcome}"
+            )
+        passed = sum(1 for retry in self.retries if retry["passed"])
+        lines.append(
+            f"[retry] {len(self.retries)} retry(ies) used of {self.budget}: "
+            f"{passed} passed only on retry (flaky)"
+        )
+        return lines
+
+
+def step_exception(scenario: Any) -> BaseException | None:
+    """Get the exception of a Behave scenario's failed step.
+
+    Args:
+        scenario: Behave Scenario that was executed.
+
+    Returns:
+        Exception of the first failed step, or None (e.g., hook failure).
+    """
+    for step in scenario.all_steps:
+        if step.status in ("failed", "error"):
+            return step.exception
+    return None
+
+
+def patch_scenario_with_retry(scenario: Any, policy: RetryPolicy) -> None:
+    """Run a Behave scenario again while the policy schedules retries.
+
+    The retry decision is made in after_scenario, where the failed step's
+    exception is known; every attempt runs the scenario hooks again, so a
+    retry starts on a fresh browser.
+
+    Args:
+        scenario: Behave Scenario to patch.
+        policy: Retry policy of the run.
+    """
+    scenario_run = scenario.run
+    test_id = str(scenario.location)
+
+    def run_with_retry(runner: Any) -> bool:
+        failed = scenario_run(runner)
+        while failed and policy.take_pending(test_id):
+            print(f"[retry] retrying {test_id} {scenario.name} on a fresh browser")
+            failed = scenario_run(runner)
+        return failed
+
+    scenario.run = run_with_retry
@@ -0,0 +1,300 @@
+"""Behave runner for the framework.
+
+Extends Behave's Runner (selected with ``--runner=core.runner:FrameworkRunner``,
+as scripts/run_behave.py does) with:
+
+- Parsed-feature cache: unchanged .feature files are not re-parsed.
+- Step matcher index: steps are matched against a small candidate set,
+  and steps matched by several definitions are reported at load time.
+- Test ordering: scenarios run in the order chosen by the test history
+  policy (-Dtest_order=failed|flaky|shortest, see core/history.py).
+- Thread pool: with -Dthreads=N, features run concurrently in N threads of
+  this process, sharing imported modules, parsed config and the feature
+  cache instead of paying for N processes. Scenarios of one feature still
+  run in order (backgrounds and feature hooks apply as usual).
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from behave.formatter._registry import make_formatters
+from behave.formatter.base import StreamOpener
+from behave.runner import Context, ModelRunner, Runner, the_step_registry
+
+from core.config import get_history_config, get_resources_config, load_config
+from core.config_resolver import apply_config_hierarchy
+from core.feature_cache import parse_features
+from core.history import DEFAULT_HISTORY_PATH, OutcomeHistory
+from core.resource_governor import governor_from_config
+from core.step_index import StepMatcherIndex
+
+RUNNER_CLASS_NAME = "core.runner:FrameworkRunner"
+
+
+def format_ambiguous_step(ambiguity: dict) -> str:
+    """Format an ambiguous step report line.
+
+    Args:
+        ambiguity: Entry from StepMatcherIndex.ambiguous_steps.
+
+    Returns:
+        Multi-line message naming the used and shadowed definitions.
+    """
+    lines = [
+        f"[steps] ambiguous step at {ambiguity['location']}: {ambiguity['step']}",
+        f"  used:     {ambiguity['used']}",
+    ]
+    lines.extend(f"  shadowed: {shadowed}" for shadowed in ambiguity["shadowed"])
+    return "\n".join(lines)
+
+
+def order_features(features: list, history: OutcomeHistory, policy: str) -> None:
+    """Reorder features and their scenarios in place by history policy.
+
+    Scenarios are ordered within their feature (or rule), so backgrounds
+    and feature hooks still apply; outlines move as a unit. Features are
+    then ordered by their highest-priority scenario.
+
+    Args:
+        features: Parsed Behave features.
+        history: Outcome history.
+        policy: One of core.history.ORDER_POLICIES.
+    """
+
+    def order_container(container) -> tuple:
+        keys = {}
+        for item in container.run_items:
+            if hasattr(item, "run_items"):  # Rule
+                keys[id(item)] = order_container(item)
+            else:
+                scenarios = getattr(item, "scenarios", None) or [item]
+                keys[id(item)] = min(
+                    history.sort_key("behave", str(scenario.location), policy)
+                    for scenario in scenarios
+                )
+        container.run_items.sort(key=lambda item: keys[id(item)])
+        return min(keys.values(), default=())
+
+    feature_keys = {id(feature): order_container(feature) for feature in features}
+    features.sort(key=lambda feature: feature_keys[id(feature)])
+
+
+def resolve_threads(userdata: dict, config: dict) -> int:
+    """Resolve the feature thread count (0 runs features sequentially).
+
+    Hierarchy: -Dthreads > THREADS > config.yaml (resources.threads). With
+    govern_workers, the count is capped by the browsers that fit in memory
+    and CPU (see core/resource_governor.py).
+
+    Args:
+        userdata: Behave user data (-D options).
+        config: Full configuration from config.yaml.
+
+    Returns:
+        Number of threads, 0 when disabled.
+    """
+    resources_config = get_resources_config(config)
+    apply_config_hierarchy(
+        config=resources_config,
+        key="threads",
+        cli_value=userdata.get("threads"),
+        env_value=os.getenv("THREADS"),
+    )
+    apply_config_hierarchy(
+        config=resources_config,
+        key="govern_workers",
+        cli_value=userdata.get("govern_workers"),
+        env_value=os.getenv("GOVERN_WORKERS"),
+    )
+    threads = resources_config["threads"]
+    governor = governor_from_config(resources_config)
+    if threads and governor is not None:
+        threads = min(threads, governor.worker_limit())
+    return threads
+
+
+class FeatureWorker(ModelRunner):
+    """Runs one feature in a thread of FrameworkRunner's thread pool.
+
+    Uses OOP pattern as Behave runs features through a runner: each worker
+    has its own context stack and formatters, and shares the parent's
+    hooks, step registry and root context layer (objects created by
+    before_all, failed and aborted flags).
+    """
+
+    def __init__(self, parent: Runner) -> None:
+        """Initialize worker.
+
+        Args:
+            parent: Runner that ran before_all.
+        """
+        super().__init__(parent.config, step_registry=parent.step_registry)
+        self.hooks = parent.hooks
+        self._undefined_steps = parent.undefined_steps
+        self.context = Context(self)
+        # The root layer is the last of the stack (layers are pushed first)
+        self.context._root = parent.context._root
+        self.context._stack = [parent.context._root]
+
+    def run_feature(self, feature) -> tuple[bool, list[str]]:
+        """Run a feature, formatting its output into buffers.
+
+        Args:
+            feature: Parsed Behave feature.
+
+        Returns:
+            Whether the feature failed, and the output of each configured
+            formatter.
+        """
+        buffers = [io.StringIO() for _ in self.config.format]
+        self.formatters = make_formatters(
+            self.config, [StreamOpener(stream=buffer) for buffer in buffers]
+        )
+        self.feature = feature
+        for formatter in self.formatters:
+            formatter.uri(feature.filename)
+        failed = feature.run(self)
+        for formatter in self.formatters:
+            formatter.close()
+        return failed, [buffer.getvalue() for buffer in buffers]
+
+
+class FrameworkRunner(Runner):
+    """Behave runner using the feature cache and step matcher index.
+
+    Uses OOP pattern as Behave selects runners by class
+    (``--runner=module:Class``).
+    """
+
+    # Feature threads (0 = Behave's sequential run_model)
+    threads = 0
+
+    def run_with_paths(self):
+        """Run features like Runner.run_with_paths with framework extensions."""
+        self.context = Context(self)
+        self.load_hooks()
+        self.load_step_definitions()
+
+        feature_locations = [
+            filename
+            for filename in self.feature_locations()
+            if not self.config.exclude(filename)
+        ]
+        features = parse_features(feature_locations, language=self.config.lang)
+
+        # Ordering hierarchy: -Dtest_order > TEST_ORDER > config.yaml
+        config = load_config()
+        history_config = get_history_config(config)
+        apply_config_hierarchy(
+            config=history_config,
+            key="test_order",
+            cli_value=self.config.userdata.get("test_order"),
+            env_value=os.getenv("TEST_ORDER"),
+        )
+        if history_config["test_order"] != "none":
+            history = OutcomeHistory(history_config.get("path", DEFAULT_HISTORY_PATH))
+            order_features(features, history, history_config["test_order"])
+        self.features.extend(features)
+
+        # Same registry Runner.run_model falls back to (step modules use it)
+        self.step_registry = StepMatcherIndex(self.step_registry or the_step_registry)
+        for ambiguity in self.step_registry.ambiguous_steps(features):
+            print(format_ambiguous_step(ambiguity))
+
+        self.formatters = make_formatters(self.config, self.config.outputs)
+        if not self.config.dry_run:
+            self.threads = resolve_threads(self.config.userdata, config)
+        return self.run_model()
+
+    def run_model(self, features=None):
+        """Run features, in a thread pool when threads are configured."""
+        if not self.threads:
+            return super().run_model(features)
+        return self.run_model_threaded(self.features if features is None else features)
+
+    def run_model_threaded(self, features: list) -> bool:
+        """Run features concurrently, like Runner.run_model otherwise.
+
+        before_all and after_all run once, in this thread; before_all may
+        lower context.threads (e.g., for per-scenario recorders that are
+        not thread-safe). Each feature runs in a FeatureWorker; its output
+        is written and reported in feature order once it has finished, so
+        output of concurrent features does not interleave.
+
+        Args:
+            features: Parsed Behave features.
+
+        Returns:
+            True if the run failed.
+        """
+        # Output capture swaps sys.stdout, which all threads share
+        self.config.capture_stdout = False
+        self.config.capture_stderr = False
+        self.config.capture_log = False
+
+        self.hook_failures = 0
+        undefined_steps_initial_size = len(self.undefined_steps)
+        self.context.threads = self.threads
+        self.run_hook("before_all")
+        threads = self.context.threads
+        print(f"[threads] running features in {threads} thread(s)")
+
+        workers = []
+        stop = threading.Event()
+
+        def run_feature(feature) -> tuple[bool, list[str]] | None:
+            if self.aborted or stop.is_set():
+                return None
+            worker = FeatureWorker(self)
+            workers.append(worker)
+            return worker.run_feature(feature)
+
+        failed_count = 0
+        pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="feature")
+        futures = [pool.submit(run_feature, feature) for feature in features]
+        try:
+            for feature, future in zip(features, futures):
+                result = future.result()
+                if result is not None:
+                    failed, outputs = result
+                    for formatter, output in zip(self.formatters, outputs):
+                        stream = formatter.open()
+                        stream.write(output)
+                        stream.flush()
+                    if failed:
+                        failed_count += 1
+                        if self.config.stop:
+                            stop.set()
+                # -- ALWAYS: Report run/not-run feature (Summary counts it)
+                for reporter in self.config.reporters:
+                    reporter.feature(feature)
+        except KeyboardInterrupt:
+            self.abort(reason="KeyboardInterrupt")
+            failed_count += 1
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        self.hook_failures += sum(worker.hook_failures for worker in workers)
+        cleanups_failed = False
+        self.run_hook_with_capture("after_all")
+        try:
+            self.context._do_remaining_cleanups()
+        except Exception:
+            cleanups_failed = True
+
+        if self.aborted:
+            print("\nABORTED: By user.")
+        for formatter in self.formatters:
+            formatter.close()
+        for reporter in self.config.reporters:
+            reporter.end()
+
+        return (
+            failed_count > 0
+            or self.aborted
+            or self.hook_failures > 0
+            or len(self.undefined_steps) > undefined_steps_initial_size
+            or cleanups_failed
+        )
@@ -0,0 +1,180 @@
+"""Step definition matcher index.
+
+Behave resolves a Gherkin step by trying every registered step pattern of
+its type in registration order. This index buckets step definitions by the
+literal words their pattern starts with, so each step is only matched
+against definitions that could possibly match, with the same first-match
+result as Behave.
+
+Bucket keys are casefolded: parse matchers may be case-insensitive
+(ParseMatcher.CASE_SENSITIVE = False), so a step is looked up as if it
+could match in any case and the matcher itself decides. Candidate sets are then a superset of what can match either way.
+
+It also reports steps matched by more than one definition (the first
+registered wins; the others are shadowed for that step).
+"""
+
+from typing import Any
+
+from behave.matchers import Matcher, ParseMatcher
+
+# Leading literal words used as bucket keys
+MAX_PREFIX_WORDS = 3
+
+
+def literal_prefix_words(
+    matcher: Matcher, max_words: int = MAX_PREFIX_WORDS
+) -> tuple[str, ...]:
+    """Get the complete literal words a step pattern starts with.
+
+    Only parse-expression patterns are analysed; other matchers (regex)
+    return an empty prefix and are always candidates. Words are casefolded
+    so case-insensitive matchers share the bucket of any casing.
+
+    Args:
+        matcher: Registered step matcher.
+        max_words: Maximum number of words to return.
+
+    Returns:
+        Tuple of leading literal words (possibly empty).
+    """
+    if not isinstance(matcher, ParseMatcher):
+        return ()
+
+    literal = matcher.pattern.split("{", 1)[0]
+    if "}" in literal:
+        return ()  # Escaped braces ('}}'): fall back to always matching
+
+    # The text after the last space is a partial word (or empty)
+    return tuple(literal.casefold().split(" ")[:-1][:max_words])
+
+
+class StepMatcherIndex:
+    """Step registry wrapper that matches steps against small candidate sets.
+
+    Uses OOP pattern as it wraps Behave's StepRegistry (runner.step_registry)
+    and keeps the index in sync with the definitions registered in it.
+    """
+
+    def __init__(self, step_registry: Any, max_words: int = MAX_PREFIX_WORDS) -> None:
+        """Initialize index over a Behave step registry.
+
+        Args:
+            step_registry: Behave StepRegistry with loaded step definitions.
+            max_words: Maximum literal words used as bucket keys.
+        """
+        self.step_registry = step_registry
+        self.max_words = max_words
+        self._buckets: dict[str, dict[tuple[str, ...], list]] = {}
+        self._candidates: dict[tuple[str, str], list[Matcher]] = {}
+        self._indexed_count = -1
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else (error_handler, steps...) to the registry."""
+        return getattr(self.step_registry, name)
+
+    def candidates(self, step_type: str, step_text: str) -> list[Matcher]:
+        """Get the definitions that could match a step, in Behave's order.
+
+        Behave tries definitions of the step's own type first, then the
+        generic 'step' definitions, each in registration order.
+
+        Args:
+            step_type: Step type ('given', 'when', 'then' or 'step').
+            step_text: Step text without keyword.
+
+        Returns:
+            Candidate matchers in the order Behave would try them.
+        """
+        self._ensure_index()
+        cached = self._candidates.get((step_type, step_text))
+        if cached is not None:
+            return cached
+
+        step_types = [step_type] if step_type == "step" else [step_type, "step"]
+        words = step_text.casefold().split(" ")
+
+        found = []
+        for type_rank, current_type in enumerate(step_types):
+            buckets = self._buckets.get(current_type, {})
+            for length in range(min(len(words), self.max_words) + 1):
+                found.extend(
+                    (type_rank, position, matcher)
+                    for position, matcher in buckets.get(tuple(words[:length]), [])
+                )
+        candidates = [m for _, _, m in sorted(found, key=lambda f: f[:2])]
+        self._candidates[(step_type, step_text)] = candidates
+        return candidates
+
+    def find_match(self, step: Any) -> Any:
+        """Find the first matching definition (same result as Behave).
+
+        Args:
+            step: Behave Step.
+
+        Returns:
+            Match object, or None if no definition matches.
+        """
+        for matcher in self.candidates(step.step_type, step.name):
+            result = matcher.match(step.name)
+            if result:
+                return result
+        return None
+
+    def find_step_definition(self, step: Any) -> Matcher | None:
+        """Find the first matching definition without running converters."""
+        for matcher in self.candidates(step.step_type, step.name):
+            if matcher.match(step.name):
+                return matcher
+        return None
+
+    def ambiguous_steps(self, features: list) -> list[dict[str, Any]]:
+        """Find steps matched by more than one definition.
+
+        Args:
+            features: Parsed Behave features.
+
+        Returns:
+            One entry per distinct step text with step, location, the
+            definition used and the shadowed definitions.
+        """
+        checked: set[tuple[str, str]] = set()
+        reported = []
+        for feature in features:
+            for scenario in feature.walk_scenarios():
+                for step in scenario.all_steps:
+                    key = (step.step_type, step.name)
+                    if key in checked:
+                        continue
+                    checked.add(key)
+                    matches = [
+                        m
+                        for m in self.candidates(step.step_type, step.name)
+                        if m.match(step.name)
+                    ]
+                    if len({m.func for m in matches}) > 1:
+                        reported.append(
+                            {
+                                "step": f"{step.keyword} {step.name}",
+                                "location": str(step.location),
+                                "used": matches[0].describe(),
+                                "shadowed": [m.describe() for m in matches[1:]],
+                            }
+                        )
+        return reported
+
+    def _ensure_index(self) -> None:
+        """(Re)build buckets when definitions were added since last build."""
+        steps = self.step_registry.steps
+        count = sum(len(definitions) for definitions in steps.values())
+        if count == self._indexed_count:
+            return
+
+        self._buckets = {}
+        self._candidates = {}
+        for step_type, definitions in steps.items():
+            buckets = self._buckets.setdefault(step_type, {})
+            for position, matcher in enumerate(definitions):
+                key = literal_prefix_words(matcher, self.max_words)
+                buckets.setdefault(key, []).append((position, matcher))
+        self._indexed_count = count
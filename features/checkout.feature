@@ -50,6 +50,7 @@ Feature: Checkout
     And the item total should be displayed
     And the tax should be displayed
     And the total should be displayed
+    And the order totals should add up
 
   Scenario: Cancel checkout and return to cart
     When I click the checkout button
@@ -5,23 +5,213 @@ Handles WebDriver initialization and cleanup.
 """
 
 import os
+import threading
+from collections import Counter
 
-from core.config import get_browser_config, load_config
+from selenium.common.exceptions import WebDriverException
+
+from core.config import (
+    get_browser_config,
+    get_history_config,
+    get_impact_config,
+    get_memory_config,
+    get_performance_config,
+    get_resources_config,
+    get_result_cache_config,
+    get_retry_config,
+    load_config,
+)
 from core.config_resolver import apply_config_hierarchy
 from core.driver_manager import DriverManager
+from core.history import (
+    DEFAULT_HISTORY_PATH,
+    HISTORY_WINDOW,
+    OutcomeHistory,
+    recording_enabled,
+)
+from core.impact import (
+    DEFAULT_MAP_PATH,
+    ImpactTracer,
+    load_impact_map,
+    save_impact_map,
+)
+from core.performance import (
+    PerformanceRecorder,
+    collect_navigation_timing,
+    install_interaction_probe,
+)
+from core.memory_monitor import MemoryMonitor
+from core.resource_governor import governor_from_config
+from core.result_cache import (
+    DEFAULT_RESULTS_PATH,
+    ScenarioResultCache,
+    browser_version,
+)
+from core.retry import (
+    RetryPolicy,
+    classify_failure,
+    patch_scenario_with_retry,
+    step_exception,
+)
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.checkout_complete_page import CheckoutCompletePage
+from pages.checkout_step_one_page import CheckoutStepOnePage
+from pages.checkout_step_two_page import CheckoutStepTwoPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+PAGE_OBJECTS = (
+    LoginPage,
+    InventoryPage,
+    CartPage,
+    CheckoutStepOnePage,
+    CheckoutStepTwoPage,
+    CheckoutCompletePage,
+)
+
+# Run-level records (result cache, history, retries) are updated by
+# scenarios of all feature threads
+RUN_RECORDS_LOCK = threading.Lock()
 
 
 def before_all(context):
     """Initialize configuration before all tests.
 
+    Target base URL and navigation timing capture follow the same hierarchy
+    as headless mode (e.g., -Dcapture_timing=true > CAPTURE_TIMING=true >
+    config.yaml).
+
     Args:
         context: Behave context object.
     """
     context.config_data = load_config("config.yaml")
 
+    # Target base URL hierarchy: -Dbase_url > BASE_URL > config.yaml
+    apply_config_hierarchy(
+        config=context.config_data["environment"]["remote"],
+        key="base_url",
+        cli_value=context.config.userdata.get("base_url"),
+        env_value=os.getenv("BASE_URL"),
+    )
+
+    performance_config = get_performance_config(context.config_data)
+    apply_config_hierarchy(
+        config=performance_config,
+        key="capture_timing",
+        cli_value=context.config.userdata.get("capture_timing"),
+        env_value=os.getenv("CAPTURE_TIMING"),
+    )
+
+    context.performance_recorder = None
+    if performance_config["capture_timing"]:
+        context.performance_recorder = PerformanceRecorder(
+            {page.PAGE_PATH: page.__name__ for page in PAGE_OBJECTS}
+        )
+
+    impact_config = get_impact_config(context.config_data)
+    apply_config_hierarchy(
+        config=impact_config,
+        key="capture_impact",
+        cli_value=context.config.userdata.get("capture_impact"),
+        env_value=os.getenv("CAPTURE_IMPACT"),
+    )
+    context.impact_tracer = ImpactTracer() if impact_config["capture_impact"] else None
+
+    # Scenario result cache hierarchy: -Dcache_results / -Dforce_run > ENV
+    result_cache_config = get_result_cache_config(context.config_data)
+    for key in ("cache_results", "force_run"):
+        apply_config_hierarchy(
+            config=result_cache_config,
+            key=key,
+            cli_value=context.config.userdata.get(key),
+            env_value=os.getenv(key.upper()),
+        )
+
+    context.result_cache = None
+    if result_cache_config["cache_results"]:
+        context.result_cache = create_result_cache(
+            context, result_cache_config, impact_config
+        )
+
+    # Outcomes/durations for test ordering; -Dfail_fast_after=N stops early
+    # (recorded only with an order policy, fail-fast or -Drecord_history)
+    history_config = get_history_config(context.config_data)
+    for key in ("test_order", "fail_fast_after", "record_history"):
+        apply_config_hierarchy(
+            config=history_config,
+            key=key,
+            cli_value=context.config.userdata.get(key),
+            env_value=os.getenv(key.upper()),
+        )
+    context.fail_fast_after = history_config["fail_fast_after"]
+    context.record_history = recording_enabled(history_config)
+    context.outcome_history = OutcomeHistory(
+        history_config.get("path", DEFAULT_HISTORY_PATH),
+        history_config.get("window", HISTORY_WINDOW),
+    )
+    # Stale element re-locations per locator, summed over the run's drivers
+    context.stale_relocations = Counter()
+
+    # Transient failure retries: -Dretry_budget=N > RETRY_BUDGET > config.yaml
+    retry_config = get_retry_config(context.config_data)
+    apply_config_hierarchy(
+        config=retry_config,
+        key="retry_budget",
+        cli_value=context.config.userdata.get("retry_budget"),
+        env_value=os.getenv("RETRY_BUDGET"),
+    )
+    context.retry_policy = RetryPolicy(
+        retry_config["retry_budget"], retry_config.get("max_attempts", 2)
+    )
+
+    # Memory admission before each browser start and footprint measurement
+    resources_config = get_resources_config(context.config_data)
+    apply_config_hierarchy(
+        config=resources_config,
+        key="govern_workers",
+        cli_value=context.config.userdata.get("govern_workers"),
+        env_value=os.getenv("GOVERN_WORKERS"),
+    )
+    context.resource_governor = governor_from_config(resources_config)
+
+    # Browser memory before/after each scenario; recycles the shared browser
+    memory_config = get_memory_config(context.config_data)
+    apply_config_hierarchy(
+        config=memory_config,
+        key="monitor_memory",
+        cli_value=context.config.userdata.get("monitor_memory"),
+        env_value=os.getenv("MONITOR_MEMORY"),
+    )
+    context.memory_monitor = None
+    if memory_config["monitor_memory"]:
+        context.memory_monitor = MemoryMonitor(
+            memory_config.get("recycle_rss_mb", 0),
+            memory_config.get("recycle_heap_mb", 0),
+        )
+
+    # -Duser_contexts=true: one browser for the run (started on first use),
+    # each scenario in its own user context
+    browser_config = resolve_browser_config(context)
+    context.shared_driver_manager = (
+        DriverManager(browser_config) if browser_config["user_contexts"] else None
+    )
+
+    # Feature threads (-Dthreads=N, core/runner.py): the recorders below
+    # follow one current scenario, so they need features run one at a time
+    recorders = {
+        "capture_timing": context.performance_recorder,
+        "capture_impact": context.impact_tracer,
+        "monitor_memory": context.memory_monitor,
+    }
+    enabled = [name for name, recorder in recorders.items() if recorder is not None]
+    if getattr(context, "threads", 0) > 1 and enabled:
+        print(f"[threads] {', '.join(enabled)} enabled: running features in 1 thread")
+        context.threads = 1
 
-def before_scenario(context, scenario):
-    """Initialize WebDriver before each scenario.
+
+def resolve_browser_config(context):
+    """Resolve browser configuration.
 
     Configuration hierarchy (highest to lowest priority):
     1. CLI parameter: -Dheadless=true
@@ -35,7 +225,10 @@ def before_scenario(context, scenario):
 
     Args:
         context: Behave context object.
-        scenario: Current scenario being executed.
+
+    Returns:
+        Browser configuration with headless, name, capture_events,
+        fast_actions and user_contexts resolved.
     """
     browser_config = get_browser_config(context.config_data)
 
@@ -55,16 +248,331 @@ def before_scenario(context, scenario):
         env_value=os.getenv("BROWSER"),
     )
 
-    context.driver_manager = DriverManager(browser_config)
-    context.driver = context.driver_manager.get_driver()
+    # Apply configuration hierarchy for BiDi event capture
+    apply_config_hierarchy(
+        config=browser_config,
+        key="capture_events",
+        cli_value=context.config.userdata.get("capture_events"),
+        env_value=os.getenv("CAPTURE_EVENTS"),
+    )
+
+    # Apply configuration hierarchy for single-call wait-and-act
+    apply_config_hierarchy(
+        config=browser_config,
+        key="fast_actions",
+        cli_value=context.config.userdata.get("fast_actions"),
+        env_value=os.getenv("FAST_ACTIONS"),
+    )
+
+    # Apply configuration hierarchy for one browser shared by user contexts
+    apply_config_hierarchy(
+        config=browser_config,
+        key="user_contexts",
+        cli_value=context.config.userdata.get("user_contexts"),
+        env_value=os.getenv("USER_CONTEXTS"),
+    )
+
+    return browser_config
+
+
+def create_result_cache(context, result_cache_config, impact_config):
+    """Create the scenario result cache for this run.
+
+    Fingerprints include the resolved browser configuration, target URL and
+    installed browser version. Without a known browser version results
+    cannot be compared, so the cache stays disabled.
+
+    Args:
+        context: Behave context object.
+        result_cache_config: Resolved result_cache section.
+        impact_config: Impact section (its map lists each scenario's modules).
+
+    Returns:
+        ScenarioResultCache, or None if the browser version is unknown.
+    """
+    browser_config = resolve_browser_config(context)
+    version = browser_version(browser_config["name"])
+    if version is None:
+        print(
+            f"[cache] {browser_config['name']} version unknown: "
+            "scenario result cache disabled"
+        )
+        return None
+
+    return ScenarioResultCache(
+        environment={
+            "browser": browser_config,
+            "browser_version": version,
+            "base_url": context.config_data["environment"]["remote"]["base_url"],
+        },
+        impact_map=load_impact_map(impact_config.get("map_path", DEFAULT_MAP_PATH)),
+        path=result_cache_config.get("results_path", DEFAULT_RESULTS_PATH),
+        force=result_cache_config["force_run"],
+    )
+
+
+def before_feature(context, feature):
+    """Enable transient failure retries for the feature's scenarios.
+
+    Args:
+        context: Behave context object.
+        feature: Feature about to run.
+    """
+    if context.retry_policy.enabled:
+        for scenario in feature.walk_scenarios():
+            patch_scenario_with_retry(scenario, context.retry_policy)
+
+
+def before_scenario(context, scenario):
+    """Initialize WebDriver before each scenario.
+
+    Browser settings are resolved by resolve_browser_config. With the
+    result cache enabled, a scenario that passed before with the same
+    fingerprint is skipped (reported as cached) without starting a driver.
+    With user contexts, the scenario gets a new user context in the run's
+    browser instead of a new browser.
+
+    Args:
+        context: Behave context object.
+        scenario: Current scenario being executed.
+    """
+    context.scenario_cached = False
+    if getattr(context, "result_cache", None) is not None:
+        scenario_id = str(scenario.location)
+        if context.result_cache.is_cached(scenario_id, scenario.filename):
+            print(f"[cache] cached: {scenario_id} {scenario.name}")
+            context.scenario_cached = True
+            scenario.skip("cached: passed before with unchanged inputs")
+            return
+
+    # Trace from the start so driver setup is part of the scenario's impact
+    if getattr(context, "impact_tracer", None) is not None:
+        context.impact_tracer.start()
+
+    browser_config = resolve_browser_config(context)
+
+    if context.shared_driver_manager is not None:
+        context.driver = context.shared_driver_manager.new_context()
+        context.browser_events = context.shared_driver_manager.event_capture
+        if context.browser_events is not None:
+            # Events of the shared browser: keep only this scenario's
+            context.browser_events.drain()
+    else:
+        # Concurrent runs on the agent: wait for memory for one more browser
+        if context.resource_governor is not None and browser_config["name"] != "http":
+            context.resource_governor.wait_for_memory()
+        context.driver_manager = DriverManager(browser_config)
+        context.driver = context.driver_manager.get_driver()
+        context.browser_events = context.driver_manager.event_capture
+
+    # Page object state (fast actions, snapshots) belongs to the driver
+    BasePage.driver_state(context.driver).fast_actions = browser_config.get(
+        "fast_actions", False
+    )
+
+    if context.memory_monitor is not None:
+        manager = context.shared_driver_manager or context.driver_manager
+        context.memory_monitor.start_scenario(
+            scenario.name, manager.memory_usage(context.driver)
+        )
+
+    if context.performance_recorder is not None:
+        context.performance_recorder.start_scenario(scenario.name)
+
+    # Performance budget scenarios need in-page timing probes
+    context.measure_interactions = "performance" in scenario.effective_tags
+
+
+def before_step(context, step):
+    """Invalidate page snapshots before each When step.
+
+    Consecutive Then steps assert against one page snapshot
+    (BasePage.snapshot); an action may change the page.
+
+    Args:
+        context: Behave context object.
+        step: Step about to run.
+    """
+    if step.step_type == "when" and hasattr(context, "driver"):
+        BasePage.driver_state(context.driver).snapshots.clear()
+
+
+def after_step(context, step):
+    """Collect navigation timings and keep timing probes installed.
+
+    A single script call returns the navigation entry and any resource
+    entries loaded since the previous step. For @performance scenarios the
+    interaction probe is (re)installed so the next step's clicks and route
+    changes are timed in-browser.
+
+    Args:
+        context: Behave context object.
+        step: Step that was executed.
+    """
+    if not hasattr(context, "driver"):
+        return
+
+    try:
+        if context.measure_interactions:
+            install_interaction_probe(context.driver)
+
+        if context.performance_recorder is not None:
+            timing = collect_navigation_timing(context.driver)
+            if timing:
+                context.performance_recorder.record(timing)
+    except WebDriverException:
+        return
 
 
 def after_scenario(context, scenario):
     """Clean up WebDriver after each scenario.
 
+    When browser event capture is enabled and the scenario failed (an
+    assertion, or an error such as a WebDriver timeout), the captured
+    JavaScript exceptions and console errors are printed to help
+    tell application errors apart from framework errors. With memory
+    monitoring, a shared browser crossing a threshold is recycled.
+
     Args:
         context: Behave context object.
         scenario: Scenario that was executed.
     """
+    if context.scenario_cached:
+        return
+
+    events = getattr(context, "browser_events", None)
+    if events is not None and scenario.status in ("failed", "error"):
+        for error in events.snapshot()["errors"]:
+            print(f"[browser] JS exception: {error['text']}")
+        for message in events.console_errors():
+            print(f"[browser] console error: {message['text']}")
+
+    if getattr(context, "performance_recorder", None) is not None:
+        context.performance_recorder.end_scenario(
+            scenario.status.name, scenario.duration
+        )
+
+    recycle = None
+    if context.memory_monitor is not None and hasattr(context, "driver"):
+        manager = getattr(context, "driver_manager", context.shared_driver_manager)
+        recycle = context.memory_monitor.end_scenario(
+            scenario.status.name, manager.memory_usage(context.driver)
+        )
+
     if hasattr(context, "driver_manager"):
+        if context.resource_governor is not None:
+            context.resource_governor.measure(context.driver_manager.browser_pid)
         context.driver_manager.quit()
+    elif context.shared_driver_manager is not None and hasattr(context, "driver"):
+        context.shared_driver_manager.close_context(context.driver)
+        # A bloated shared browser is replaced before the next scenario
+        if recycle:
+            print(f"[memory] recycling browser: {recycle}")
+            context.shared_driver_manager.recycle()
+
+    if getattr(context, "impact_tracer", None) is not None:
+        context.impact_tracer.stop("behave", str(scenario.location))
+
+    with RUN_RECORDS_LOCK:
+        record_outcome(context, scenario)
+
+
+def record_outcome(context, scenario):
+    """Record a scenario's outcome in the run-level records.
+
+    Updates the result cache, test history, stale element counts and retry
+    budget, and aborts the run when the fail-fast limit is reached.
+
+    Args:
+        context: Behave context object.
+        scenario: Scenario that was executed.
+    """
+    # Only passes are kept: failures always run again. The modules a pass
+    # depends on are only known when it was traced in this run
+    if getattr(context, "result_cache", None) is not None:
+        traced_calls = None
+        if getattr(context, "impact_tracer", None) is not None:
+            traced_calls = context.impact_tracer.entries["behave"].get(
+                str(scenario.location)
+            )
+        context.result_cache.record(
+            str(scenario.location),
+            scenario.filename,
+            scenario.status == "passed",
+            traced_calls,
+        )
+
+    if hasattr(context, "driver"):
+        context.stale_relocations.update(
+            BasePage.driver_state(context.driver).stale_relocations
+        )
+
+    if scenario.status in ("passed", "failed", "error"):
+        scenario_id = str(scenario.location)
+        passed = scenario.status == "passed"
+        if context.record_history:
+            context.outcome_history.record(
+                "behave", scenario_id, passed, scenario.duration
+            )
+
+        # Transient failures (not assertions) run again on a fresh browser
+        context.retry_policy.record_outcome(scenario_id, passed)
+        reason = None if passed else classify_failure(step_exception(scenario))
+        if context.retry_policy.should_retry(scenario_id, reason):
+            print(f"[retry] {scenario_id}: transient {reason}, retry scheduled")
+
+        # Failures followed by a retry are not final
+        failures = context.outcome_history.failures - len(context.retry_policy.retries)
+        if context.fail_fast_after and failures >= context.fail_fast_after:
+            context.abort(reason=f"fail fast after {failures} failed scenario(s)")
+
+
+def after_all(context):
+    """Write the test history, retry and stale element reports, and the
+    performance report, impact map, result cache, browser footprint and
+    memory report when enabled.
+
+    Args:
+        context: Behave context object.
+    """
+    if context.shared_driver_manager is not None:
+        context.shared_driver_manager.quit()
+    if context.resource_governor is not None:
+        context.resource_governor.save()
+
+    if context.memory_monitor is not None:
+        for line in context.memory_monitor.summary_lines():
+            print(line)
+        memory_config = get_memory_config(context.config_data)
+        context.memory_monitor.write_report(
+            memory_config.get("report_path", "reports/memory.json")
+        )
+
+    if context.record_history:
+        context.outcome_history.save()
+    for line in context.retry_policy.summary_lines():
+        print(line)
+    for (by, value), count in context.stale_relocations.most_common():
+        print(f"[stale] {by}={value}: re-located {count} time(s)")
+
+    if getattr(context, "result_cache", None) is not None:
+        context.result_cache.save()
+        if context.result_cache.cached:
+            print(
+                f"[cache] {len(context.result_cache.cached)} scenario(s) cached "
+                "(passed before with unchanged inputs); use -Dforce_run=true "
+                "for a full run"
+            )
+
+    if getattr(context, "impact_tracer", None) is not None:
+        impact_config = get_impact_config(context.config_data)
+        save_impact_map(
+            context.impact_tracer.entries,
+            impact_config.get("map_path", ".uat_cache/impact_map.json"),
+        )
+
+    if getattr(context, "performance_recorder", None) is not None:
+        performance_config = get_performance_config(context.config_data)
+        context.performance_recorder.write_report(
+            performance_config.get("report_path", "reports/performance.json")
+        )
@@ -0,0 +1,31 @@
+@e2e @performance
+Feature: Performance Budgets
+  As a QA engineer
+  I want page loads and interactions to stay within performance budgets
+  So that performance regressions are caught before they reach customers
+
+  Scenario: Standard user inventory page loads within budget
+    Given I am on the Sauce Demo login page
+    When I login with username "standard_user" and password "secret_sauce"
+    Then I should be on the inventory page
+    And the inventory page should load within 3000 ms
+
+  Scenario: Adding to cart responds within budget
+    Given I am on the Sauce Demo login page
+    When I login with username "standard_user" and password "secret_sauce"
+    Then I should be on the inventory page
+    When I add "Sauce Labs Backpack" to the cart
+    Then adding to cart should respond within 200 ms
+    And the cart badge should show "1"
+
+  @glitch_user
+  Scenario: Performance glitch user journey stays within budget
+    Given I am on the Sauce Demo login page
+    When I login with username "performance_glitch_user" and password "secret_sauce"
+    Then I should be on the inventory page
+    And the inventory page should load within 8000 ms
+    When I add "Sauce Labs Backpack" to the cart
+    Then adding to cart should respond within 500 ms
+    When I click the shopping cart icon
+    Then I should be on the cart page
+    And the cart page should load within 1000 ms
@@ -80,7 +80,8 @@ def step_navigate_different_pages(context):
 @then('the cart badge should still show "{count}"')
 def step_verify_cart_badge(context, count):
     """Verify cart badge shows expected count."""
-    actual_count = context.inventory_page.get_cart_item_count()
+    # No badge element means an empty cart
+    actual_count = int(context.inventory_page.snapshot()["badge"] or 0)
     assert actual_count == int(
         count
     ), f"Cart badge should show {count}, but shows {actual_count}"
@@ -89,11 +90,10 @@ def step_verify_cart_badge(context, count):
 @then('the product button should change to "{button_text}"')
 def step_verify_button_text(context, button_text):
     """Verify product button text changed."""
-    # Implementation depends on checking button state
-    # For now, verify cart count changed (button text change correlates)
-    cart_count = context.inventory_page.get_cart_item_count()
-    if button_text == "Remove":
-        assert cart_count > 0, "Product should be in cart (button changed to Remove)"
+    buttons = context.inventory_page.snapshot()["buttons"]
+    assert (
+        button_text in buttons.values()
+    ), f"No product button shows '{button_text}': {buttons}"
 
 
 @then("I should be on the cart page")
@@ -106,18 +106,17 @@ def step_verify_on_cart_page(context):
 @then('I should see "{product_name}" in the cart')
 def step_verify_product_in_cart(context, product_name):
     """Verify specific product is in cart."""
-    page = CartPage(context.driver)
-    assert page.is_product_in_cart(
-        product_name
-    ), f"Product '{product_name}' should be in cart"
+    snapshot = CartPage(context.driver).snapshot()
+    assert (
+        product_name in snapshot["items"]
+    ), f"Product '{product_name}' should be in cart: {snapshot['items']}"
 
 
 @then("the cart should have {count:d} item")
 @then("the cart should have {count:d} items")
 def step_verify_cart_item_count(context, count):
     """Verify number of items in cart."""
-    page = CartPage(context.driver)
-    actual_count = page.get_cart_item_count()
+    actual_count = CartPage(context.driver).snapshot()["item_count"]
     assert (
         actual_count == count
     ), f"Cart should have {count} item(s), but has {actual_count}"
@@ -126,8 +125,7 @@ def step_verify_cart_item_count(context, count):
 @then("the cart should be empty")
 def step_verify_cart_empty(context):
     """Verify cart is empty."""
-    page = CartPage(context.driver)
-    cart_count = page.get_cart_item_count()
+    cart_count = CartPage(context.driver).snapshot()["item_count"]
     assert cart_count == 0, f"Cart should be empty, but has {cart_count} item(s)"
 
 
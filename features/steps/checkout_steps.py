@@ -76,10 +76,18 @@ def step_verify_on_overview_page(context):
 @then('I should see "{product_name}" in the order summary')
 def step_verify_product_in_summary(context, product_name):
     """Verify product appears in order summary."""
+    items = CheckoutStepTwoPage(context.driver).snapshot()["items"]
+    assert (
+        product_name in items
+    ), f"Product '{product_name}' should be in order summary: {items}"
+
+
+@then("I should see these products in the order summary:")
+def step_verify_products_in_summary(context):
+    """Verify all products of the table appear in order summary (one read)."""
     page = CheckoutStepTwoPage(context.driver)
-    assert page.is_product_in_summary(
-        product_name
-    ), f"Product '{product_name}' should be in order summary"
+    missing = page.missing_from_summary(row["product"] for row in context.table)
+    assert not missing, f"Products should be in order summary: {sorted(missing)}"
 
 
 @then("I should see the payment information")
@@ -116,30 +124,32 @@ def step_verify_confirmation_message(context, expected_message):
 @then("the item total should be displayed")
 def step_verify_item_total(context):
     """Verify item total is displayed."""
-    page = CheckoutStepTwoPage(context.driver)
-    item_total = page.get_item_total()
-    assert item_total is not None, "Item total should be displayed"
+    item_total = CheckoutStepTwoPage(context.driver).get_order_summary().subtotal
     assert item_total > 0, "Item total should be greater than 0"
 
 
 @then("the tax should be displayed")
 def step_verify_tax(context):
     """Verify tax is displayed."""
-    page = CheckoutStepTwoPage(context.driver)
-    tax = page.get_tax()
-    assert tax is not None, "Tax should be displayed"
+    tax = CheckoutStepTwoPage(context.driver).get_order_summary().tax
     assert tax >= 0, "Tax should be greater than or equal to 0"
 
 
 @then("the total should be displayed")
 def step_verify_total(context):
     """Verify total is displayed."""
-    page = CheckoutStepTwoPage(context.driver)
-    total = page.get_total()
-    assert total is not None, "Total should be displayed"
+    total = CheckoutStepTwoPage(context.driver).get_order_summary().total
     assert total > 0, "Total should be greater than 0"
 
 
+@then("the order totals should add up")
+def step_verify_order_totals(context):
+    """Verify item total, tax and total against the line items (exact)."""
+    summary = CheckoutStepTwoPage(context.driver).get_order_summary()
+    problems = summary.verify()
+    assert not problems, f"Order totals do not add up: {'; '.join(problems)}"
+
+
 @then('the checkout error should mention "{expected_text}"')
 def step_verify_checkout_error_text(context, expected_text):
     """Verify checkout error message contains expected text."""
@@ -15,16 +15,16 @@ from pages.inventory_page import InventoryPage
 def step_on_login_page(context):
     """Navigate to Sauce Demo login page."""
     base_url = get_base_url(context.config_data)
-    context.driver.get(base_url)
     context.login_page = LoginPage(context.driver)
+    context.login_page.open(base_url)
 
 
 @given('I am logged in as "{username}"')
 def step_logged_in_as_user(context, username):
     """Log in as specific user."""
     base_url = get_base_url(context.config_data)
-    context.driver.get(base_url)
     context.login_page = LoginPage(context.driver)
+    context.login_page.open(base_url)
     context.login_page.login(username, "secret_sauce")
     context.inventory_page = InventoryPage(context.driver)
 
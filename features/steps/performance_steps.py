@@ -0,0 +1,87 @@
+"""Performance budget step definitions.
+
+Implements BDD steps that assert page load and interaction response times
+measured in-browser with the high-resolution performance clock.
+"""
+
+from behave import then
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core.performance import read_interaction_response_ms, read_page_load_ms
+from pages.cart_page import CartPage
+from pages.checkout_complete_page import CheckoutCompletePage
+from pages.checkout_step_one_page import CheckoutStepOnePage
+from pages.checkout_step_two_page import CheckoutStepTwoPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+# Page names used in Gherkin mapped to page objects
+PAGES = {
+    "login": LoginPage,
+    "inventory": InventoryPage,
+    "products": InventoryPage,
+    "cart": CartPage,
+    "checkout information": CheckoutStepOnePage,
+    "checkout overview": CheckoutStepTwoPage,
+    "order confirmation": CheckoutCompletePage,
+}
+
+# Max seconds to wait for the browser to report a timing
+TIMING_WAIT_SECONDS = 10
+
+
+def _wait_for_timing(context, read_timing, description):
+    """Poll the browser until a timing is available.
+
+    Args:
+        context: Behave context.
+        read_timing: Callable taking the driver and returning ms or None.
+        description: What is being measured (for the failure message).
+
+    Returns:
+        Measured time in milliseconds.
+    """
+    try:
+        return WebDriverWait(context.driver, TIMING_WAIT_SECONDS).until(read_timing)
+    except TimeoutException as error:
+        raise AssertionError(
+            f"No in-browser timing available for {description}"
+        ) from error
+
+
+@then("the {page_name} page should load within {budget:d} ms")
+def step_verify_page_load_budget(context, page_name, budget):
+    """Verify a page loaded within its performance budget.
+
+    Args:
+        context: Behave context.
+        page_name: Page name (e.g., 'inventory', 'cart').
+        budget: Maximum load time in milliseconds.
+    """
+    assert page_name in PAGES, f"Unknown page '{page_name}' for performance budget"
+    path = PAGES[page_name].PAGE_PATH
+
+    load_ms = _wait_for_timing(
+        context,
+        lambda driver: read_page_load_ms(driver, path),
+        f"{page_name} page load",
+    )
+    assert (
+        load_ms <= budget
+    ), f"The {page_name} page loaded in {load_ms:.0f} ms, budget is {budget} ms"
+
+
+@then("{action} should respond within {budget:d} ms")
+def step_verify_interaction_budget(context, action, budget):
+    """Verify the last interaction updated the page within its budget.
+
+    Args:
+        context: Behave context.
+        action: Description of the action (e.g., 'adding to cart').
+        budget: Maximum response time in milliseconds.
+    """
+    response_ms = _wait_for_timing(context, read_interaction_response_ms, action)
+    assert (
+        response_ms <= budget
+    ), f"{action.capitalize()} responded in {response_ms:.0f} ms, budget is {budget} ms"
@@ -16,8 +16,8 @@ from pages.inventory_page import InventoryPage
 def step_navigate_to_homepage(context):
     """Navigate to Sauce Demo homepage."""
     base_url = get_base_url(context.config_data)
-    context.driver.get(base_url)
     context.login_page = LoginPage(context.driver)
+    context.login_page.open(base_url)
 
 
 @then("the login page should be displayed")
@@ -35,11 +35,8 @@ def step_verify_sort_name_za_not_sorted(context):
         context: Behave context.
     """
     page = InventoryPage(context.driver)
-    product_names = page.get_product_names()
-    sorted_names = sorted(product_names, reverse=True)
-    assert (
-        product_names != sorted_names
-    ), f"Products are (unexpectedly) sorted Z-A: {product_names}"
+    is_sorted, _ = page.verify_order("name", "desc")
+    assert not is_sorted, "Products are (unexpectedly) sorted Z-A"
 
 
 from pages.cart_page import CartPage
@@ -71,11 +68,8 @@ def step_verify_sort_name_az(context):
         context: Behave context.
     """
     page = InventoryPage(context.driver)
-    product_names = page.get_product_names()
-
-    # Verify names are in alphabetical order
-    sorted_names = sorted(product_names)
-    assert product_names == sorted_names, f"Products not sorted A-Z: {product_names}"
+    is_sorted, pair = page.verify_order("name", "asc")
+    assert is_sorted, f"Products not sorted A-Z: {pair[0]!r} before {pair[1]!r}"
 
 
 @then("products should be sorted by name Z to A")
@@ -86,11 +80,8 @@ def step_verify_sort_name_za(context):
         context: Behave context.
     """
     page = InventoryPage(context.driver)
-    product_names = page.get_product_names()
-
-    # Verify names are in reverse alphabetical order
-    sorted_names = sorted(product_names, reverse=True)
-    assert product_names == sorted_names, f"Products not sorted Z-A: {product_names}"
+    is_sorted, pair = page.verify_order("name", "desc")
+    assert is_sorted, f"Products not sorted Z-A: {pair[0]!r} before {pair[1]!r}"
 
 
 @then("products should be sorted by price low to high")
@@ -101,13 +92,8 @@ def step_verify_sort_price_lohi(context):
         context: Behave context.
     """
     page = InventoryPage(context.driver)
-    product_prices = page.get_product_prices()
-
-    # Verify prices are in ascending order
-    sorted_prices = sorted(product_prices)
-    assert (
-        product_prices == sorted_prices
-    ), f"Products not sorted low-high: {product_prices}"
+    is_sorted, pair = page.verify_order("price", "asc")
+    assert is_sorted, f"Products not sorted low-high: {pair[0]!r} before {pair[1]!r}"
 
 
 @then("products should be sorted by price high to low")
@@ -118,13 +104,8 @@ def step_verify_sort_price_hilo(context):
         context: Behave context.
     """
     page = InventoryPage(context.driver)
-    product_prices = page.get_product_prices()
-
-    # Verify prices are in descending order
-    sorted_prices = sorted(product_prices, reverse=True)
-    assert (
-        product_prices == sorted_prices
-    ), f"Products not sorted high-low: {product_prices}"
+    is_sorted, pair = page.verify_order("price", "desc")
+    assert is_sorted, f"Products not sorted high-low: {pair[0]!r} before {pair[1]!r}"
 
 
 @then('the sort dropdown should show "{option}" as selected')
@@ -2,6 +2,7 @@
 
 from behave import when, then
 
+from core.combinatorial import NO_PRODUCTS
 from pages.cart_page import CartPage
 from pages.checkout_complete_page import CheckoutCompletePage
 from pages.checkout_step_one_page import CheckoutStepOnePage
@@ -132,3 +133,45 @@ def step_click_back_to_products(context):
     """
     page = CheckoutCompletePage(context.driver)
     page.click_back_home()
+
+
+def parse_product_list(products: str) -> list[str]:
+    """Split a comma-separated product column ('none' = empty cart).
+
+    Args:
+        products: Products column of a generated outline.
+
+    Returns:
+        Product names.
+    """
+    if products == NO_PRODUCTS:
+        return []
+    return [name.strip() for name in products.split(",")]
+
+
+@when('I add products "{products}" to the cart')
+def step_add_products_to_cart(context, products):
+    """Add a list of products to the cart (combinatorial outlines).
+
+    Args:
+        context: Behave context.
+        products: Comma-separated product names, or 'none'.
+    """
+    page = InventoryPage(context.driver)
+    for product_name in parse_product_list(products):
+        page.add_product_to_cart(product_name)
+
+
+@then('the order summary should list "{products}"')
+def step_verify_order_summary_lists(context, products):
+    """Verify the order summary lists exactly the given products.
+
+    Args:
+        context: Behave context.
+        products: Comma-separated product names, or 'none'.
+    """
+    items = set(CheckoutStepTwoPage(context.driver).snapshot()["items"])
+    expected = set(parse_product_list(products))
+    assert (
+        items == expected
+    ), f"Order summary should list {sorted(expected)}, but lists {sorted(items)}"
@@ -25,9 +25,11 @@ Feature: Complete Purchase - Multiple User Journeys
       | zip_code   | 90210      |
     And I click continue to review order
     Then I should be on the checkout overview page
-    And I should see "Sauce Labs Backpack" in the order summary
-    And I should see "Sauce Labs Bike Light" in the order summary
-    And I should see "Sauce Labs Bolt T-Shirt" in the order summary
+    And I should see these products in the order summary:
+      | product                 |
+      | Sauce Labs Backpack     |
+      | Sauce Labs Bike Light   |
+      | Sauce Labs Bolt T-Shirt |
     When I click finish to complete order
     Then I should see the order confirmation
     And the confirmation message should be "Thank you for your order!"
@@ -75,7 +77,9 @@ Feature: Complete Purchase - Multiple User Journeys
       | last_name  | Customer   |
       | zip_code   | 33101      |
     And I click continue to review order
-    Then I should see "Sauce Labs Backpack" in the order summary
-    And I should see "Sauce Labs Bike Light" in the order summary
+    Then I should see these products in the order summary:
+      | product               |
+      | Sauce Labs Backpack   |
+      | Sauce Labs Bike Light |
     When I click finish to complete order
     Then I should see the order confirmation
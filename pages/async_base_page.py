@@ -0,0 +1,212 @@
+"""Base asyncio Page Object.
+
+Async counterpart of BasePage for sessions of core/async_driver.py: every
+page method is a coroutine, so one event loop can drive many browser
+sessions concurrently (load generation, bulk data validation) without a
+thread or process per browser. Async page objects inherit from this class
+and reuse the locators and snapshot fields of their blocking page objects.
+"""
+
+import asyncio
+from typing import Any
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from core.async_driver import AsyncElement, AsyncWebDriver
+from pages.base_page import (
+    IN_PAGE_STRATEGIES,
+    SNAPSHOT_SCRIPT,
+    WAIT_AND_ACT_SCRIPT,
+    PageSnapshot,
+)
+
+
+class AsyncBasePage:
+    """Base class for asyncio page objects.
+
+    Mirrors BasePage: explicit waits poll with asyncio.sleep (never
+    blocking the loop) and, with fast_actions, click/type wait and act in
+    one in-page script call.
+    """
+
+    # URL path relative to base_url (overridden by concrete pages)
+    PAGE_PATH = ""
+
+    # Seconds between element polls while waiting
+    POLL_INTERVAL = 0.1
+
+    # Click/type with one in-page wait-and-act script (untrusted events),
+    # as BasePage.fast_actions
+    fast_actions = False
+
+    # Fields captured by snapshot() and the element awaited first (see
+    # BasePage.SNAPSHOT_FIELDS and SNAPSHOT_ANCHOR)
+    SNAPSHOT_FIELDS: dict[str, tuple[str, str]] = {}
+    SNAPSHOT_ANCHOR: tuple[str, str] | None = None
+
+    def __init__(self, driver: AsyncWebDriver, timeout: int = 10):
+        """Initialize base page.
+
+        Args:
+            driver: Async WebDriver session.
+            timeout: Default timeout for waiting operations.
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    async def open(self, base_url: str) -> None:
+        """Navigate to this page.
+
+        Args:
+            base_url: Application base URL.
+        """
+        await self.driver.get(base_url.rstrip("/") + self.PAGE_PATH)
+
+    async def find_element(
+        self, locator: tuple[str, str], clickable: bool = False
+    ) -> AsyncElement:
+        """Find element with explicit wait.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            clickable: Also wait until the element is displayed and enabled.
+
+        Returns:
+            AsyncElement if found.
+
+        Raises:
+            TimeoutException: If element not found within timeout.
+        """
+        deadline = asyncio.get_running_loop().time() + self.timeout
+        while True:
+            elements = await self.driver.find_elements(*locator)
+            if elements:
+                element = elements[0]
+                try:
+                    if not clickable or (
+                        await element.is_displayed() and await element.is_enabled()
+                    ):
+                        return element
+                except StaleElementReferenceException:
+                    pass
+            if asyncio.get_running_loop().time() >= deadline:
+                state = "not clickable" if elements else "not found"
+                raise TimeoutException(
+                    f"Element {locator[0]}={locator[1]} {state} after {self.timeout}s"
+                )
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    async def click(self, locator: tuple[str, str], trusted: bool = False) -> None:
+        """Click element after ensuring it's clickable.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            trusted: Always use a native WebDriver click (trusted event).
+        """
+        if not trusted and await self._wait_and_act(locator, "click"):
+            return
+        element = await self.find_element(locator, clickable=True)
+        await element.click()
+
+    async def type(
+        self, locator: tuple[str, str], text: str, trusted: bool = False
+    ) -> None:
+        """Type text into element using explicit waits.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            text: Text to type.
+            trusted: Always use native WebDriver key events.
+        """
+        if not trusted and await self._wait_and_act(locator, "type", text):
+            return
+        element = await self.find_element(locator, clickable=True)
+        await element.clear()
+        await element.send_keys(text)
+
+    async def get_text(self, locator: tuple[str, str]) -> str:
+        """Get text from element.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+
+        Returns:
+            Text content of element.
+        """
+        element = await self.find_element(locator)
+        return await element.text()
+
+    async def is_element_present(
+        self, locator: tuple[str, str], timeout: int = 3
+    ) -> bool:
+        """Check if element is present on page.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            timeout: Custom timeout for this check.
+
+        Returns:
+            True if element is present, False otherwise.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not await self.driver.find_elements(*locator):
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(self.POLL_INTERVAL)
+        return True
+
+    async def snapshot(self) -> PageSnapshot:
+        """Capture all SNAPSHOT_FIELDS of the page in one script call.
+
+        Unlike BasePage.snapshot the result is not cached: sessions of one
+        loop interleave, so each read reflects the page at that moment. As
+        there, the page is captured once SNAPSHOT_ANCHOR is present.
+
+        Returns:
+            PageSnapshot of the current page state.
+
+        Raises:
+            TimeoutException: If SNAPSHOT_ANCHOR is not found within timeout.
+        """
+        if self.SNAPSHOT_ANCHOR is not None:
+            await self.find_element(self.SNAPSHOT_ANCHOR)
+        fields = {name: list(field) for name, field in self.SNAPSHOT_FIELDS.items()}
+        state = await self.driver.execute_script(SNAPSHOT_SCRIPT, fields)
+        return PageSnapshot(type(self).__name__, state)
+
+    async def _wait_and_act(
+        self, locator: tuple[str, str], action: str, text: str = ""
+    ) -> bool:
+        """Wait for an element and act on it in a single script call.
+
+        Same contract as BasePage._wait_and_act.
+
+        Returns:
+            True if the action was performed in-page.
+
+        Raises:
+            TimeoutException: If the element was missing, hidden or disabled
+                for the whole timeout.
+        """
+        by, value = locator
+        if not self.fast_actions or by not in IN_PAGE_STRATEGIES:
+            return False
+
+        try:
+            result: Any = await self.driver.execute_async_script(
+                WAIT_AND_ACT_SCRIPT, by, value, action, text, self.timeout * 1000
+            )
+        except WebDriverException:
+            return False
+
+        if not isinstance(result, dict) or result.get("state") == "obscured":
+            return False
+        if result["status"] != "done":
+            raise TimeoutException(
+                f"Element {by}={value} {result['state']} after {self.timeout}s"
+            )
+        return True
@@ -0,0 +1,220 @@
+"""Asyncio Page Objects for Sauce Demo.
+
+Async counterparts of the login, inventory, cart and checkout page
+objects (see pages/async_base_page.py). Locators, snapshot fields and
+parsing are taken from the blocking page objects, so both APIs change
+together.
+
+Example (five concurrent checkouts in one event loop):
+    async def checkout(manager, base_url):
+        driver = await manager.new_session()
+        login = AsyncLoginPage(driver)
+        await login.open(base_url)
+        await login.login("standard_user", "secret_sauce")
+        ...
+
+    await asyncio.gather(*(checkout(manager, url) for _ in range(5)))
+"""
+
+from typing import Iterable
+
+from selenium.webdriver.common.by import By
+
+from pages.async_base_page import AsyncBasePage
+from pages.cart_page import CartPage
+from pages.checkout_complete_page import CheckoutCompletePage
+from pages.checkout_step_one_page import CheckoutStepOnePage
+from pages.checkout_step_two_page import CheckoutStepTwoPage, OrderSummary
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Async Page Object for Sauce Demo login form."""
+
+    PAGE_PATH = LoginPage.PAGE_PATH
+    USERNAME_INPUT = LoginPage.USERNAME_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ERROR_MESSAGE = LoginPage.ERROR_MESSAGE
+    SNAPSHOT_FIELDS = LoginPage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = LoginPage.SNAPSHOT_ANCHOR
+
+    async def login(self, username: str, password: str) -> None:
+        """Perform complete login action.
+
+        Args:
+            username: Username to login with.
+            password: Password to login with.
+        """
+        await self.type(self.USERNAME_INPUT, username)
+        await self.type(self.PASSWORD_INPUT, password)
+        await self.click(self.LOGIN_BUTTON)
+
+    async def get_error_message(self) -> str | None:
+        """Get error message if present.
+
+        Returns:
+            Error message text if present, None otherwise.
+        """
+        return (await self.snapshot())["error"]
+
+
+class AsyncInventoryPage(AsyncBasePage):
+    """Async Page Object for Sauce Demo inventory (products) page."""
+
+    PAGE_PATH = InventoryPage.PAGE_PATH
+    INVENTORY_CONTAINER = InventoryPage.INVENTORY_CONTAINER
+    SHOPPING_CART_LINK = InventoryPage.SHOPPING_CART_LINK
+    SNAPSHOT_FIELDS = InventoryPage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = InventoryPage.SNAPSHOT_ANCHOR
+
+    async def is_on_inventory_page(self) -> bool:
+        """Check if user is on inventory page.
+
+        Returns:
+            True if inventory container is present, False otherwise.
+        """
+        return await self.is_element_present(self.INVENTORY_CONTAINER, timeout=3)
+
+    async def add_product_to_cart(self, product_name: str) -> None:
+        """Add specific product to shopping cart by name.
+
+        Args:
+            product_name: Name of product (e.g., 'Sauce Labs Backpack').
+        """
+        button_id = f"add-to-cart-{product_name.lower().replace(' ', '-')}"
+        await self.click((By.ID, button_id))
+
+    async def get_product_names(self) -> list[str]:
+        """Get all product names in display order (one read)."""
+        return (await self.snapshot())["items"]
+
+    async def get_cart_item_count(self) -> int:
+        """Get number shown in cart badge, 0 if no badge present."""
+        return int((await self.snapshot())["badge"] or 0)
+
+    async def click_shopping_cart(self) -> None:
+        """Click shopping cart icon to view cart."""
+        await self.click(self.SHOPPING_CART_LINK)
+
+
+class AsyncCartPage(AsyncBasePage):
+    """Async Page Object for Sauce Demo shopping cart page."""
+
+    PAGE_PATH = CartPage.PAGE_PATH
+    REMOVE_BUTTON_PREFIX = CartPage.REMOVE_BUTTON_PREFIX
+    CHECKOUT_BUTTON = CartPage.CHECKOUT_BUTTON
+    SNAPSHOT_FIELDS = CartPage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = CartPage.SNAPSHOT_ANCHOR
+
+    async def get_cart_product_names(self) -> set[str]:
+        """Get the names of all products in cart (one read)."""
+        return set((await self.snapshot())["items"])
+
+    async def missing_from_cart(self, product_names: Iterable[str]) -> set[str]:
+        """Verify many products against a single read of the cart.
+
+        Args:
+            product_names: Expected product names.
+
+        Returns:
+            Expected names not in the cart (empty if all present).
+        """
+        return set(product_names) - await self.get_cart_product_names()
+
+    async def remove_product(self, product_name: str) -> None:
+        """Remove product from cart by name.
+
+        Args:
+            product_name: Name of product to remove.
+        """
+        button_id = (
+            f"{self.REMOVE_BUTTON_PREFIX}{product_name.lower().replace(' ', '-')}"
+        )
+        await self.click((By.ID, button_id))
+
+    async def click_checkout(self) -> None:
+        """Click Checkout button to proceed to checkout."""
+        await self.click(self.CHECKOUT_BUTTON)
+
+
+class AsyncCheckoutStepOnePage(AsyncBasePage):
+    """Async Page Object for the checkout information form."""
+
+    PAGE_PATH = CheckoutStepOnePage.PAGE_PATH
+    FIRST_NAME_INPUT = CheckoutStepOnePage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = CheckoutStepOnePage.LAST_NAME_INPUT
+    ZIP_CODE_INPUT = CheckoutStepOnePage.ZIP_CODE_INPUT
+    CONTINUE_BUTTON = CheckoutStepOnePage.CONTINUE_BUTTON
+    SNAPSHOT_FIELDS = CheckoutStepOnePage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = CheckoutStepOnePage.SNAPSHOT_ANCHOR
+
+    async def fill_information(
+        self, first_name: str, last_name: str, zip_code: str
+    ) -> None:
+        """Enter the checkout information.
+
+        Args:
+            first_name: Customer first name.
+            last_name: Customer last name.
+            zip_code: Postal code.
+        """
+        await self.type(self.FIRST_NAME_INPUT, first_name)
+        await self.type(self.LAST_NAME_INPUT, last_name)
+        await self.type(self.ZIP_CODE_INPUT, zip_code)
+
+    async def click_continue(self) -> None:
+        """Click Continue button to proceed to order review."""
+        await self.click(self.CONTINUE_BUTTON)
+
+    async def get_error_message(self) -> str | None:
+        """Get validation error message, None if not displayed."""
+        return (await self.snapshot())["error"]
+
+
+class AsyncCheckoutStepTwoPage(AsyncBasePage):
+    """Async Page Object for the checkout overview page."""
+
+    PAGE_PATH = CheckoutStepTwoPage.PAGE_PATH
+    FINISH_BUTTON = CheckoutStepTwoPage.FINISH_BUTTON
+    SNAPSHOT_FIELDS = CheckoutStepTwoPage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = CheckoutStepTwoPage.SNAPSHOT_ANCHOR
+
+    async def get_summary_product_names(self) -> set[str]:
+        """Get the names of all products in the order summary (one read)."""
+        return set((await self.snapshot())["items"])
+
+    async def get_order_summary(self) -> OrderSummary:
+        """Get line-item prices and totals in one read.
+
+        Returns:
+            OrderSummary with exact Decimal amounts.
+
+        Raises:
+            ValueError: If a total label is not displayed.
+        """
+        return OrderSummary.from_snapshot(await self.snapshot())
+
+    async def click_finish(self) -> None:
+        """Click Finish button to complete order."""
+        await self.click(self.FINISH_BUTTON)
+
+
+class AsyncCheckoutCompletePage(AsyncBasePage):
+    """Async Page Object for the order confirmation page."""
+
+    PAGE_PATH = CheckoutCompletePage.PAGE_PATH
+    CHECKOUT_COMPLETE_CONTAINER = CheckoutCompletePage.CHECKOUT_COMPLETE_CONTAINER
+    SNAPSHOT_FIELDS = CheckoutCompletePage.SNAPSHOT_FIELDS
+    SNAPSHOT_ANCHOR = CheckoutCompletePage.SNAPSHOT_ANCHOR
+
+    async def is_on_confirmation_page(self) -> bool:
+        """Check if the order confirmation is displayed."""
+        return await self.is_element_present(
+            self.CHECKOUT_COMPLETE_CONTAINER, timeout=3
+        )
+
+    async def get_confirmation_message(self) -> str | None:
+        """Get the confirmation header (e.g., 'Thank you for your order!')."""
+        return (await self.snapshot())["header"]
@@ -3,10 +3,239 @@
 All page objects should inherit from this base class.
 """
 
+import threading
+from collections import Counter
+from typing import Any, Callable, Iterator, TypeVar
+from weakref import WeakKeyDictionary
+
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+Result = TypeVar("Result")
+
+# Locator strategies the in-page script can resolve
+IN_PAGE_STRATEGIES = (
+    By.ID,
+    By.CSS_SELECTOR,
+    By.XPATH,
+    By.NAME,
+    By.CLASS_NAME,
+    By.TAG_NAME,
+)
+
+# Waits in-page until the element is present, visible, enabled and not
+# covered by another element (after scrolling it to the viewport centre),
+# then clicks it or sets its value. An element otherwise ready but covered
+# for obscuredMs (e.g., by a cookie banner) ends the wait early with
+# 'obscured', leaving the timeout to the native fallback. Re-locates on every poll, so re-renders
+# never leave a stale handle. Typing uses the prototype value setter plus
+# input/change events so React-controlled inputs pick the value up.
+WAIT_AND_ACT_SCRIPT = """
+const [by, value, action, text, timeoutMs, obscuredMs, done] = arguments;
+function find() {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    }
+    return null;
+}
+function state(el) {
+    if (!el) { return 'missing'; }
+    const style = getComputedStyle(el);
+    let rect = el.getBoundingClientRect();
+    if (style.display === 'none' || style.visibility === 'hidden'
+            || rect.width === 0 || rect.height === 0) { return 'hidden'; }
+    if (el.disabled) { return 'disabled'; }
+    el.scrollIntoView({block: 'center', inline: 'center'});
+    rect = el.getBoundingClientRect();
+    const hit = document.elementFromPoint(
+        rect.left + rect.width / 2, rect.top + rect.height / 2);
+    if (!hit || (hit !== el && !el.contains(hit))) { return 'obscured'; }
+    return 'ready';
+}
+const deadline = performance.now() + timeoutMs;
+let coveredSince = null;
+(function attempt() {
+    const el = find();
+    const current = state(el);
+    const now = performance.now();
+    coveredSince = current === 'obscured' ? (coveredSince ?? now) : null;
+    if (current === 'ready') {
+        if (action === 'click') {
+            el.click();
+        } else {
+            el.focus();
+            const setter = Object.getOwnPropertyDescriptor(
+                Object.getPrototypeOf(el), 'value').set;
+            setter.call(el, text);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        done({status: 'done'});
+    } else if (coveredSince !== null && now - coveredSince >= obscuredMs) {
+        done({status: 'obscured', state: current});
+    } else if (now >= deadline) {
+        done({status: 'timeout', state: current});
+    } else {
+        setTimeout(attempt, 50);
+    }
+})();
+"""
+
+
+# Returns the next chunk of list rows not returned yet, read in-page. The
+# cursor lives in the page: the index of the next item, or with rowKey the
+# identities (item attribute) of the rows already returned, so virtualized
+# lists that recycle and reorder elements while scrolling are read
+# correctly. A chunk shorter than chunkSize means every rendered row was
+# returned and ends the stream; with scroll, the last row is first scrolled
+# into view and the script waits for more rows (infinite scroll) before
+# reporting the end. An item without the rowKey attribute ends the stream
+# with an error instead of being merged with other rows.
+STREAM_ITEMS_SCRIPT = """
+const [reset, itemSelector, fields, chunkSize, settleMs, rowKey, scroll, done] = arguments;
+if (reset || !window.__uatStream) {
+    window.__uatStream = {next: 0, seen: new Set()};
+}
+const cursor = window.__uatStream;
+function read(item) {
+    const row = {};
+    for (const [key, [selector, property]] of Object.entries(fields)) {
+        const el = selector ? item.querySelector(selector) : item;
+        row[key] = !el ? null
+            : property === 'textContent' ? el.textContent.trim() : el[property];
+    }
+    return row;
+}
+function nextRows(limit) {
+    const rows = [];
+    const items = document.querySelectorAll(itemSelector);
+    if (!rowKey) {
+        for (; cursor.next < items.length && rows.length < limit; cursor.next++) {
+            rows.push(read(items[cursor.next]));
+        }
+        return rows;
+    }
+    for (const item of items) {
+        const key = item.getAttribute(rowKey);
+        if (key === null) { return null; }
+        if (!cursor.seen.has(key)) {
+            cursor.seen.add(key);
+            rows.push(read(item));
+            if (rows.length === limit) { break; }
+        }
+    }
+    return rows;
+}
+const missingKey = {error: `list item without ${rowKey} attribute`};
+const rows = nextRows(chunkSize);
+if (rows === null) {
+    done(missingKey);
+} else if (rows.length === chunkSize) {
+    done({rows: rows, exhausted: false});
+} else if (!scroll) {
+    done({rows: rows, exhausted: true});
+} else {
+    const items = document.querySelectorAll(itemSelector);
+    if (items.length) { items[items.length - 1].scrollIntoView({block: 'end'}); }
+    const deadline = performance.now() + settleMs;
+    (function poll() {
+        const more = nextRows(chunkSize - rows.length);
+        if (more === null) {
+            done(missingKey);
+        } else if (more.length || performance.now() >= deadline) {
+            done({rows: rows.concat(more), exhausted: more.length === 0});
+        } else {
+            setTimeout(poll, 50);
+        }
+    })();
+}
+"""
+
+# Reads every field of a page object's SNAPSHOT_FIELDS in one call
+SNAPSHOT_SCRIPT = """
+const state = {};
+for (const [name, [selector, kind]] of Object.entries(arguments[0])) {
+    const elements = Array.from(document.querySelectorAll(selector));
+    const texts = elements.map((el) => el.textContent.trim());
+    if (kind === 'count') {
+        state[name] = elements.length;
+    } else if (kind === 'texts') {
+        state[name] = texts;
+    } else if (kind === 'buttons') {
+        state[name] = Object.fromEntries(elements.map((el, i) => [el.id, texts[i]]));
+    } else {
+        state[name] = elements.length ? texts[0] : null;
+    }
+}
+return state;
+"""
+
+# CSS equivalents of locator strategies usable by in-page scripts
+CSS_PREFIXES = {
+    By.CSS_SELECTOR: "",
+    By.TAG_NAME: "",
+    By.CLASS_NAME: ".",
+    By.ID: "#",
+}
+
+
+class PageSnapshot:
+    """Page state read at once, for assertions without further DOM queries.
+
+    Uses OOP pattern as a snapshot is a read-only value object shared by
+    consecutive assertions on the same page.
+    """
+
+    def __init__(self, page: str, fields: dict[str, Any]) -> None:
+        """Initialize snapshot.
+
+        Args:
+            page: Page object class name.
+            fields: Field name to value (see BasePage.SNAPSHOT_FIELDS).
+        """
+        self.page = page
+        self.fields = fields
+
+    def __getitem__(self, name: str) -> Any:
+        """Get a field value."""
+        return self.fields[name]
+
+    def __repr__(self) -> str:
+        """Show page and fields (printed in assertion messages)."""
+        return f"PageSnapshot({self.page}, {self.fields})"
+
+
+class PageState:
+    """Page object state of one driver (browser session or user context).
+
+    Uses OOP pattern as the state is shared by all page objects of one
+    driver and must not leak into other drivers (e.g., of other feature
+    threads).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty state."""
+        # Click/type with one in-page wait-and-act script instead of
+        # WebDriver polling (set from browser.fast_actions)
+        self.fast_actions = False
+        # Snapshots per page object class, until an interaction or a When
+        # step invalidates them
+        self.snapshots: dict[type, PageSnapshot] = {}
+        # Re-locations after StaleElementReferenceException per locator
+        self.stale_relocations: Counter = Counter()
 
 
 class BasePage:
@@ -15,6 +244,35 @@ class BasePage:
     Provides common methods for interacting with web pages.
     """
 
+    # URL path relative to base_url (overridden by concrete pages)
+    PAGE_PATH = ""
+
+    # Attempts of click/type/get_text when the element goes stale
+    STALE_RETRY_ATTEMPTS = 3
+
+    # How long a fast action waits on an element that is ready but covered
+    # before handing over to the native click (which reports the cover)
+    OBSCURED_GRACE_MS = 500
+
+    # Rows per in-page read when streaming long lists, and how long to wait
+    # for more rows to render after scrolling to the end (stream_items with
+    # scroll, for infinite-scroll and virtualized lists)
+    STREAM_CHUNK_SIZE = 500
+    STREAM_SETTLE_MS = 250
+
+    # Fields captured by snapshot(): name -> (CSS selector, kind), where kind
+    # is 'text' (first match or None), 'texts', 'count' or 'buttons' (id ->
+    # text). Overridden by page objects.
+    SNAPSHOT_FIELDS: dict[str, tuple[str, str]] = {}
+
+    # Element that shows the page has rendered: snapshot() waits for it
+    # before capturing. Overridden by page objects.
+    SNAPSHOT_ANCHOR: tuple[str, str] | None = None
+
+    # PageState per driver; drivers of concurrent threads never share one
+    _states: WeakKeyDictionary = WeakKeyDictionary()
+    _states_lock = threading.Lock()
+
     def __init__(self, driver: WebDriver, timeout: int = 10):
         """Initialize base page.
 
@@ -25,6 +283,43 @@ class BasePage:
         self.driver = driver
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        self.state = self.driver_state(driver)
+
+    @staticmethod
+    def driver_state(driver: WebDriver) -> PageState:
+        """Get the page object state of a driver, creating it on first use.
+
+        Args:
+            driver: WebDriver instance (or a user context driver).
+
+        Returns:
+            PageState shared by all page objects of the driver.
+        """
+        with BasePage._states_lock:
+            state = BasePage._states.get(driver)
+            if state is None:
+                state = BasePage._states[driver] = PageState()
+            return state
+
+    @property
+    def fast_actions(self) -> bool:
+        """Whether click/type wait and act in one script call (per driver)."""
+        return self.state.fast_actions
+
+    @fast_actions.setter
+    def fast_actions(self, enabled: bool) -> None:
+        self.state.fast_actions = enabled
+
+    def open(self, base_url: str) -> None:
+        """Navigate to this page.
+
+        Snapshots of the driver are discarded: they describe the old page.
+
+        Args:
+            base_url: Application base URL.
+        """
+        self.invalidate_snapshots()
+        self.driver.get(base_url.rstrip("/") + self.PAGE_PATH)
 
     def find_element(self, locator: tuple[str, str]):
         """Find element with explicit wait.
@@ -54,48 +349,267 @@ class BasePage:
         """
         return self.wait.until(EC.element_to_be_clickable(locator))
 
-    def click(self, locator: tuple[str, str]) -> None:
+    def click(self, locator: tuple[str, str], trusted: bool = False) -> None:
         """Click element after ensuring it's clickable.
 
+        Re-locates the element if it goes stale (re-rendered) before the click.
+        With fast_actions, waits and clicks in one script call instead.
+
         Args:
             locator: Tuple of (By strategy, locator value).
+            trusted: Always use a native WebDriver click (trusted event).
         """
-        element = self.find_clickable_element(locator)
-        element.click()
+        self.invalidate_snapshots()
+        if not trusted and self._wait_and_act(locator, "click"):
+            return
+
+        def click_element() -> None:
+            element = self.find_clickable_element(locator)
+            element.click()
 
-    def type(self, locator: tuple[str, str], text: str) -> None:
+        self._relocate_on_stale(locator, click_element)
+
+    def type(self, locator: tuple[str, str], text: str, trusted: bool = False) -> None:
         """Type text into element using explicit waits.
 
+        Re-locates the element if it goes stale (re-rendered) while typing.
+        With fast_actions, waits and sets the value in one script call instead.
+
         Args:
             locator: Tuple of (By strategy, locator value).
             text: Text to type.
+            trusted: Always use native WebDriver key events.
         """
-        # First wait for element to be clickable
-        element = self.find_clickable_element(locator)
+        self.invalidate_snapshots()
+        if not trusted and self._wait_and_act(locator, "type", text):
+            return
 
-        # Verify element is not obscured using JavaScript
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block: 'center'});", element
-        )
+        def type_into_element() -> None:
+            # First wait for element to be clickable
+            element = self.find_clickable_element(locator)
 
-        # Double-check element is still interactable after scroll
-        self.wait.until(EC.element_to_be_clickable(locator))
+            # Verify element is not obscured using JavaScript
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'});", element
+            )
 
-        # Now safe to interact
-        element.clear()
-        element.send_keys(text)
+            # Double-check element is still interactable after scroll, and
+            # interact with this fresh handle (a re-render may stale the first)
+            element = self.wait.until(EC.element_to_be_clickable(locator))
+            element.clear()
+            element.send_keys(text)
+
+        self._relocate_on_stale(locator, type_into_element)
 
     def get_text(self, locator: tuple[str, str]) -> str:
         """Get text from element.
 
+        Re-locates the element if it goes stale before its text is read.
+
         Args:
             locator: Tuple of (By strategy, locator value).
 
         Returns:
             Text content of element.
         """
-        element = self.find_element(locator)
-        return element.text
+        return self._relocate_on_stale(locator, lambda: self.find_element(locator).text)
+
+    def _wait_and_act(
+        self, locator: tuple[str, str], action: str, text: str = ""
+    ) -> bool:
+        """Wait for an element and act on it in a single script call.
+
+        Falls back (returns False) when fast actions are disabled, the
+        locator strategy is not supported in-page, the driver cannot run the
+        script, or the element stayed covered by another element for
+        OBSCURED_GRACE_MS (the native click then reports what intercepts it,
+        so a covered element does not wait out the timeout twice).
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            action: 'click' or 'type'.
+            text: Text to type.
+
+        Returns:
+            True if the action was performed in-page.
+
+        Raises:
+            TimeoutException: If the element was missing, hidden or disabled
+                for the whole timeout.
+        """
+        by, value = locator
+        if not self.fast_actions or by not in IN_PAGE_STRATEGIES:
+            return False
+
+        try:
+            result = self.driver.execute_async_script(
+                WAIT_AND_ACT_SCRIPT,
+                by,
+                value,
+                action,
+                text,
+                self.timeout * 1000,
+                self.OBSCURED_GRACE_MS,
+            )
+        except WebDriverException:
+            return False  # e.g., script timeout or Content-Security-Policy
+
+        if not isinstance(result, dict) or result.get("state") == "obscured":
+            return False
+        if result["status"] != "done":
+            raise TimeoutException(
+                f"Element {by}={value} {result['state']} after {self.timeout}s"
+            )
+        return True
+
+    def _relocate_on_stale(
+        self, locator: tuple[str, str], action: Callable[[], Result]
+    ) -> Result:
+        """Run an element action, locating the element again if it goes stale.
+
+        Args:
+            locator: Tuple of (By strategy, locator value).
+            action: Function that locates the element and acts on it.
+
+        Returns:
+            Result of the action.
+
+        Raises:
+            StaleElementReferenceException: If the element is still stale
+                after STALE_RETRY_ATTEMPTS attempts.
+        """
+        for attempt in range(1, self.STALE_RETRY_ATTEMPTS + 1):
+            try:
+                return action()
+            except StaleElementReferenceException:
+                if attempt == self.STALE_RETRY_ATTEMPTS:
+                    raise
+                self.state.stale_relocations[locator] += 1
+
+    def stream_items(
+        self,
+        item_locator: tuple[str, str],
+        fields: dict[str, tuple[str, str]],
+        chunk_size: int | None = None,
+        scroll: bool = False,
+        row_key: str | None = None,
+    ) -> Iterator[dict[str, Any]] | None:
+        """Read list rows in chunks with in-page scripts.
+
+        No element handles are created: each chunk is one script call
+        returning up to chunk_size rows of plain values. The stream ends
+        with the first chunk shorter than chunk_size, so a list of fewer
+        rows is read in one call, without scrolling the page.
+
+        Without scrolling, rows are tracked by item position, so rows with
+        equal values (e.g., the same product twice) are all returned.
+        Scrolling lists may recycle and reorder items, so they need an
+        attribute identifying each row (row_key, e.g. 'id' or 'data-id').
+
+        Args:
+            item_locator: Locator of one list item (By.CSS_SELECTOR,
+                By.CLASS_NAME, By.ID or By.TAG_NAME).
+            fields: Row key to (CSS selector inside the item, or '' for the
+                item itself; DOM property, e.g. 'textContent' or 'src').
+            chunk_size: Rows per script call (default STREAM_CHUNK_SIZE).
+            scroll: Scroll to the last row and wait up to STREAM_SETTLE_MS
+                for more rows before ending (infinite-scroll and
+                virtualized lists). Requires row_key.
+            row_key: Item attribute unique per row; rows already returned
+                are skipped by this identity instead of by position.
+
+        Returns:
+            Iterator over rows in display order, or None if the driver cannot
+            run scripts (e.g., HTTP mode) so callers read elements instead.
+
+        Raises:
+            ValueError: If scroll is set without row_key, or an item has no
+                row_key attribute.
+        """
+        if scroll and not row_key:
+            raise ValueError("stream_items with scroll needs a row_key attribute")
+
+        by, value = item_locator
+        arguments = (
+            f"{CSS_PREFIXES[by]}{value}",
+            {key: list(field) for key, field in fields.items()},
+            chunk_size or self.STREAM_CHUNK_SIZE,
+            self.STREAM_SETTLE_MS,
+            row_key,
+            scroll,
+        )
+        try:
+            first = self.driver.execute_async_script(
+                STREAM_ITEMS_SCRIPT, True, *arguments
+            )
+        except WebDriverException:
+            return None
+        if not isinstance(first, dict):
+            return None
+
+        def rows() -> Iterator[dict[str, Any]]:
+            chunk = first
+            while True:
+                if "error" in chunk:
+                    raise ValueError(f"Cannot stream {value}: {chunk['error']}")
+                yield from chunk["rows"]
+                if chunk["exhausted"]:
+                    return
+                chunk = self.driver.execute_async_script(
+                    STREAM_ITEMS_SCRIPT, False, *arguments
+                )
+
+        return rows()
+
+    def snapshot(self) -> PageSnapshot:
+        """Capture all SNAPSHOT_FIELDS of the page in one script call.
+
+        The snapshot is reused by later calls (from any page object of the
+        same class and driver) until invalidate_snapshots is called: on
+        open, every click or type, and before each When step. The page is
+        captured once SNAPSHOT_ANCHOR is present, so a page still rendering
+        after navigation is not cached half-drawn. Drivers without
+        JavaScript (HTTP mode) read the fields from elements.
+
+        Returns:
+            PageSnapshot of the current page state.
+
+        Raises:
+            TimeoutException: If SNAPSHOT_ANCHOR is not found within timeout.
+        """
+        snapshot = self.state.snapshots.get(type(self))
+        if snapshot is None:
+            if self.SNAPSHOT_ANCHOR is not None:
+                self.find_element(self.SNAPSHOT_ANCHOR)
+            fields = {name: list(field) for name, field in self.SNAPSHOT_FIELDS.items()}
+            try:
+                state = self.driver.execute_script(SNAPSHOT_SCRIPT, fields)
+            except WebDriverException:
+                state = None
+            if not isinstance(state, dict):
+                state = {
+                    name: self._read_field(selector, kind)
+                    for name, (selector, kind) in self.SNAPSHOT_FIELDS.items()
+                }
+            snapshot = self.state.snapshots[type(self)] = PageSnapshot(
+                type(self).__name__, state
+            )
+        return snapshot
+
+    def invalidate_snapshots(self) -> None:
+        """Discard all snapshots of the driver (the page may have changed)."""
+        self.state.snapshots.clear()
+
+    def _read_field(self, selector: str, kind: str) -> Any:
+        """Read one snapshot field from elements (see SNAPSHOT_FIELDS)."""
+        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        if kind == "count":
+            return len(elements)
+        if kind == "texts":
+            return [element.text for element in elements]
+        if kind == "buttons":
+            return {element.get_attribute("id"): element.text for element in elements}
+        return elements[0].text if elements else None
 
     def is_element_present(self, locator: tuple[str, str], timeout: int = 3) -> bool:
         """Check if element is present on page.
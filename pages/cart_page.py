@@ -3,6 +3,8 @@
 Represents the shopping cart page.
 """
 
+from typing import Iterable
+
 from selenium.webdriver.common.by import By
 
 from pages.base_page import BasePage
@@ -11,6 +13,9 @@ from pages.base_page import BasePage
 class CartPage(BasePage):
     """Page Object for Sauce Demo shopping cart page."""
 
+    # URL path relative to base_url
+    PAGE_PATH = "/cart.html"
+
     # Locators
     CART_CONTAINER = (By.ID, "cart_contents_container")
     CART_ITEMS = (By.CLASS_NAME, "cart_item")
@@ -19,6 +24,16 @@ class CartPage(BasePage):
     CONTINUE_SHOPPING_BUTTON = (By.ID, "continue-shopping")
     CHECKOUT_BUTTON = (By.ID, "checkout")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {
+        "title": (".title", "text"),
+        "badge": (".shopping_cart_badge", "text"),
+        "items": (".cart_item .inventory_item_name", "texts"),
+        "item_count": (".cart_item", "count"),
+        "buttons": (".cart_item button", "buttons"),
+    }
+    SNAPSHOT_ANCHOR = CART_CONTAINER
+
     def is_on_cart_page(self) -> bool:
         """Check if user is on cart page.
 
@@ -45,11 +60,34 @@ class CartPage(BasePage):
         Returns:
             True if product found in cart, False otherwise.
         """
-        cart_items = self.driver.find_elements(*self.CART_ITEM_NAME)
-        for item in cart_items:
-            if product_name in item.text:
-                return True
-        return False
+        return product_name in self.get_cart_product_names()
+
+    def get_cart_product_names(self) -> set[str]:
+        """Get the names of all products in cart (one read).
+
+        Names are streamed with in-page scripts when the driver supports
+        them, without one WebDriver call per item.
+
+        Returns:
+            Set of product names, a snapshot of the cart.
+        """
+        rows = self.stream_items(
+            self.CART_ITEMS, {"name": (".inventory_item_name", "textContent")}
+        )
+        if rows is not None:
+            return {row["name"] for row in rows}
+        return {item.text for item in self.driver.find_elements(*self.CART_ITEM_NAME)}
+
+    def missing_from_cart(self, product_names: Iterable[str]) -> set[str]:
+        """Verify many products against a single read of the cart.
+
+        Args:
+            product_names: Expected product names.
+
+        Returns:
+            Expected names not in the cart (empty if all present).
+        """
+        return set(product_names) - self.get_cart_product_names()
 
     def remove_product(self, product_name: str) -> None:
         """Remove product from cart by name.
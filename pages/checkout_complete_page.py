@@ -11,6 +11,9 @@ from pages.base_page import BasePage
 class CheckoutCompletePage(BasePage):
     """Page Object for Sauce Demo checkout complete (confirmation) page."""
 
+    # URL path relative to base_url
+    PAGE_PATH = "/checkout-complete.html"
+
     # Locators
     CHECKOUT_COMPLETE_CONTAINER = (By.ID, "checkout_complete_container")
     COMPLETE_HEADER = (By.CLASS_NAME, "complete-header")
@@ -18,6 +21,14 @@ class CheckoutCompletePage(BasePage):
     BACK_HOME_BUTTON = (By.ID, "back-to-products")
     PONY_EXPRESS_IMAGE = (By.CLASS_NAME, "pony_express")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {
+        "title": (".title", "text"),
+        "header": (".complete-header", "text"),
+        "text": (".complete-text", "text"),
+    }
+    SNAPSHOT_ANCHOR = CHECKOUT_COMPLETE_CONTAINER
+
     def is_on_confirmation_page(self) -> bool:
         """Check if user is on order confirmation page.
 
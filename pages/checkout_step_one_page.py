@@ -11,6 +11,9 @@ from pages.base_page import BasePage
 class CheckoutStepOnePage(BasePage):
     """Page Object for Sauce Demo checkout step one (customer information)."""
 
+    # URL path relative to base_url
+    PAGE_PATH = "/checkout-step-one.html"
+
     # Locators
     CHECKOUT_INFO_CONTAINER = (By.CLASS_NAME, "checkout_info")
     FIRST_NAME_INPUT = (By.ID, "first-name")
@@ -20,6 +23,13 @@ class CheckoutStepOnePage(BasePage):
     CANCEL_BUTTON = (By.ID, "cancel")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {
+        "title": (".title", "text"),
+        "error": ("[data-test='error']", "text"),
+    }
+    SNAPSHOT_ANCHOR = CHECKOUT_INFO_CONTAINER
+
     def is_on_checkout_form(self) -> bool:
         """Check if user is on checkout form page.
 
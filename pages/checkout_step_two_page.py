@@ -3,14 +3,143 @@
 Represents the checkout overview page with order summary.
 """
 
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable
+
 from selenium.webdriver.common.by import By
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, PageSnapshot
+
+# Sauce Demo tax rate applied to the item total
+TAX_RATE = Decimal("0.08")
+
+CENT = Decimal("0.01")
+
+
+def parse_amount(text: str) -> Decimal:
+    """Parse the dollar amount of a summary label exactly.
+
+    Args:
+        text: Label text (e.g., 'Item total: $29.99' or '$7.99').
+
+    Returns:
+        Amount as Decimal.
+
+    Examples:
+        >>> parse_amount("Tax: $2.40")
+        Decimal('2.40')
+        >>> parse_amount("Total: $1,032.39")
+        Decimal('1032.39')
+    """
+    return Decimal(text.split("$")[1].replace(",", "").strip())
+
+
+class OrderSummary:
+    """Line-item prices and totals of the checkout overview, as Decimal.
+
+    Uses OOP pattern as the summary is a value object read once and
+    checked by several assertions.
+    """
+
+    def __init__(
+        self,
+        prices: list[Decimal],
+        quantities: list[int],
+        subtotal: Decimal,
+        tax: Decimal,
+        total: Decimal,
+    ) -> None:
+        """Initialize summary.
+
+        Args:
+            prices: Unit price of each line item.
+            quantities: Quantity of each line item.
+            subtotal: Displayed item total.
+            tax: Displayed tax.
+            total: Displayed total.
+        """
+        self.prices = prices
+        self.quantities = quantities
+        self.subtotal = subtotal
+        self.tax = tax
+        self.total = total
+
+    @classmethod
+    def from_snapshot(cls, snapshot: PageSnapshot) -> "OrderSummary":
+        """Parse the summary from a checkout overview snapshot.
+
+        Args:
+            snapshot: Snapshot with CheckoutStepTwoPage.SNAPSHOT_FIELDS.
+
+        Returns:
+            OrderSummary with exact Decimal amounts.
+
+        Raises:
+            ValueError: If a total label is not displayed.
+        """
+        for label in ("subtotal", "tax", "total"):
+            if snapshot[label] is None:
+                raise ValueError(f"Order summary has no {label} label")
+        return cls(
+            prices=[parse_amount(price) for price in snapshot["prices"]],
+            quantities=[int(quantity) for quantity in snapshot["quantities"]],
+            subtotal=parse_amount(snapshot["subtotal"]),
+            tax=parse_amount(snapshot["tax"]),
+            total=parse_amount(snapshot["total"]),
+        )
+
+    def verify(self, tax_rate: Decimal = TAX_RATE) -> list[str]:
+        """Recompute the totals from the line items.
+
+        Tax is the subtotal times the rate, rounded half up to cents.
+
+        Args:
+            tax_rate: Expected tax rate.
+
+        Returns:
+            One message per mismatch (empty if the totals are consistent).
+
+        Examples:
+            >>> summary = OrderSummary(
+            ...     [Decimal("29.99"), Decimal("9.99")], [1, 1],
+            ...     Decimal("39.98"), Decimal("3.20"), Decimal("43.18"),
+            ... )
+            >>> summary.verify()
+            []
+            >>> summary.tax, summary.total = Decimal("3.19"), Decimal("43.17")
+            >>> summary.verify()
+            ['tax $3.19 != $3.20 (8.00% of $39.98)']
+        """
+        problems = []
+        subtotal = sum(
+            (price * quantity for price, quantity in zip(self.prices, self.quantities)),
+            Decimal("0"),
+        )
+        if self.subtotal != subtotal:
+            problems.append(
+                f"item total ${self.subtotal} != ${subtotal} "
+                f"(sum of {len(self.prices)} line item(s))"
+            )
+
+        tax = (self.subtotal * tax_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+        if self.tax != tax:
+            problems.append(
+                f"tax ${self.tax} != ${tax} ({tax_rate * 100:.2f}% of ${self.subtotal})"
+            )
+
+        if self.total != self.subtotal + self.tax:
+            problems.append(
+                f"total ${self.total} != ${self.subtotal + self.tax} (item total + tax)"
+            )
+        return problems
 
 
 class CheckoutStepTwoPage(BasePage):
     """Page Object for Sauce Demo checkout step two (order overview)."""
 
+    # URL path relative to base_url
+    PAGE_PATH = "/checkout-step-two.html"
+
     # Locators
     CHECKOUT_SUMMARY_CONTAINER = (By.ID, "checkout_summary_container")
     CART_ITEMS = (By.CLASS_NAME, "cart_item")
@@ -23,6 +152,18 @@ class CheckoutStepTwoPage(BasePage):
     FINISH_BUTTON = (By.ID, "finish")
     CANCEL_BUTTON = (By.ID, "cancel")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {
+        "title": (".title", "text"),
+        "items": (".cart_item .inventory_item_name", "texts"),
+        "prices": (".cart_item .inventory_item_price", "texts"),
+        "quantities": (".cart_item .cart_quantity", "texts"),
+        "subtotal": (".summary_subtotal_label", "text"),
+        "tax": (".summary_tax_label", "text"),
+        "total": (".summary_total_label", "text"),
+    }
+    SNAPSHOT_ANCHOR = CHECKOUT_SUMMARY_CONTAINER
+
     def is_on_checkout_overview_page(self) -> bool:
         """Check if user is on checkout overview page.
 
@@ -40,11 +181,31 @@ class CheckoutStepTwoPage(BasePage):
         Returns:
             True if product found in summary, False otherwise.
         """
-        item_names = self.driver.find_elements(*self.ITEM_NAME)
-        for item in item_names:
-            if product_name in item.text:
-                return True
-        return False
+        return product_name in self.get_summary_product_names()
+
+    def get_summary_product_names(self) -> set[str]:
+        """Get the names of all products in the order summary (one read).
+
+        Returns:
+            Set of product names, a snapshot of the summary.
+        """
+        rows = self.stream_items(
+            self.CART_ITEMS, {"name": (".inventory_item_name", "textContent")}
+        )
+        if rows is not None:
+            return {row["name"] for row in rows}
+        return {item.text for item in self.driver.find_elements(*self.ITEM_NAME)}
+
+    def missing_from_summary(self, product_names: Iterable[str]) -> set[str]:
+        """Verify many products against a single read of the summary.
+
+        Args:
+            product_names: Expected product names.
+
+        Returns:
+            Expected names not in the summary (empty if all present).
+        """
+        return set(product_names) - self.get_summary_product_names()
 
     def is_payment_info_displayed(self) -> bool:
         """Check if payment information is displayed.
@@ -62,6 +223,17 @@ class CheckoutStepTwoPage(BasePage):
         """
         return self.is_element_present(self.SHIPPING_INFO, timeout=2)
 
+    def get_order_summary(self) -> OrderSummary:
+        """Get line-item prices and totals in one read (page snapshot).
+
+        Returns:
+            OrderSummary with exact Decimal amounts.
+
+        Raises:
+            ValueError: If a total label is not displayed.
+        """
+        return OrderSummary.from_snapshot(self.snapshot())
+
     def get_item_total(self) -> float:
         """Get item subtotal from order summary.
 
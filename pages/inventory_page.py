@@ -3,15 +3,60 @@
 Represents the products/inventory page after successful login.
 """
 
+from typing import Any, Iterator
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
 
 from pages.base_page import BasePage
 
+# Checks the order of the elements with a class name in the page and
+# returns only the verdict and the first out-of-order pair. Names compare
+# by UTF-16 code units (Python's sorted() order for catalog names).
+VERIFY_ORDER_SCRIPT = """
+const [className, key, descending] = arguments;
+const values = Array.from(document.getElementsByClassName(className), (el) =>
+    key === 'price' ? parseFloat(el.textContent.replace('$', '')) : el.textContent.trim());
+for (let i = 1; i < values.length; i++) {
+    const [previous, current] = [values[i - 1], values[i]];
+    if (descending ? previous < current : previous > current) {
+        return {sorted: false, pair: [previous, current]};
+    }
+}
+return {sorted: true, pair: null};
+"""
+
+
+def first_out_of_order(
+    values: list[Any], descending: bool = False
+) -> tuple[Any, Any] | None:
+    """Find the first adjacent pair that breaks an order.
+
+    Args:
+        values: Values in display order.
+        descending: Check descending instead of ascending order.
+
+    Returns:
+        First out-of-order (previous, current) pair, or None if ordered.
+
+    Examples:
+        >>> first_out_of_order([7.99, 9.99, 8.99])
+        (9.99, 8.99)
+        >>> first_out_of_order(["b", "a"], descending=True) is None
+        True
+    """
+    for previous, current in zip(values, values[1:]):
+        if (previous < current) if descending else (previous > current):
+            return previous, current
+    return None
+
 
 class InventoryPage(BasePage):
     """Page Object for Sauce Demo inventory (products) page."""
 
+    # Name -> product index built on first use (see index_products)
+    _product_index: dict[str, dict[str, Any]] | None = None
+
     def remove_product_from_cart(self, product_name: str) -> None:
         """Remove specific product from shopping cart by name.
 
@@ -28,6 +73,19 @@ class InventoryPage(BasePage):
         # 3. Click 'Continue Shopping' to return to inventory
         cart_page.click_continue_shopping()
 
+    # URL path relative to base_url
+    PAGE_PATH = "/inventory.html"
+
+    # Sauce Demo catalog (in A to Z order)
+    PRODUCT_NAMES = (
+        "Sauce Labs Backpack",
+        "Sauce Labs Bike Light",
+        "Sauce Labs Bolt T-Shirt",
+        "Sauce Labs Fleece Jacket",
+        "Sauce Labs Onesie",
+        "Test.allTheThings() T-Shirt (Red)",
+    )
+
     # Locators
     INVENTORY_CONTAINER = (By.ID, "inventory_container")
     INVENTORY_ITEMS = (By.CLASS_NAME, "inventory_item")
@@ -40,6 +98,26 @@ class InventoryPage(BasePage):
     LOGOUT_LINK = (By.ID, "logout_sidebar_link")
     SORT_DROPDOWN = (By.CLASS_NAME, "product_sort_container")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {
+        "title": (".title", "text"),
+        "badge": (".shopping_cart_badge", "text"),
+        "items": (".inventory_item_name", "texts"),
+        "buttons": (".inventory_item button", "buttons"),
+    }
+    SNAPSHOT_ANCHOR = INVENTORY_CONTAINER
+
+    # Sort keys for verify_order
+    SORT_KEYS = {"name": INVENTORY_ITEM_NAME, "price": INVENTORY_ITEM_PRICE}
+    SORT_DIRECTIONS = ("asc", "desc")
+
+    # Fields read per product by stream_items
+    PRODUCT_FIELDS = {
+        "name": (".inventory_item_name", "textContent"),
+        "price": (".inventory_item_price", "textContent"),
+        "image": (".inventory_item_img img", "src"),
+    }
+
     def is_on_inventory_page(self) -> bool:
         """Check if user is on inventory page.
 
@@ -103,6 +181,7 @@ class InventoryPage(BasePage):
         Args:
             option: Sort option value (az, za, lohi, hilo).
         """
+        self.invalidate_snapshots()
         dropdown_element = self.find_clickable_element(self.SORT_DROPDOWN)
         select = Select(dropdown_element)
         select.select_by_value(option)
@@ -113,6 +192,10 @@ class InventoryPage(BasePage):
         Returns:
             List of product names in display order.
         """
+        rows = self._stream_products("name")
+        if rows is not None:
+            return [row["name"] for row in rows]
+
         name_elements = self.driver.find_elements(*self.INVENTORY_ITEM_NAME)
         return [element.text for element in name_elements]
 
@@ -122,9 +205,50 @@ class InventoryPage(BasePage):
         Returns:
             List of product prices in display order as floats.
         """
+        rows = self._stream_products("name", "price")
+        if rows is not None:
+            return [float(row["price"].replace("$", "")) for row in rows]
+
         price_elements = self.driver.find_elements(*self.INVENTORY_ITEM_PRICE)
         return [float(element.text.replace("$", "")) for element in price_elements]
 
+    def verify_order(
+        self, key: str, direction: str = "asc"
+    ) -> tuple[bool, tuple[Any, Any] | None]:
+        """Check the product order inside the page in one script call.
+
+        Only the verdict and the first out-of-order pair cross the wire, so
+        the cost does not grow with the catalog size. Drivers without
+        JavaScript (HTTP mode) read the values and check them locally.
+
+        Args:
+            key: 'name' or 'price'.
+            direction: 'asc' or 'desc'.
+
+        Returns:
+            Tuple of (is ordered, first out-of-order pair or None).
+
+        Raises:
+            ValueError: If key or direction is not supported.
+        """
+        if key not in self.SORT_KEYS or direction not in self.SORT_DIRECTIONS:
+            raise ValueError(f"Unsupported sort order: {key} {direction}")
+
+        descending = direction == "desc"
+        _, class_name = self.SORT_KEYS[key]
+        result = self.driver.execute_script(
+            VERIFY_ORDER_SCRIPT, class_name, key, descending
+        )
+        if isinstance(result, dict):
+            pair = result["pair"]
+            return result["sorted"], None if pair is None else tuple(pair)
+
+        values = (
+            self.get_product_names() if key == "name" else self.get_product_prices()
+        )
+        pair = first_out_of_order(values, descending)
+        return pair is None, pair
+
     def get_current_sort_option(self) -> str:
         """Get currently selected sort option from dropdown.
 
@@ -137,11 +261,60 @@ class InventoryPage(BasePage):
 
     def are_product_images_broken(self) -> bool:
         """Retorna True se todas as imagens de produto estiverem quebradas (src = sl-404)."""
+        rows = self._stream_products("name", "image")
+        if rows is not None:
+            sources = [row["image"] for row in rows if row["image"] is not None]
+            return bool(sources) and all("sl-404" in src for src in sources)
+
         images = self.driver.find_elements(By.CSS_SELECTOR, ".inventory_item_img img")
         if not images:
             return False
         return all("sl-404" in img.get_attribute("src") for img in images)
 
+    def index_products(self) -> dict[str, dict[str, Any]]:
+        """Build a name -> product index for O(1) lookups.
+
+        The index is built once per page object (one streamed read) and
+        reused by has_product; create a new page object after the catalog
+        changes.
+
+        Returns:
+            Product name to {'name', 'price', 'image'} (price as float).
+        """
+        if self._product_index is None:
+            rows = self._stream_products(*self.PRODUCT_FIELDS)
+            if rows is None:
+                rows = (
+                    {"name": name, "price": price, "image": None}
+                    for name, price in zip(
+                        self.get_product_names(), self.get_product_prices()
+                    )
+                )
+            self._product_index = {}
+            for row in rows:
+                if isinstance(row["price"], str):
+                    row["price"] = float(row["price"].replace("$", ""))
+                self._product_index[row["name"]] = row
+        return self._product_index
+
+    def has_product(self, product_name: str) -> bool:
+        """Check if a product is listed (indexed lookup).
+
+        Args:
+            product_name: Exact product name.
+
+        Returns:
+            True if the product is in the catalog.
+        """
+        return product_name in self.index_products()
+
+    def _stream_products(self, *fields: str) -> Iterator[dict[str, Any]] | None:
+        """Stream the given PRODUCT_FIELDS of every product (see stream_items)."""
+        return self.stream_items(
+            self.INVENTORY_ITEMS,
+            {field: self.PRODUCT_FIELDS[field] for field in fields},
+        )
+
     def get_sort_dropdown_options(self) -> list[str]:
         """Get all available sort options from dropdown.
 
@@ -11,12 +11,19 @@ from pages.base_page import BasePage
 class LoginPage(BasePage):
     """Page Object for Sauce Demo login form."""
 
+    # URL path relative to base_url
+    PAGE_PATH = "/"
+
     # Locators
     USERNAME_INPUT = (By.ID, "user-name")
     PASSWORD_INPUT = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
 
+    # Fields captured by snapshot()
+    SNAPSHOT_FIELDS = {"error": ("[data-test='error']", "text")}
+    SNAPSHOT_ANCHOR = LOGIN_BUTTON
+
     def enter_username(self, username: str) -> None:
         """Enter username into login form.
 
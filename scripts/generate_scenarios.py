@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Generate combinatorial cart/checkout scenarios.
+
+Expands catalog product subsets x users x checkout data (combinatorial
+section of config.yaml) into a covering set of cases (pairwise by
+default) and writes them as a Behave scenario outline. The same cases run
+as pytest parametrizations in
+tests/integration/test_checkout_combinations_integration.py.
+
+Usage:
+    poetry run python scripts/generate_scenarios.py
+    poetry run python scripts/generate_scenarios.py --strength 3
+    poetry run behave features/generated/
+
+Exit code 0 = feature written
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.combinatorial import checkout_combinations, render_outline  # noqa: E402
+from core.config import get_combinatorial_config, load_config  # noqa: E402
+from pages.inventory_page import InventoryPage  # noqa: E402
+
+DEFAULT_OUTPUT = "features/generated/checkout_combinations.feature"
+
+
+def main() -> int:
+    """Write the generated feature."""
+    combinatorial_config = get_combinatorial_config(load_config("config.yaml"))
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--strength",
+        type=int,
+        default=combinatorial_config.get("strength", 2),
+        help="Covering strength (2 = pairwise)",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Feature file path")
+    args = parser.parse_args()
+
+    cases = checkout_combinations(
+        list(InventoryPage.PRODUCT_NAMES),
+        combinatorial_config.get("users"),
+        combinatorial_config.get("checkout_data"),
+        args.strength,
+    )
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(render_outline(cases, args.strength), encoding="utf-8")
+
+    full_product = (
+        2 ** len(InventoryPage.PRODUCT_NAMES)
+        * len(combinatorial_config.get("users") or [None])
+        * len(combinatorial_config.get("checkout_data") or [None])
+    )
+    print(f"{len(cases)} scenarios (of {full_product} combinations) -> {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Run Behave with the framework runner (core/runner.py).
+
+Drop-in replacement for ``behave``: all arguments are passed through.
+Unchanged .feature files are loaded from .uat_cache/ instead of being
+re-parsed, steps are resolved through the step matcher index, and steps
+matched by several definitions are reported before the run.
+
+Ordering options (shortcuts for -Dtest_order / -Dfail_fast_after):
+    --test-order POLICY   none, failed, flaky or shortest (see core/history.py)
+    --fail-fast-after N   stop after N failed scenarios
+
+Usage:
+    poetry run python scripts/run_behave.py --tags=@smoke
+    poetry run python scripts/run_behave.py --dry-run
+    poetry run python scripts/run_behave.py --test-order failed --fail-fast-after 1
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from behave.__main__ import main as behave_main  # noqa: E402
+
+from core.runner import RUNNER_CLASS_NAME  # noqa: E402
+
+
+def behave_args(argv: list[str]) -> list[str]:
+    """Translate framework options into Behave arguments.
+
+    Args:
+        argv: Command line arguments.
+
+    Returns:
+        Behave arguments, starting with the framework runner.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--test-order")
+    parser.add_argument("--fail-fast-after")
+    options, passthrough = parser.parse_known_args(argv)
+
+    # An explicit --runner on the command line still takes precedence
+    args = [f"--runner={RUNNER_CLASS_NAME}"]
+    if options.test_order is not None:
+        args.append(f"-Dtest_order={options.test_order}")
+    if options.fail_fast_after is not None:
+        args.append(f"-Dfail_fast_after={options.fail_fast_after}")
+    return [*args, *passthrough]
+
+
+if __name__ == "__main__":
+    sys.exit(behave_main(behave_args(sys.argv[1:])))
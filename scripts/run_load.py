@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Load test the pages of the Behave user journeys.
+
+Reuses the UAT journey features: each scenario is converted into the
+sequence of pages it visits, which concurrent HTTP-level virtual users
+request (GET only: login, cart and checkout actions are not replayed, the
+app renders in the browser), while a small pool of real browsers runs the
+same scenarios end to end. Results are printed and written as JSON.
+
+The target must be a local host (localhost, 127.0.0.1, ...); pass
+--allow-remote to load test a remote host you own.
+
+Usage:
+    poetry run python scripts/run_load.py --base-url http://localhost:8000
+    poetry run python scripts/run_load.py --base-url https://staging.example.com --allow-remote --users 50
+
+Exit code 0 = no errors
+Exit code 1 = HTTP errors or failed browser samples
+Exit code 2 = remote target without --allow-remote
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.config import get_base_url, get_load_config, load_config  # noqa: E402
+from core.load import (  # noqa: E402
+    build_journeys,
+    check_load_target,
+    run_browser_samples,
+    run_http_load,
+)
+from pages.cart_page import CartPage  # noqa: E402
+from pages.checkout_complete_page import CheckoutCompletePage  # noqa: E402
+from pages.checkout_step_one_page import CheckoutStepOnePage  # noqa: E402
+from pages.checkout_step_two_page import CheckoutStepTwoPage  # noqa: E402
+from pages.inventory_page import InventoryPage  # noqa: E402
+from pages.login_page import LoginPage  # noqa: E402
+
+# Step text patterns mapped to the page each step lands on (first match wins)
+JOURNEY_ROUTES = [
+    (r"login page|homepage", LoginPage.PAGE_PATH),
+    (r"shopping cart icon|cart page", CartPage.PAGE_PATH),
+    (
+        r'proceed to checkout|checkout button|click "checkout"'
+        r"|checkout information page",
+        CheckoutStepOnePage.PAGE_PATH,
+    ),
+    (
+        r"continue to review order|click continue$|checkout overview",
+        CheckoutStepTwoPage.PAGE_PATH,
+    ),
+    (r"finish|order confirmation", CheckoutCompletePage.PAGE_PATH),
+    (
+        r"^I login with|logged in as|inventory page|products page|back to products"
+        r"|continue shopping",
+        InventoryPage.PAGE_PATH,
+    ),
+]
+
+
+def parse_args(load_config_data: dict, default_base_url: str) -> argparse.Namespace:
+    """Parse command line options (defaults come from config.yaml)."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=default_base_url)
+    parser.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="Allow load against a non-local host (only hosts you own)",
+    )
+    parser.add_argument("--users", type=int, default=load_config_data.get("users", 10))
+    parser.add_argument(
+        "--iterations", type=int, default=load_config_data.get("iterations", 5)
+    )
+    parser.add_argument(
+        "--browser-samples",
+        type=int,
+        default=load_config_data.get("browser_samples", 1),
+    )
+    parser.add_argument(
+        "--browser-pool", type=int, default=load_config_data.get("browser_pool", 2)
+    )
+    parser.add_argument(
+        "--report", default=load_config_data.get("report_path", "reports/load.json")
+    )
+    parser.add_argument(
+        "features", nargs="*", default=load_config_data.get("features", [])
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the load test and write the report."""
+    config = load_config("config.yaml")
+    load_config_data = get_load_config(config)
+    args = parse_args(load_config_data, get_base_url(config))
+    base_url = args.base_url.rstrip("/")
+    try:
+        check_load_target(base_url, args.allow_remote)
+    except ValueError as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    journeys = build_journeys(args.features, JOURNEY_ROUTES)
+    print(f"Requesting the pages of {len(journeys)} journeys at {base_url}")
+
+    report = {
+        "base_url": base_url,
+        "users": args.users,
+        "iterations": args.iterations,
+        "http": run_http_load(
+            base_url,
+            journeys,
+            args.users,
+            args.iterations,
+            load_config_data.get("request_timeout", 10),
+        ),
+    }
+    if args.browser_samples > 0:
+        report["browser"] = run_browser_samples(
+            journeys, base_url, args.browser_samples, args.browser_pool
+        )
+
+    http = report["http"]
+    print(
+        f"HTTP: {http['requests']} requests, {http['throughput_rps']} req/s, "
+        f"p50={http['latency_ms']['p50']} ms, p95={http['latency_ms']['p95']} ms, "
+        f"p99={http['latency_ms']['p99']} ms, error rate={http['error_rate']:.2%}"
+    )
+    if "browser" in report:
+        browser = report["browser"]
+        print(
+            f"Browser: {browser['runs']} runs, {browser['failures']} failed, "
+            f"p50={browser['duration_s']['p50']} s, "
+            f"p95={browser['duration_s']['p95']} s"
+        )
+
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written to {report_path}")
+
+    failed = http["errors"] > 0 or report.get("browser", {}).get("failures", 0) > 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
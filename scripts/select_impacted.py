@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Select the scenarios and tests affected by a change.
+
+Reads the impact map recorded by traced runs (-Dcapture_impact=true for
+Behave, --capture-impact for pytest) and the git diff against a base
+revision, then prints the affected Behave scenario locations or pytest
+node ids, one per line. When a change affects everything of a kind (e.g.
+features/environment.py or config.yaml), the test root is printed instead.
+Edited .feature files and test modules are selected whole.
+
+When nothing is affected, nothing is printed and the exit code is 2:
+check it before running, since ``behave`` or ``pytest`` without arguments
+would run the full suite.
+
+Usage:
+    poetry run python scripts/select_impacted.py --base origin/master
+    ids=$(poetry run python scripts/select_impacted.py --behave) && poetry run behave $ids
+    ids=$(poetry run python scripts/select_impacted.py --pytest) && poetry run pytest $ids
+
+Exit code 0 = selection printed
+Exit code 1 = no impact map recorded yet
+Exit code 2 = no scenario or test affected
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.config import get_impact_config, load_config  # noqa: E402
+from core.impact import git_changes, load_impact_map, select_impacted  # noqa: E402
+
+# Printed instead of individual ids when everything must run
+TEST_ROOTS = {"behave": "features", "pytest": "tests"}
+
+# Exit code when no scenario or test is affected
+NOTHING_SELECTED = 2
+
+
+def main() -> int:
+    """Print the impacted selection."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="HEAD", help="Revision to diff against")
+    kind_group = parser.add_mutually_exclusive_group()
+    kind_group.add_argument(
+        "--behave", action="store_const", const="behave", dest="kind"
+    )
+    kind_group.add_argument(
+        "--pytest", action="store_const", const="pytest", dest="kind"
+    )
+    args = parser.parse_args()
+
+    impact_config = get_impact_config(load_config("config.yaml"))
+    map_path = impact_config.get("map_path", ".uat_cache/impact_map.json")
+    if not Path(map_path).exists():
+        print(
+            f"ERROR: No impact map at {map_path}. Run a traced baseline first "
+            "(-Dcapture_impact=true / --capture-impact).",
+            file=sys.stderr,
+        )
+        return 1
+
+    selection = select_impacted(load_impact_map(map_path), git_changes(args.base))
+
+    selected = 0
+    for kind in [args.kind] if args.kind else ["behave", "pytest"]:
+        ids = [TEST_ROOTS[kind]] if kind in selection["run_all"] else selection[kind]
+        print(f"# {kind}: {len(ids)} selected", file=sys.stderr)
+        if ids:
+            print("\n".join(ids))
+        selected += len(ids)
+    return 0 if selected else NOTHING_SELECTED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,56 +6,135 @@ This pre-commit hook ensures documentation accuracy by checking:
 - E2E scenario counts (via behave)
 - Coverage statements (via coverage.xml)
 
+Counts are collected through a pytest subprocess and the Behave parser and
+cached by a hash of tests/, features/ and the core/ and pages/ modules
+they import, so unchanged trees validate without re-collecting.
+
 Exit code 0 = metrics are accurate
 Exit code 1 = metrics need updating
 """
 
+import hashlib
+import json
 import re
 import subprocess
 import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Collected counts are cached until tests/, features/, pytest config or the
+# framework modules imported during collection (conftest, step modules) change
+CACHE_PATH = Path(".uat_cache/readme_metrics.json")
+FINGERPRINT_PATHS = ("tests", "features", "core", "pages", "pyproject.toml")
+
+
+def tree_fingerprint(paths: tuple[str, ...] = FINGERPRINT_PATHS) -> str:
+    """Hash file names and contents under the given paths.
+
+    Args:
+        paths: Files or directories that determine the collected counts.
+
+    Returns:
+        Hex digest that changes whenever any relevant file changes.
+    """
+    digest = hashlib.sha256()
+    for root in paths:
+        root_path = Path(root)
+        files = sorted(root_path.rglob("*")) if root_path.is_dir() else [root_path]
+        for file in files:
+            if file.is_file() and "__pycache__" not in file.parts:
+                digest.update(file.as_posix().encode("utf-8") + b"\0")
+                digest.update(file.read_bytes())
+    return digest.hexdigest()
+
 
 def get_pytest_count() -> int:
-    """Get total count of unit/integration tests."""
+    """Get total count of unit/integration tests (collected in a subprocess).
+
+    Collection runs in its own interpreter so its output never shares
+    sys.stdout with the concurrent Behave count.
+    """
     result = subprocess.run(
-        ["poetry", "run", "pytest", "--co", "-q"],
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+        ],
         capture_output=True,
         text=True,
         check=False,
     )
 
-    # Parse output like "239 tests collected in 0.20s"
-    match = re.search(r"(\d+) tests? collected", result.stdout)
-    if match:
+    match = re.search(r"^(\d+) tests? collected", result.stdout, re.MULTILINE)
+    if result.returncode == 0 and match:
         return int(match.group(1))
 
     print("ERROR: Could not determine pytest count", file=sys.stderr)
     return 0
 
 
-def get_behave_scenario_count() -> int:
-    """Get total count of E2E scenarios."""
-    result = subprocess.run(
-        ["poetry", "run", "behave", "--dry-run"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+def get_behave_counts() -> tuple[int, int]:
+    """Get total count of E2E scenarios and steps (parsed in-process).
 
-    # Parse output like "0 scenarios passed, 0 failed, 0 skipped, 55 untested"
-    # Output pode estar em stdout ou stderr
-    combined_output = result.stdout + result.stderr
-    match = re.search(
-        r"(\d+) scenarios? passed, \d+ failed, \d+ skipped, (\d+) untested",
-        combined_output,
-    )
-    if match:
-        return int(match.group(2))  # Second group is untested scenarios
+    Matches ``behave --dry-run``: outlines are expanded into one scenario
+    per example row and background steps count for every scenario. Feature
+    files are read through the parsed-feature cache; generated features
+    (features/generated/, see scripts/generate_scenarios.py) are not counted.
 
-    print("ERROR: Could not determine scenario count", file=sys.stderr)
-    return 0
+    Returns:
+        Tuple of (scenario_count, step_count)
+    """
+    from core.feature_cache import load_feature
+
+    scenarios, steps = 0, 0
+    for feature_path in sorted(Path("features").rglob("*.feature")):
+        if "generated" in feature_path.parts:
+            continue
+        for scenario in load_feature(str(feature_path)).walk_scenarios():
+            scenarios += 1
+            steps += sum(1 for _ in scenario.all_steps)
+    return (scenarios, steps)
+
+
+def collect_counts() -> dict:
+    """Collect pytest and Behave counts, reusing the cache when unchanged.
+
+    Both collections run concurrently on a cache miss.
+
+    Returns:
+        Dict with keys: pytest_count, scenario_count, step_count
+    """
+    fingerprint = tree_fingerprint()
+    if CACHE_PATH.exists():
+        cached = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        if cached.get("fingerprint") == fingerprint:
+            return cached["counts"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pytest_future = executor.submit(get_pytest_count)
+        behave_future = executor.submit(get_behave_counts)
+        scenario_count, step_count = behave_future.result()
+        counts = {
+            "pytest_count": pytest_future.result(),
+            "scenario_count": scenario_count,
+            "step_count": step_count,
+        }
+
+    # Only cache complete results so a collection error is retried next run
+    if counts["pytest_count"] > 0 and counts["scenario_count"] > 0:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(
+            json.dumps({"fingerprint": fingerprint, "counts": counts}),
+            encoding="utf-8",
+        )
+    return counts
 
 
 def get_coverage_statements() -> tuple[int, int]:
@@ -131,8 +210,9 @@ def validate_metrics() -> bool:
         return False
 
     # Get actual values
-    actual_pytest = get_pytest_count()
-    actual_scenarios = get_behave_scenario_count()
+    counts = collect_counts()
+    actual_pytest = counts["pytest_count"]
+    actual_scenarios = counts["scenario_count"]
     actual_total_stmts, actual_covered_stmts = get_coverage_statements()
 
     # Get README values
@@ -0,0 +1,236 @@
+"""Pytest configuration.
+
+Adds the --capture-impact option, which records the framework functions
+each test exercises into the impact map (see core/impact.py). Follows the
+same hierarchy as Behave flags: --capture-impact > CAPTURE_IMPACT >
+config.yaml (impact.capture_impact).
+
+With --test-order=failed|flaky|shortest, --fail-fast-after=N or
+--record-history, test outcomes and durations are recorded into the test
+history (see core/history.py); the order policy uses it to run the tests
+most likely to fail first and --fail-fast-after=N stops after N failed
+tests (TEST_ORDER / FAIL_FAST_AFTER / RECORD_HISTORY, config.yaml history
+section).
+
+--retry-budget=N (RETRY_BUDGET, config.yaml retry section) lets browser
+integration tests that fail with a transient error run again on a fresh
+browser (see core/retry.py and tests/integration/conftest.py).
+
+With pytest-xdist and GOVERN_WORKERS=true (config.yaml resources section,
+off by default), ``-n auto`` starts as many workers as browsers fit in free
+memory and CPU cores (see core/resource_governor.py). Integration tests measure the first
+browsers of each worker to keep the per-browser footprint current.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.config import (
+    get_history_config,
+    get_impact_config,
+    get_resources_config,
+    get_retry_config,
+    load_config,
+)
+from core.config_resolver import apply_config_hierarchy
+from core.history import (
+    DEFAULT_HISTORY_PATH,
+    HISTORY_WINDOW,
+    OutcomeHistory,
+    recording_enabled,
+)
+from core.impact import ImpactTracer, save_impact_map
+from core.resource_governor import DEFAULT_FOOTPRINT_PATH, governor_from_config
+from core.retry import RetryPolicy
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def pytest_addoption(parser):
+    """Register impact tracing, ordering and retry options."""
+    parser.addoption(
+        "--capture-impact",
+        action="store_true",
+        default=None,
+        help="Record functions exercised per test into the impact map",
+    )
+    parser.addoption(
+        "--test-order",
+        default=None,
+        help="Order tests by history: none, failed, flaky or shortest",
+    )
+    parser.addoption(
+        "--fail-fast-after",
+        default=None,
+        help="Stop after N failed tests (0 = never)",
+    )
+    parser.addoption(
+        "--record-history",
+        action="store_true",
+        default=None,
+        help="Record outcomes into the test history without ordering",
+    )
+    parser.addoption(
+        "--retry-budget",
+        default=None,
+        help="Max retries of transient integration test failures (0 = never)",
+    )
+
+
+def create_resource_governor():
+    """Create the resource governor, or None if disabled (GOVERN_WORKERS)."""
+    resources_config = get_resources_config(load_config(str(ROOT / "config.yaml")))
+    apply_config_hierarchy(
+        config=resources_config,
+        key="govern_workers",
+        cli_value=None,
+        env_value=os.getenv("GOVERN_WORKERS"),
+    )
+    resources_config["footprint_path"] = str(
+        ROOT / resources_config.get("footprint_path", DEFAULT_FOOTPRINT_PATH)
+    )
+    return governor_from_config(resources_config)
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size -n auto from free memory, cores and the browser footprint."""
+    governor = create_resource_governor()
+    if governor is None:
+        return None
+
+    workers = governor.worker_limit()
+    footprint = governor.footprint()
+    print(
+        f"[resources] {workers} worker(s): {footprint['rss_mb']:.0f} MB and "
+        f"{footprint['cpu']:.2f} core(s) per browser"
+    )
+    return workers
+
+
+def pytest_configure(config):
+    """Create the impact tracer when enabled, test history and retry policy."""
+    config_data = load_config(str(ROOT / "config.yaml"))
+    impact_config = get_impact_config(config_data)
+    apply_config_hierarchy(
+        config=impact_config,
+        key="capture_impact",
+        cli_value="true" if config.getoption("capture_impact") else None,
+        env_value=os.getenv("CAPTURE_IMPACT"),
+    )
+    config.impact_map_path = str(
+        ROOT / impact_config.get("map_path", ".uat_cache/impact_map.json")
+    )
+    config.impact_tracer = (
+        ImpactTracer(str(ROOT)) if impact_config["capture_impact"] else None
+    )
+
+    history_config = get_history_config(config_data)
+    for key in ("test_order", "fail_fast_after"):
+        apply_config_hierarchy(
+            config=history_config,
+            key=key,
+            cli_value=config.getoption(key),
+            env_value=os.getenv(key.upper()),
+        )
+    apply_config_hierarchy(
+        config=history_config,
+        key="record_history",
+        cli_value="true" if config.getoption("record_history") else None,
+        env_value=os.getenv("RECORD_HISTORY"),
+    )
+    config.test_order = history_config["test_order"]
+    config.record_history = recording_enabled(history_config)
+    config.outcome_history = OutcomeHistory(
+        str(ROOT / history_config.get("path", DEFAULT_HISTORY_PATH)),
+        history_config.get("window", HISTORY_WINDOW),
+    )
+    config.test_runs = {}
+    # Same behaviour as pytest's own --maxfail
+    if history_config["fail_fast_after"]:
+        config.option.maxfail = history_config["fail_fast_after"]
+
+    retry_config = get_retry_config(config_data)
+    apply_config_hierarchy(
+        config=retry_config,
+        key="retry_budget",
+        cli_value=config.getoption("retry_budget"),
+        env_value=os.getenv("RETRY_BUDGET"),
+    )
+    config.retry_policy = RetryPolicy(
+        retry_config["retry_budget"], retry_config.get("max_attempts", 2)
+    )
+
+    config.resource_governor = create_resource_governor()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Order collected tests by the configured history policy."""
+    if config.test_order != "none":
+        items[:] = config.outcome_history.order(
+            "pytest", items, config.test_order, test_id=lambda item: item.nodeid
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Trace setup, call and teardown of each test."""
+    tracer = item.config.impact_tracer
+    if tracer is None:
+        yield
+        return
+
+    tracer.start()
+    try:
+        yield
+    finally:
+        tracer.stop("pytest", item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Record each run's outcome and total duration (setup to teardown).
+
+    A retried test records one outcome per attempt. Nothing is recorded
+    unless history recording is enabled.
+    """
+    outcome = yield
+    if not item.config.record_history:
+        return
+    report = outcome.get_result()
+    run = item.config.test_runs.setdefault(
+        item.nodeid, {"passed": True, "skipped": False, "duration": 0.0}
+    )
+    run["duration"] += report.duration
+    run["passed"] = run["passed"] and not report.failed
+    run["skipped"] = run["skipped"] or report.skipped
+    if report.when == "teardown":
+        del item.config.test_runs[item.nodeid]
+        if not run["skipped"]:
+            item.config.outcome_history.record(
+                "pytest", item.nodeid, run["passed"], run["duration"]
+            )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report retried tests separately so flakiness stays visible."""
+    lines = config.retry_policy.summary_lines()
+    if lines:
+        terminalreporter.section("retries")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+def pytest_sessionfinish(session):
+    """Merge this run's entries into the test history, impact map and
+    browser footprint."""
+    if session.config.record_history:
+        session.config.outcome_history.save()
+    if session.config.resource_governor is not None:
+        session.config.resource_governor.save()
+
+    tracer = session.config.impact_tracer
+    if tracer is not None:
+        save_impact_map(tracer.entries, session.config.impact_map_path)
@@ -1,25 +1,32 @@
 """Pytest fixtures for integration tests.
 
 Provides shared fixtures for integration testing with real browsers.
+
+With a retry budget (--retry-budget=N, see tests/conftest.py), a test that
+fails with a transient browser error (timeout, stale element, lost
+session) runs again; the function-scoped driver fixture gives the retry a
+fresh browser. Retried attempts are reported as RERUN, not as failures.
 """
 
 import os
 
 import pytest
+from _pytest.runner import runtestprotocol
 
 from core.config import get_base_url, get_browser_config, load_config
 from core.config_resolver import apply_config_hierarchy
 from core.driver_manager import DriverManager
+from core.retry import classify_failure
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """Create WebDriver instance for integration tests.
+@pytest.fixture(scope="session")
+def browser_config():
+    """Resolve browser configuration for integration tests.
 
-    Yields:
-        WebDriver instance configured for integration testing.
+    Returns:
+        Browser config with headless and user_contexts resolved from the
+        environment (HEADLESS, USER_CONTEXTS).
     """
-    # Load configuration
     config = load_config()
     browser_config = get_browser_config(config)
 
@@ -30,6 +37,53 @@ def driver():
         cli_value=None,
         env_value=os.getenv("HEADLESS"),
     )
+    apply_config_hierarchy(
+        config=browser_config,
+        key="user_contexts",
+        cli_value=None,
+        env_value=os.getenv("USER_CONTEXTS"),
+    )
+    return browser_config
+
+
+@pytest.fixture(scope="session")
+def shared_browser(browser_config):
+    """Start one browser per worker when user contexts are enabled.
+
+    Yields:
+        DriverManager shared by the worker's tests, or None.
+    """
+    if not browser_config.get("user_contexts"):
+        yield None
+        return
+
+    dm = DriverManager(browser_config)
+    yield dm
+    dm.quit()
+
+
+@pytest.fixture(scope="function")
+def driver(request, browser_config, shared_browser):
+    """Create WebDriver instance for integration tests.
+
+    With USER_CONTEXTS=true each test gets an isolated user context in the
+    worker's browser instead of a new browser. Otherwise the resource
+    governor delays the browser start while memory is short and measures
+    the worker's first browsers.
+
+    Yields:
+        WebDriver instance configured for integration testing.
+    """
+    if shared_browser is not None:
+        driver = shared_browser.new_context()
+        yield driver
+        shared_browser.close_context(driver)
+        return
+
+    # Hold back while other workers' browsers use the memory
+    governor = request.config.resource_governor
+    if governor is not None and browser_config["name"] != "http":
+        governor.wait_for_memory()
 
     # Create driver
     dm = DriverManager(browser_config)
@@ -37,7 +91,9 @@ def driver():
 
     yield driver
 
-    # Teardown
+    # Teardown (measured after the test did real work in the browser)
+    if governor is not None:
+        governor.measure(dm.browser_pid)
     dm.quit()
 
 
@@ -50,3 +106,48 @@ def base_url():
     """
     config = load_config()
     return get_base_url(config)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Classify failures as transient (retryable) or not."""
+    outcome = yield
+    report = outcome.get_result()
+    report.retry_reason = (
+        classify_failure(call.excinfo.value)
+        if report.failed and call.excinfo is not None
+        else None
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Run a test, retrying transient failures within the retry budget."""
+    policy = item.config.retry_policy
+    if not policy.enabled:
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    retry = True
+    while retry:
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        failed = [report for report in reports if report.failed]
+        policy.record_outcome(item.nodeid, not failed)
+        # Only retry if every failing phase failed for a transient reason
+        reason = failed[0].retry_reason if failed else None
+        retry = all(r.retry_reason for r in failed) and policy.should_retry(
+            item.nodeid, reason
+        )
+        for report in reports:
+            if retry and report.failed:
+                report.outcome = "rerun"
+            item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    """Show retried attempts as RERUN."""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    return None
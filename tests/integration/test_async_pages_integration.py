@@ -0,0 +1,60 @@
+"""Integration tests for the asyncio page objects.
+
+Drives several real browser sessions concurrently from one event loop.
+"""
+
+import asyncio
+
+from core.async_driver import AsyncDriverManager
+from pages.async_pages import (
+    AsyncCartPage,
+    AsyncCheckoutCompletePage,
+    AsyncCheckoutStepOnePage,
+    AsyncCheckoutStepTwoPage,
+    AsyncInventoryPage,
+    AsyncLoginPage,
+)
+
+PRODUCTS = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
+
+
+async def checkout(manager, base_url):
+    """Complete one order in a new session and return its confirmation."""
+    driver = await manager.new_session()
+    login_page = AsyncLoginPage(driver)
+    await login_page.open(base_url)
+    await login_page.login("standard_user", "secret_sauce")
+
+    inventory_page = AsyncInventoryPage(driver)
+    for product_name in PRODUCTS:
+        await inventory_page.add_product_to_cart(product_name)
+    await inventory_page.click_shopping_cart()
+
+    cart_page = AsyncCartPage(driver)
+    assert await cart_page.missing_from_cart(PRODUCTS) == set()
+    await cart_page.click_checkout()
+
+    step_one_page = AsyncCheckoutStepOnePage(driver)
+    await step_one_page.fill_information("John", "Doe", "12345")
+    await step_one_page.click_continue()
+
+    step_two_page = AsyncCheckoutStepTwoPage(driver)
+    assert (await step_two_page.get_order_summary()).verify() == []
+    await step_two_page.click_finish()
+
+    return await AsyncCheckoutCompletePage(driver).get_confirmation_message()
+
+
+def test_concurrent_checkouts(browser_config, base_url):
+    """Concurrent sessions of one event loop should each complete an order."""
+
+    async def run_checkouts():
+        manager = AsyncDriverManager(browser_config)
+        try:
+            return await asyncio.gather(
+                *(checkout(manager, base_url) for _ in range(3))
+            )
+        finally:
+            await manager.quit()
+
+    assert asyncio.run(run_checkouts()) == ["Thank you for your order!"] * 3
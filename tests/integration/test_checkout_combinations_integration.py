@@ -0,0 +1,57 @@
+"""Combinatorial cart/checkout integration tests.
+
+One test per case of the covering set generated from the catalog, users
+and checkout data (combinatorial section of config.yaml). Run in parallel
+with ``pytest tests/integration/test_checkout_combinations_integration.py
+-n auto``.
+"""
+
+import pytest
+
+from core.combinatorial import checkout_combinations
+from core.config import get_combinatorial_config, load_config
+from pages.cart_page import CartPage
+from pages.checkout_step_one_page import CheckoutStepOnePage
+from pages.checkout_step_two_page import CheckoutStepTwoPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+COMBINATORIAL_CONFIG = get_combinatorial_config(load_config())
+
+CASES = checkout_combinations(
+    list(InventoryPage.PRODUCT_NAMES),
+    COMBINATORIAL_CONFIG.get("users"),
+    COMBINATORIAL_CONFIG.get("checkout_data"),
+    COMBINATORIAL_CONFIG.get("strength", 2),
+)
+
+
+@pytest.mark.parametrize(
+    "case",
+    CASES,
+    ids=[
+        f"{index}-{case['user']}-{len(case['products'])}items"
+        for index, case in enumerate(CASES)
+    ],
+)
+def test_checkout_totals_for_combination(driver, base_url, case):
+    """Order summary should list the cart and its totals should add up."""
+    driver.get(base_url)
+    LoginPage(driver).login(case["user"], "secret_sauce")
+
+    inventory_page = InventoryPage(driver)
+    for product_name in case["products"]:
+        inventory_page.add_product_to_cart(product_name)
+    inventory_page.click_shopping_cart()
+    CartPage(driver).click_checkout()
+
+    step_one_page = CheckoutStepOnePage(driver)
+    step_one_page.enter_first_name(case["first_name"])
+    step_one_page.enter_last_name(case["last_name"])
+    step_one_page.enter_zip_code(case["zip_code"])
+    step_one_page.click_continue()
+
+    summary_page = CheckoutStepTwoPage(driver)
+    assert summary_page.get_summary_product_names() == set(case["products"])
+    problems = summary_page.get_order_summary().verify()
+    assert not problems, f"Order totals do not add up: {'; '.join(problems)}"
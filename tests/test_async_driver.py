@@ -0,0 +1,209 @@
+"""Unit tests for the asyncio WebDriver client.
+
+Runs the client against an in-process W3C driver service stub (asyncio
+server) to check the wire protocol, error mapping and connection reuse.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from core.async_driver import (
+    ELEMENT_KEY,
+    AsyncDriverManager,
+    AsyncElement,
+    AsyncWebDriver,
+)
+
+
+class FakeDriverService:
+    """W3C driver service stub recording requests.
+
+    Responds to (method, path suffix) routes with (status, value); every
+    other command succeeds with a null value.
+    """
+
+    def __init__(self, routes=None):
+        self.routes = routes or {}
+        self.requests = []
+        self.connections = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+
+    @property
+    def url(self):
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while request_line := await reader.readline():
+            method, path, _ = request_line.decode().split()
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            self.requests.append((method, path, json.loads(body) if body else None))
+
+            status, value = 200, None
+            for (route_method, suffix), response in self.routes.items():
+                if method == route_method and path.endswith(suffix):
+                    status, value = response
+            data = json.dumps({"value": value}).encode()
+            writer.write(
+                f"HTTP/1.1 {status} X\r\nContent-Length: {len(data)}\r\n\r\n".encode()
+                + data
+            )
+            await writer.drain()
+        writer.close()
+
+
+def run(coroutine):
+    """Run a test coroutine in a new event loop."""
+    return asyncio.run(coroutine)
+
+
+async def start_session(service):
+    """Start a session on the stub service."""
+    return await AsyncWebDriver(service.url).start({"browserName": "chrome"})
+
+
+SESSION_ROUTE = {("POST", "/session"): (200, {"sessionId": "s1", "capabilities": {}})}
+
+
+class TestAsyncWebDriver:
+    """Test commands, element references and errors."""
+
+    def test_start_sends_capabilities(self):
+        """A session is created with the options' capabilities."""
+
+        async def scenario():
+            async with FakeDriverService(SESSION_ROUTE) as service:
+                driver = await start_session(service)
+                return driver, service.requests
+
+        driver, requests = run(scenario())
+
+        assert driver.session_id == "s1"
+        assert requests == [
+            (
+                "POST",
+                "/session",
+                {"capabilities": {"alwaysMatch": {"browserName": "chrome"}}},
+            )
+        ]
+
+    def test_find_element_converts_locator_and_returns_element(self):
+        """By.ID locators are sent as CSS; references become AsyncElement."""
+        routes = {
+            **SESSION_ROUTE,
+            ("POST", "/element"): (200, {ELEMENT_KEY: "e1"}),
+        }
+
+        async def scenario():
+            async with FakeDriverService(routes) as service:
+                driver = await start_session(service)
+                element = await driver.find_element("id", "login-button")
+                await element.click()
+                return element, service.requests
+
+        element, requests = run(scenario())
+
+        assert isinstance(element, AsyncElement)
+        assert requests[1] == (
+            "POST",
+            "/session/s1/element",
+            {"using": "css selector", "value": '[id="login-button"]'},
+        )
+        assert requests[2] == ("POST", "/session/s1/element/e1/click", {})
+
+    def test_script_arguments_serialize_elements(self):
+        """Elements passed to scripts are sent as W3C references."""
+
+        async def scenario():
+            async with FakeDriverService(SESSION_ROUTE) as service:
+                driver = await start_session(service)
+                await driver.execute_script("return 1", AsyncElement(driver, "e7"))
+                return service.requests[-1]
+
+        method, path, body = run(scenario())
+
+        assert path == "/session/s1/execute/sync"
+        assert body["args"] == [{ELEMENT_KEY: "e7"}]
+
+    def test_errors_raise_selenium_exceptions(self):
+        """W3C errors map to the usual Selenium exception classes."""
+        routes = {
+            **SESSION_ROUTE,
+            ("POST", "/element"): (
+                404,
+                {"error": "no such element", "message": "Unable to locate"},
+            ),
+        }
+
+        async def scenario():
+            async with FakeDriverService(routes) as service:
+                driver = await start_session(service)
+                await driver.find_element("id", "missing")
+
+        with pytest.raises(NoSuchElementException, match="Unable to locate"):
+            run(scenario())
+
+    def test_sessions_run_concurrently_on_own_connections(self):
+        """Each session reuses one keep-alive connection."""
+
+        async def scenario():
+            async with FakeDriverService(SESSION_ROUTE) as service:
+                drivers = await asyncio.gather(
+                    *(start_session(service) for _ in range(5))
+                )
+                await asyncio.gather(
+                    *(driver.get("https://www.saucedemo.com/") for driver in drivers)
+                )
+                await asyncio.gather(*(driver.quit() for driver in drivers))
+                return service
+
+        service = run(scenario())
+
+        assert service.connections == 5
+        assert len(service.requests) == 15
+
+
+class TestAsyncDriverManager:
+    """Test the driver service shared by sessions."""
+
+    def test_gathered_sessions_share_one_service(self):
+        """Concurrent new_session calls should start a single service."""
+        manager = AsyncDriverManager({"name": "chrome", "headless": True})
+        ports = iter(range(9001, 9010))
+
+        def start_service(options):
+            return f"http://127.0.0.1:{next(ports)}"
+
+        async def scenario():
+            with (
+                patch.object(
+                    manager, "_start_service", side_effect=start_service
+                ) as mock_start,
+                patch.object(AsyncWebDriver, "start", AsyncMock()),
+            ):
+                drivers = await asyncio.gather(
+                    *(manager.new_session() for _ in range(3))
+                )
+            return drivers, mock_start
+
+        drivers, mock_start = run(scenario())
+
+        mock_start.assert_called_once()
+        assert {driver.port for driver in drivers} == {9001}
+        assert len(manager.sessions) == 3
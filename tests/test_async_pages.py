@@ -0,0 +1,153 @@
+"""Unit tests for the asyncio page objects.
+
+Tests waits, in-page actions, snapshots and concurrent use with mocked
+async drivers.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.async_base_page import AsyncBasePage
+from pages.async_pages import (
+    AsyncCartPage,
+    AsyncCheckoutStepTwoPage,
+    AsyncInventoryPage,
+    AsyncLoginPage,
+)
+from pages.base_page import SNAPSHOT_SCRIPT, WAIT_AND_ACT_SCRIPT
+
+
+def make_driver(elements=None, script_result=None):
+    """Build an async driver whose lookups return the given elements."""
+    driver = Mock()
+    driver.find_elements = AsyncMock(return_value=elements or [])
+    driver.execute_script = AsyncMock(return_value=script_result)
+    driver.execute_async_script = AsyncMock(return_value={"status": "done"})
+    driver.get = AsyncMock()
+    return driver
+
+
+def make_element(displayed=True, enabled=True):
+    """Build an async element with the given state."""
+    element = Mock()
+    element.is_displayed = AsyncMock(return_value=displayed)
+    element.is_enabled = AsyncMock(return_value=enabled)
+    element.click = AsyncMock()
+    element.clear = AsyncMock()
+    element.send_keys = AsyncMock()
+    return element
+
+
+class TestAsyncBasePage:
+    """Test async waits and actions."""
+
+    def test_open_navigates_to_page_path(self):
+        """open() joins the base URL and PAGE_PATH."""
+        driver = make_driver()
+
+        asyncio.run(AsyncCartPage(driver).open("https://www.saucedemo.com/"))
+
+        driver.get.assert_awaited_once_with("https://www.saucedemo.com/cart.html")
+
+    def test_click_waits_until_clickable(self):
+        """A native click happens once the element is displayed and enabled."""
+        element = make_element()
+        element.is_enabled.side_effect = [False, True]
+        page = AsyncBasePage(make_driver([element]))
+        page.POLL_INTERVAL = 0
+
+        asyncio.run(page.click(("id", "login-button")))
+
+        element.click.assert_awaited_once()
+        assert element.is_enabled.await_count == 2
+
+    def test_find_element_times_out(self):
+        """A missing element raises TimeoutException after the timeout."""
+        page = AsyncBasePage(make_driver(), timeout=0)
+
+        with pytest.raises(TimeoutException, match="not found"):
+            asyncio.run(page.find_element(("id", "missing")))
+
+    def test_fast_actions_act_in_page(self):
+        """With fast_actions, type runs one wait-and-act script."""
+        driver = make_driver()
+        page = AsyncBasePage(driver)
+        page.fast_actions = True
+
+        asyncio.run(page.type(("id", "user-name"), "standard_user"))
+
+        driver.execute_async_script.assert_awaited_once_with(
+            WAIT_AND_ACT_SCRIPT, "id", "user-name", "type", "standard_user", 10000
+        )
+        driver.find_elements.assert_not_awaited()
+
+
+class TestAsyncPages:
+    """Test page flows and snapshot reads."""
+
+    def test_login_types_and_clicks(self):
+        """login() fills both fields and submits the form."""
+        element = make_element()
+
+        asyncio.run(AsyncLoginPage(make_driver([element])).login("user", "pass"))
+
+        assert [c.args for c in element.send_keys.await_args_list] == [
+            ("user",),
+            ("pass",),
+        ]
+        element.click.assert_awaited_once()
+
+    def test_snapshot_waits_for_anchor(self):
+        """A page not rendered yet is not captured before the timeout."""
+        driver = make_driver(script_result={"items": []})
+        page = AsyncCartPage(driver, timeout=0)
+
+        with pytest.raises(TimeoutException, match="not found"):
+            asyncio.run(page.snapshot())
+        driver.execute_script.assert_not_awaited()
+
+    def test_inventory_reads_snapshot(self):
+        """Product names and badge come from one snapshot script call."""
+        driver = make_driver([make_element()], {"items": ["Backpack"], "badge": "2"})
+        page = AsyncInventoryPage(driver)
+
+        assert asyncio.run(page.get_cart_item_count()) == 2
+        assert driver.execute_script.await_args.args[0] == SNAPSHOT_SCRIPT
+
+    def test_order_summary_is_parsed_like_sync_page(self):
+        """Totals are parsed with the blocking page's OrderSummary."""
+        driver = make_driver(
+            [make_element()],
+            {
+                "prices": ["$29.99", "$9.99"],
+                "quantities": ["1", "1"],
+                "subtotal": "Item total: $39.98",
+                "tax": "Tax: $3.20",
+                "total": "Total: $43.18",
+            },
+        )
+
+        summary = asyncio.run(AsyncCheckoutStepTwoPage(driver).get_order_summary())
+
+        assert summary.total == Decimal("43.18")
+        assert summary.verify() == []
+
+    def test_sessions_run_concurrently(self):
+        """Pages of different sessions interleave in one event loop."""
+        drivers = [
+            make_driver([make_element()], {"items": ["Backpack"]}) for _ in range(5)
+        ]
+
+        async def read_all():
+            return await asyncio.gather(
+                *(
+                    AsyncCartPage(driver).missing_from_cart(["Backpack"])
+                    for driver in drivers
+                )
+            )
+
+        assert asyncio.run(read_all()) == [set()] * 5
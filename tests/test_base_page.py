@@ -8,7 +8,12 @@ import pytest
 from unittest.mock import Mock, MagicMock, call
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 
 from pages.base_page import BasePage
 
@@ -281,6 +286,386 @@ class TestGetTextMethod:
             assert result == expected_text
 
 
+class TestStaleElementRecovery:
+    """Test re-locating elements that go stale during interactions."""
+
+    def test_click_relocates_stale_element(self):
+        """click should locate the element again when it went stale."""
+        from unittest.mock import patch
+
+        stale_element = Mock()
+        stale_element.click.side_effect = StaleElementReferenceException()
+        fresh_element = Mock()
+        page = BasePage(Mock())
+        locator = (By.ID, "button")
+
+        with patch.object(
+            page, "find_clickable_element", side_effect=[stale_element, fresh_element]
+        ):
+            page.click(locator)
+
+        fresh_element.click.assert_called_once()
+        assert page.state.stale_relocations[locator] == 1
+
+    def test_type_interacts_with_handle_from_last_wait(self):
+        """type should use the element returned after scrolling, not the first."""
+        from unittest.mock import patch
+
+        first_element = Mock()
+        fresh_element = Mock()
+        page = BasePage(Mock())
+
+        with patch.object(page, "find_clickable_element", return_value=first_element):
+            with patch.object(page.wait, "until", return_value=fresh_element):
+                page.type((By.ID, "input-field"), "text")
+
+        fresh_element.send_keys.assert_called_once_with("text")
+        first_element.send_keys.assert_not_called()
+
+    def test_type_retries_whole_interaction_when_stale(self):
+        """A re-render while typing should restart locate, scroll and type."""
+        from unittest.mock import patch
+
+        stale_element = Mock()
+        stale_element.clear.side_effect = StaleElementReferenceException()
+        fresh_element = Mock()
+        page = BasePage(Mock())
+        locator = (By.ID, "input-field")
+
+        with patch.object(page, "find_clickable_element", return_value=Mock()):
+            with patch.object(
+                page.wait, "until", side_effect=[stale_element, fresh_element]
+            ):
+                page.type(locator, "text")
+
+        fresh_element.send_keys.assert_called_once_with("text")
+        assert page.state.stale_relocations[locator] == 1
+
+    def test_get_text_relocates_stale_element(self):
+        """get_text should read the text of a re-located element."""
+        from unittest.mock import PropertyMock, patch
+
+        stale_element = Mock()
+        type(stale_element).text = PropertyMock(
+            side_effect=StaleElementReferenceException()
+        )
+        fresh_element = Mock(text="Fresh")
+        page = BasePage(Mock())
+
+        with patch.object(
+            page, "find_element", side_effect=[stale_element, fresh_element]
+        ):
+            assert page.get_text((By.ID, "label")) == "Fresh"
+
+    def test_gives_up_after_retry_attempts(self):
+        """An element that keeps going stale should raise after the limit."""
+        from unittest.mock import patch
+
+        stale_element = Mock()
+        stale_element.click.side_effect = StaleElementReferenceException()
+        page = BasePage(Mock())
+        locator = (By.ID, "button")
+
+        with patch.object(page, "find_clickable_element", return_value=stale_element):
+            with pytest.raises(StaleElementReferenceException):
+                page.click(locator)
+
+        assert stale_element.click.call_count == BasePage.STALE_RETRY_ATTEMPTS
+        assert (
+            page.state.stale_relocations[locator] == BasePage.STALE_RETRY_ATTEMPTS - 1
+        )
+
+
+class TestFastActions:
+    """Test single-call wait-and-act for click and type."""
+
+    @pytest.fixture
+    def page(self):
+        """Create a page with fast actions enabled."""
+        page = BasePage(Mock())
+        page.fast_actions = True
+        return page
+
+    def test_enabled_per_driver(self, page):
+        """Pages of the same driver share the setting; other drivers don't."""
+        assert BasePage(page.driver).fast_actions is True
+        assert BasePage(Mock()).fast_actions is False
+
+    def test_click_is_one_script_call(self, page):
+        """click should wait and act in the browser without native commands."""
+        page.driver.execute_async_script.return_value = {"status": "done"}
+        page.find_clickable_element = Mock()
+
+        page.click((By.ID, "button"))
+
+        page.driver.execute_async_script.assert_called_once()
+        args = page.driver.execute_async_script.call_args[0]
+        assert args[1:] == ("id", "button", "click", "", 10000, 500)
+        page.find_clickable_element.assert_not_called()
+
+    def test_type_passes_text_to_script(self, page):
+        """type should set the value in the same call."""
+        page.driver.execute_async_script.return_value = {"status": "done"}
+
+        page.type((By.NAME, "user-name"), "standard_user")
+
+        args = page.driver.execute_async_script.call_args[0]
+        assert args[1:4] == ("name", "user-name", "type")
+        assert args[4] == "standard_user"
+
+    @pytest.mark.parametrize(
+        "script_result",
+        [
+            None,  # HTTP mode: no JavaScript engine
+            {"status": "obscured", "state": "obscured"},
+            WebDriverException("script timeout"),
+        ],
+    )
+    def test_falls_back_to_native_click(self, page, script_result):
+        """Unsupported drivers, covered elements and errors use native click."""
+        page.driver.execute_async_script.side_effect = [script_result]
+        element = Mock()
+        page.find_clickable_element = Mock(return_value=element)
+
+        page.click((By.ID, "button"))
+
+        element.click.assert_called_once()
+
+    def test_trusted_click_skips_script(self, page):
+        """trusted=True should always use a native WebDriver click."""
+        element = Mock()
+        page.find_clickable_element = Mock(return_value=element)
+
+        page.click((By.ID, "button"), trusted=True)
+
+        page.driver.execute_async_script.assert_not_called()
+        element.click.assert_called_once()
+
+    def test_unsupported_strategy_skips_script(self, page):
+        """Locator strategies not resolvable in-page use the native path."""
+        page.find_clickable_element = Mock(return_value=Mock())
+
+        page.click((By.LINK_TEXT, "Checkout"))
+
+        page.driver.execute_async_script.assert_not_called()
+
+    def test_raises_timeout_when_element_never_ready(self, page):
+        """Missing, hidden or disabled elements should time out like waits."""
+        page.driver.execute_async_script.return_value = {
+            "status": "timeout",
+            "state": "hidden",
+        }
+
+        with pytest.raises(TimeoutException, match="id=button hidden"):
+            page.click((By.ID, "button"))
+
+    def test_disabled_by_default(self):
+        """Fast actions are opt-in (JS events are not trusted)."""
+        page = BasePage(Mock())
+        page.find_clickable_element = Mock(return_value=Mock())
+
+        page.click((By.ID, "button"))
+
+        page.driver.execute_async_script.assert_not_called()
+
+
+class TestStreamItems:
+    """Test chunked in-page reads of list rows."""
+
+    def test_streams_chunks_until_exhausted(self):
+        """Rows should be yielded chunk by chunk without element handles."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.side_effect = [
+            {"rows": [{"name": "A"}, {"name": "B"}], "exhausted": False},
+            {"rows": [{"name": "C"}], "exhausted": True},
+        ]
+        page = BasePage(mock_driver)
+
+        rows = page.stream_items(
+            (By.CLASS_NAME, "inventory_item"),
+            {"name": (".inventory_item_name", "textContent")},
+            chunk_size=2,
+        )
+
+        assert [row["name"] for row in rows] == ["A", "B", "C"]
+        mock_driver.find_elements.assert_not_called()
+        first_call, second_call = mock_driver.execute_async_script.call_args_list
+        assert first_call[0][1:5] == (
+            True,
+            ".inventory_item",
+            {"name": [".inventory_item_name", "textContent"]},
+            2,
+        )
+        assert second_call[0][1] is False  # continues the in-page cursor
+
+    @pytest.mark.parametrize("scroll", [False, True])
+    def test_short_list_is_read_in_one_call(self, scroll):
+        """A list shorter than one chunk ends the stream in the first call."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = {
+            "rows": [{"name": "A"}],
+            "exhausted": True,
+        }
+        page = BasePage(mock_driver)
+
+        rows = page.stream_items(
+            (By.CLASS_NAME, "inventory_item"),
+            {"name": (".inventory_item_name", "textContent")},
+            scroll=scroll,
+            row_key="data-id" if scroll else None,
+        )
+
+        assert list(rows) == [{"name": "A"}]
+        mock_driver.execute_async_script.assert_called_once()
+        # Scrolling and waiting for more rows happen only when asked for
+        assert mock_driver.execute_async_script.call_args[0][-1] is scroll
+
+    def test_scroll_requires_row_key(self):
+        """Scrolled lists recycle items, so rows need a declared identity."""
+        mock_driver = Mock()
+        page = BasePage(mock_driver)
+
+        with pytest.raises(ValueError, match="row_key"):
+            page.stream_items(
+                (By.ID, "list"), {"name": ("", "textContent")}, scroll=True
+            )
+
+        mock_driver.execute_async_script.assert_not_called()
+
+    def test_item_without_row_key_raises(self):
+        """Rows without identity should fail instead of being merged."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.side_effect = [
+            {"rows": [{"name": "A"}], "exhausted": False},
+            {"error": "list item without data-id attribute"},
+        ]
+        page = BasePage(mock_driver)
+
+        rows = page.stream_items(
+            (By.ID, "list"), {"name": ("", "textContent")}, row_key="data-id"
+        )
+
+        assert next(rows) == {"name": "A"}
+        with pytest.raises(ValueError, match="data-id"):
+            next(rows)
+
+    @pytest.mark.parametrize(
+        "script_result", [None, WebDriverException("javascript error")]
+    )
+    def test_returns_none_when_scripts_unavailable(self, script_result):
+        """Callers should fall back to element reads without scripting."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.side_effect = [script_result]
+        page = BasePage(mock_driver)
+
+        rows = page.stream_items((By.ID, "list"), {"name": ("", "textContent")})
+
+        assert rows is None
+
+
+class TestPageSnapshot:
+    """Test page state snapshots for batched assertions."""
+
+    @pytest.fixture
+    def page_class(self):
+        """Create a page object class with snapshot fields."""
+
+        class BadgePage(BasePage):
+            SNAPSHOT_FIELDS = {
+                "badge": (".shopping_cart_badge", "text"),
+                "items": (".inventory_item_name", "texts"),
+            }
+
+        return BadgePage
+
+    def test_captures_all_fields_in_one_script_call(self, page_class):
+        """All fields should be read together, then reused."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = {"badge": "2", "items": ["A"]}
+
+        first = page_class(mock_driver).snapshot()
+        second = page_class(mock_driver).snapshot()
+
+        assert first["badge"] == "2"
+        assert second is first
+        mock_driver.execute_script.assert_called_once()
+        assert mock_driver.execute_script.call_args[0][1] == {
+            "badge": [".shopping_cart_badge", "text"],
+            "items": [".inventory_item_name", "texts"],
+        }
+
+    def test_interactions_invalidate_snapshot(self, page_class):
+        """A click should force the next snapshot to read the page again."""
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = [
+            {"badge": None, "items": []},
+            {"badge": "1", "items": []},
+        ]
+        page = page_class(mock_driver)
+        page.find_clickable_element = Mock(return_value=Mock())
+
+        assert page.snapshot()["badge"] is None
+        page.click((By.ID, "add-to-cart"))
+
+        assert page.snapshot()["badge"] == "1"
+
+    def test_snapshots_are_per_driver(self, page_class):
+        """Pages of another driver (e.g., another thread) read their own page."""
+        first_driver, second_driver = Mock(), Mock()
+        first_driver.execute_script.return_value = {"badge": "1", "items": []}
+        second_driver.execute_script.return_value = {"badge": "2", "items": []}
+
+        page_class(first_driver).snapshot()
+        page_class(second_driver).invalidate_snapshots()
+
+        assert page_class(first_driver).snapshot()["badge"] == "1"
+        assert page_class(second_driver).snapshot()["badge"] == "2"
+        first_driver.execute_script.assert_called_once()
+
+    def test_open_discards_snapshots(self, page_class):
+        """Navigating should read the new page instead of the cached one."""
+        mock_driver = Mock()
+        mock_driver.execute_script.side_effect = [
+            {"badge": "1", "items": []},
+            {"badge": None, "items": []},
+        ]
+        page_class.PAGE_PATH = "/inventory.html"
+        page = page_class(mock_driver)
+
+        assert page.snapshot()["badge"] == "1"
+        page.open("https://www.saucedemo.com/")
+
+        mock_driver.get.assert_called_once_with(
+            "https://www.saucedemo.com/inventory.html"
+        )
+        assert page.snapshot()["badge"] is None
+
+    def test_waits_for_anchor_before_capturing(self, page_class):
+        """A page that never renders its anchor should not be captured."""
+        mock_driver = Mock()
+        mock_driver.find_element.side_effect = NoSuchElementException()
+        page_class.SNAPSHOT_ANCHOR = (By.ID, "inventory_container")
+
+        with pytest.raises(TimeoutException):
+            page_class(mock_driver, timeout=0).snapshot()
+
+        mock_driver.find_element.assert_called_with(By.ID, "inventory_container")
+        mock_driver.execute_script.assert_not_called()
+
+    def test_reads_elements_without_scripting(self, page_class):
+        """Drivers without JavaScript should get fields from elements."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = None
+        mock_driver.find_elements.side_effect = [
+            [Mock(text="3")],
+            [Mock(text="A"), Mock(text="B")],
+        ]
+
+        snapshot = page_class(mock_driver).snapshot()
+
+        assert snapshot.fields == {"badge": "3", "items": ["A", "B"]}
+
+
 class TestIsElementPresentMethod:
     """Test is_element_present method."""
 
@@ -104,6 +104,30 @@ class TestIsProductInCart:
 
         assert result is False
 
+    def test_cart_product_names_are_streamed(self):
+        """Cart names should be read in-page when scripts are available."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = {
+            "rows": [{"name": "Sauce Labs Backpack"}],
+            "exhausted": True,
+        }
+
+        page = CartPage(mock_driver)
+
+        assert page.get_cart_product_names() == {"Sauce Labs Backpack"}
+        mock_driver.find_elements.assert_not_called()
+
+    def test_missing_from_cart_returns_absent_products(self):
+        """missing_from_cart should verify many products in one read."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = None  # no scripting
+        mock_driver.find_elements.return_value = [Mock(text="Sauce Labs Backpack")]
+
+        page = CartPage(mock_driver)
+
+        assert page.missing_from_cart(["Sauce Labs Backpack"]) == set()
+        assert page.missing_from_cart(["Sauce Labs Onesie"]) == {"Sauce Labs Onesie"}
+
 
 class TestRemoveProduct:
     """Test remove_product method."""
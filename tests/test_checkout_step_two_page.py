@@ -3,11 +3,14 @@
 Tests the CheckoutStepTwoPage Page Object in isolation using mocks.
 """
 
+import random
+from decimal import ROUND_HALF_UP, Decimal
 from unittest.mock import Mock, patch
 
+import pytest
 from selenium.webdriver.common.by import By
 
-from pages.checkout_step_two_page import CheckoutStepTwoPage
+from pages.checkout_step_two_page import CheckoutStepTwoPage, OrderSummary
 
 
 class TestCheckoutStepTwoPageLocators:
@@ -86,6 +89,23 @@ class TestIsProductInSummary:
 
         assert result is False
 
+    def test_missing_from_summary_checks_many_products_in_one_read(self):
+        """missing_from_summary should read names once for all products."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = None  # no scripting
+        mock_driver.find_elements.return_value = [
+            Mock(text="Sauce Labs Backpack"),
+            Mock(text="Sauce Labs Bike Light"),
+        ]
+
+        page = CheckoutStepTwoPage(mock_driver)
+        missing = page.missing_from_summary(
+            ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Onesie"]
+        )
+
+        assert missing == {"Sauce Labs Onesie"}
+        mock_driver.find_elements.assert_called_once()
+
 
 class TestIsPaymentInfoDisplayed:
     """Test is_payment_info_displayed method."""
@@ -157,6 +177,76 @@ class TestGetTotal:
             assert result == 32.39
 
 
+class TestOrderSummary:
+    """Test single-read order summary and totals verification."""
+
+    @staticmethod
+    def summary_state(prices, subtotal, tax, total):
+        """Build snapshot fields of an overview page."""
+        return {
+            "title": "Checkout: Overview",
+            "items": [f"Item {index}" for index in range(len(prices))],
+            "prices": [f"${price}" for price in prices],
+            "quantities": ["1"] * len(prices),
+            "subtotal": f"Item total: ${subtotal}",
+            "tax": f"Tax: ${tax}",
+            "total": f"Total: ${total}",
+        }
+
+    def test_reads_totals_and_line_items_in_one_call(self):
+        """get_order_summary should return exact Decimals from one read."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = self.summary_state(
+            ["29.99", "9.99"], "39.98", "3.20", "43.18"
+        )
+
+        summary = CheckoutStepTwoPage(mock_driver).get_order_summary()
+
+        assert summary.prices == [Decimal("29.99"), Decimal("9.99")]
+        assert summary.total == Decimal("43.18")
+        assert summary.verify() == []
+        mock_driver.execute_script.assert_called_once()
+
+    def test_large_generated_cart_verifies_exactly(self):
+        """Thousands of line items should add up exactly (no float drift)."""
+        generator = random.Random(44)
+        prices = [Decimal(generator.randint(1, 9999)) / 100 for _ in range(5000)]
+        subtotal = sum(prices, Decimal("0"))
+        tax = (subtotal * Decimal("0.08")).quantize(Decimal("0.01"), ROUND_HALF_UP)
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = self.summary_state(
+            prices, subtotal, tax, subtotal + tax
+        )
+
+        summary = CheckoutStepTwoPage(mock_driver).get_order_summary()
+
+        assert summary.verify() == []
+
+    def test_reports_item_total_not_matching_line_items(self):
+        """A wrong item total should be reported with the recomputed sum."""
+        summary = OrderSummary(
+            [Decimal("29.99"), Decimal("9.99")],
+            [1, 2],
+            Decimal("39.98"),
+            Decimal("3.20"),
+            Decimal("43.18"),
+        )
+
+        assert summary.verify() == [
+            "item total $39.98 != $49.97 (sum of 2 line item(s))"
+        ]
+
+    def test_missing_total_label_raises(self):
+        """A summary without totals should fail clearly."""
+        mock_driver = Mock()
+        state = self.summary_state([], "0", "0", "0")
+        state["total"] = None
+        mock_driver.execute_script.return_value = state
+
+        with pytest.raises(ValueError, match="no total label"):
+            CheckoutStepTwoPage(mock_driver).get_order_summary()
+
+
 class TestClickFinish:
     """Test click_finish method."""
 
@@ -0,0 +1,119 @@
+"""Unit tests for combinatorial scenario generation.
+
+Tests n-wise coverage of the generated rows, the cart/checkout case
+expansion and the rendered scenario outline.
+"""
+
+from itertools import combinations, product
+
+import pytest
+
+from core.combinatorial import (
+    NO_PRODUCTS,
+    checkout_combinations,
+    covering_rows,
+    render_outline,
+)
+
+PRODUCTS = ["Backpack", "Bike Light", "Bolt T-Shirt", "Fleece Jacket", "Onesie"]
+USERS = ["standard_user", "performance_glitch_user"]
+CHECKOUT_DATA = [
+    {"first_name": "John", "last_name": "Doe", "zip_code": "12345"},
+    {"first_name": "Ana", "last_name": "Silva", "zip_code": "01001-000"},
+]
+
+
+def missing_combinations(parameters, rows, strength):
+    """List value combinations of `strength` parameters no row contains."""
+    missing = []
+    for names in combinations(parameters, strength):
+        for values in product(*(parameters[name] for name in names)):
+            if not any(
+                all(row[name] == value for name, value in zip(names, values))
+                for row in rows
+            ):
+                missing.append(dict(zip(names, values)))
+    return missing
+
+
+class TestCoveringRows:
+    """Test covering set construction."""
+
+    @pytest.mark.parametrize("strength", [1, 2, 3])
+    def test_covers_every_combination(self, strength):
+        """Every n-wise combination of values should appear in some row."""
+        parameters = {
+            "user": USERS + ["visual_user"],
+            "data": [0, 1],
+            **{name: [True, False] for name in PRODUCTS},
+        }
+
+        rows = covering_rows(parameters, strength)
+
+        assert missing_combinations(parameters, rows, strength) == []
+
+    def test_pairwise_is_much_smaller_than_full_product(self):
+        """Pairwise rows should grow with values, not their product."""
+        parameters = {name: [True, False] for name in range(20)}
+
+        rows = covering_rows(parameters)
+
+        assert len(rows) <= 12  # full product: 2**20 = 1048576
+
+    def test_is_deterministic(self):
+        """Same input should generate the same rows (stable test ids)."""
+        parameters = {"a": [1, 2, 3], "b": ["x", "y"], "c": [True, False]}
+
+        assert covering_rows(parameters) == covering_rows(parameters)
+
+    @pytest.mark.parametrize(
+        "parameters, strength",
+        [({"a": [1], "b": []}, 2), ({"a": [1], "b": [2]}, 3)],
+    )
+    def test_rejects_invalid_input(self, parameters, strength):
+        """Empty parameters or strength above the parameter count raise."""
+        with pytest.raises(ValueError):
+            covering_rows(parameters, strength)
+
+
+class TestCheckoutCombinations:
+    """Test cart/checkout case expansion."""
+
+    def test_cases_hold_product_lists_and_checkout_data(self):
+        """Cases should list products in catalog order with form fields."""
+        cases = checkout_combinations(PRODUCTS, USERS, CHECKOUT_DATA)
+
+        assert {case["user"] for case in cases} == set(USERS)
+        for case in cases:
+            assert case["products"] == [p for p in PRODUCTS if p in case["products"]]
+            assert {key: case[key] for key in CHECKOUT_DATA[0]} in CHECKOUT_DATA
+
+    def test_every_pair_of_products_is_bought_together(self):
+        """Pairwise cases should put every two products in one cart."""
+        cases = checkout_combinations(PRODUCTS, USERS, CHECKOUT_DATA)
+
+        for first, second in combinations(PRODUCTS, 2):
+            assert any(
+                first in case["products"] and second in case["products"]
+                for case in cases
+            )
+        assert len(cases) < 2 ** len(PRODUCTS) * len(USERS) * len(CHECKOUT_DATA)
+
+
+class TestRenderOutline:
+    """Test scenario outline rendering."""
+
+    def test_renders_one_example_row_per_case(self):
+        """Each case should become an Examples row; empty carts say none."""
+        cases = [
+            {"user": "standard_user", "products": ["Backpack", "Onesie"]}
+            | CHECKOUT_DATA[0],
+            {"user": "standard_user", "products": []} | CHECKOUT_DATA[1],
+        ]
+
+        feature = render_outline(cases)
+
+        assert "Scenario Outline:" in feature
+        assert "| Backpack, Onesie |" in feature
+        assert f"| {NO_PRODUCTS}" in feature
+        assert "01001-000" in feature
@@ -8,6 +8,8 @@ import pytest
 from core.config_resolver import (
     resolve_headless_mode,
     resolve_browser_name,
+    resolve_flag,
+    resolve_test_order,
     _str_to_bool,
     apply_config_hierarchy,
 )
@@ -181,6 +183,85 @@ class TestApplyConfigHierarchy:
 
         assert result["name"] == "chrome"
 
+    def test_apply_capture_events_with_cli_override(self):
+        """Should resolve capture_events flag from CLI value."""
+        config = {"capture_events": False}
+        result = apply_config_hierarchy(
+            config, key="capture_events", cli_value="true", env_value=None
+        )
+
+        assert result["capture_events"] is True
+
+    def test_apply_capture_events_defaults_to_false_when_missing(self):
+        """Should default capture_events to False when key is missing."""
+        config = {}
+        result = apply_config_hierarchy(
+            config, key="capture_events", cli_value=None, env_value=None
+        )
+
+        assert result["capture_events"] is False
+
+
+class TestResolveBaseUrl:
+    """Test resolving the target base URL."""
+
+    def test_cli_overrides_config_and_strips_trailing_slash(self):
+        """CLI value should win and be normalized."""
+        config = {"base_url": "https://www.saucedemo.com"}
+        result = apply_config_hierarchy(
+            config, key="base_url", cli_value="http://localhost:8000/", env_value=None
+        )
+
+        assert result["base_url"] == "http://localhost:8000"
+
+    def test_config_used_when_no_overrides(self):
+        """Config value should be kept when no overrides are provided."""
+        config = {"base_url": "https://www.saucedemo.com"}
+        result = apply_config_hierarchy(
+            config, key="base_url", cli_value=None, env_value=None
+        )
+
+        assert result["base_url"] == "https://www.saucedemo.com"
+
+
+class TestResolveFlag:
+    """Test resolving opt-in boolean flags."""
+
+    def test_cli_takes_precedence_over_env(self):
+        """CLI value should override environment variable."""
+        assert resolve_flag("false", "true", True) is False
+
+    def test_env_used_when_cli_missing(self):
+        """ENV value should be used when CLI is not set."""
+        assert resolve_flag(None, "yes", False) is True
+
+    def test_config_used_when_no_overrides(self):
+        """Config value should be used when no overrides are provided."""
+        assert resolve_flag(None, None, True) is True
+
+
+class TestResolveTestOrder:
+    """Test resolving the test ordering policy and fail-fast count."""
+
+    def test_cli_overrides_config_and_normalizes(self):
+        """CLI value should win and be lowercased."""
+        assert resolve_test_order(" Failed ", None, "none") == "failed"
+
+    def test_unknown_policy_raises(self):
+        """Unsupported policies should be rejected with the accepted values."""
+        with pytest.raises(ValueError, match="shortest"):
+            resolve_test_order("slowest", None, "none")
+
+    def test_missing_keys_default_to_disabled(self):
+        """Missing history settings should mean original order, no fail-fast."""
+        config = {}
+        apply_config_hierarchy(config, key="test_order", cli_value=None, env_value=None)
+        apply_config_hierarchy(
+            config, key="fail_fast_after", cli_value=None, env_value="3"
+        )
+
+        assert config == {"test_order": "none", "fail_fast_after": 3}
+
 
 class TestResolveBrowserName:
     """Test browser name resolution with configuration hierarchy."""
@@ -3,11 +3,19 @@
 Tests WebDriver creation and configuration in isolation using mocks.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
 from core.driver_manager import DriverManager
+from core.http_driver import HttpDriver
 
 
 class TestDriverManagerInit:
@@ -56,6 +64,45 @@ class TestGetDriver:
             mock_create.assert_called_once()  # Only one creation
             assert first_result == second_result
 
+    def test_get_driver_skips_event_capture_by_default(self):
+        """get_driver should not open an event channel unless configured."""
+        manager = DriverManager({"name": "chrome"})
+
+        with patch.object(manager, "_create_driver", return_value=Mock()):
+            manager.get_driver()
+
+        assert manager.event_capture is None
+
+    def test_get_driver_attaches_event_capture_when_enabled(self):
+        """get_driver should attach a bounded event buffer when enabled."""
+        browser_config = {
+            "name": "chrome",
+            "capture_events": True,
+            "event_buffer_size": 50,
+        }
+        manager = DriverManager(browser_config)
+
+        with patch.object(manager, "_create_driver") as mock_create:
+            mock_driver = Mock()
+            mock_create.return_value = mock_driver
+
+            manager.get_driver()
+
+        assert manager.event_capture is not None
+        assert manager.event_capture.max_events == 50
+        mock_driver.script.add_console_message_handler.assert_called_once()
+
+    def test_get_driver_reports_unavailable_event_capture(self, capsys):
+        """A browser without BiDi event streaming should be reported."""
+        manager = DriverManager({"name": "chrome", "capture_events": True})
+
+        with patch.object(manager, "_create_driver") as mock_create:
+            mock_create.return_value.script = None  # no BiDi script module
+            manager.get_driver()
+
+        assert manager.event_capture is None
+        assert "no events are captured" in capsys.readouterr().out
+
 
 class TestCreateDriver:
     """Test _create_driver method (browser routing)."""
@@ -88,6 +135,15 @@ class TestCreateDriver:
             mock_firefox.assert_called_once()
             assert result == mock_driver
 
+    def test_create_driver_returns_http_driver_for_http_browser(self):
+        """_create_driver should build an HttpDriver for 'http' config."""
+        manager = DriverManager({"name": "http", "request_timeout": 3})
+
+        result = manager._create_driver()
+
+        assert isinstance(result, HttpDriver)
+        assert result.timeout == 3
+
     def test_create_driver_defaults_to_chrome_when_name_missing(self):
         """_create_driver should default to Chrome when 'name' not in config."""
         browser_config = {}  # No 'name' key
@@ -185,6 +241,20 @@ class TestCreateChromeDriver:
 
                 mock_options.add_argument.assert_any_call("--window-size=1920,1080")
 
+    def test_create_chrome_driver_enables_bidi_when_capturing_events(self):
+        """_create_chrome_driver should enable BiDi when capture_events is set."""
+        browser_config = {"name": "chrome", "capture_events": True}
+        manager = DriverManager(browser_config)
+
+        with patch("core.driver_manager.webdriver.Chrome"):
+            with patch("core.driver_manager.ChromeOptions") as mock_options_class:
+                mock_options = Mock()
+                mock_options_class.return_value = mock_options
+
+                manager._create_chrome_driver()
+
+                assert mock_options.enable_bidi is True
+
 
 class TestCreateFirefoxDriver:
     """Test _create_firefox_driver method."""
@@ -326,3 +396,170 @@ class TestQuit:
         manager.quit()
 
         assert manager._driver is None
+
+
+def make_bidi_driver():
+    """Create a WebDriver whose HTTP commands and BiDi modules are mocked."""
+    executor = Mock()
+    executor.execute.return_value = {
+        "value": {"sessionId": "session", "capabilities": {}}
+    }
+    driver = WebDriver(command_executor=executor, options=ChromeOptions())
+    executor.execute.reset_mock()
+    executor.execute.return_value = {"value": None}
+    driver._websocket_connection = Mock()
+    driver._browser = Mock()
+    driver._browser.create_user_context.side_effect = ["user-1", "user-2"]
+    driver._browsing_context = Mock()
+    driver._browsing_context.create.side_effect = ["window-1", "window-2"]
+    return driver
+
+
+class TestUserContexts:
+    """Test isolated sessions sharing one browser."""
+
+    def test_create_chrome_driver_enables_bidi_for_user_contexts(self):
+        """user_contexts needs the BiDi channel."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+
+        with patch("core.driver_manager.webdriver.Chrome"):
+            with patch("core.driver_manager.ChromeOptions") as mock_options_class:
+                manager._create_chrome_driver()
+
+        assert mock_options_class.return_value.enable_bidi is True
+
+    def test_new_context_opens_window_in_new_user_context(self):
+        """Each context gets its own user context (cookie jar) and window."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        driver = manager._driver = make_bidi_driver()
+
+        manager.new_context()
+
+        driver._browsing_context.create.assert_called_once_with(
+            type="window", user_context="user-1"
+        )
+        assert manager.open_contexts == 1
+
+    def test_context_commands_switch_to_their_window(self):
+        """Commands of interleaved contexts run in their own windows."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        driver = manager._driver = make_bidi_driver()
+        first, second = manager.new_context(), manager.new_context()
+
+        first.get("https://www.saucedemo.com/")
+        first.refresh()
+        second.refresh()
+
+        commands = [
+            (call.args[0], call.args[1].get("handle"))
+            for call in driver.command_executor.execute.call_args_list
+        ]
+        assert commands == [
+            (Command.SWITCH_TO_WINDOW, "window-1"),
+            (Command.GET, None),
+            (Command.REFRESH, None),
+            (Command.SWITCH_TO_WINDOW, "window-2"),
+            (Command.REFRESH, None),
+        ]
+
+    def test_elements_belong_to_their_context(self):
+        """Element commands should also switch to the context's window."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        driver = manager._driver = make_bidi_driver()
+        first, second = manager.new_context(), manager.new_context()
+        driver.command_executor.execute.return_value = {
+            "value": {"element-6066-11e4-a52e-4f735466cecf": "element-1"}
+        }
+        element = first.find_element("id", "login-button")
+        second.refresh()
+        driver.command_executor.execute.reset_mock()
+
+        element.click()
+
+        assert element.parent is first
+        switch = driver.command_executor.execute.call_args_list[0]
+        assert switch.args == (
+            Command.SWITCH_TO_WINDOW,
+            {"handle": "window-1", "sessionId": "session"},
+        )
+
+    def test_context_quit_closes_only_its_context(self):
+        """quit() of a context driver must keep the browser running."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        driver = manager._driver = make_bidi_driver()
+        context_driver = manager.new_context()
+
+        context_driver.quit()
+
+        driver._browser.remove_user_context.assert_called_once_with("user-1")
+        assert manager._driver is driver
+        assert manager.open_contexts == 0
+
+    def test_new_context_in_http_mode_returns_separate_driver(self):
+        """The HTTP backend has no browser to share: each context is a client."""
+        manager = DriverManager({"name": "http"})
+
+        first, second = manager.new_context(), manager.new_context()
+
+        assert isinstance(first, HttpDriver)
+        assert first is not second
+
+
+class TestThreadSafety:
+    """Test a manager shared by threads."""
+
+    def test_concurrent_get_driver_creates_one_driver(self):
+        """Threads asking at the same time must share one browser."""
+        manager = DriverManager({"name": "chrome"})
+
+        def slow_create():
+            time.sleep(0.05)
+            return Mock()
+
+        with patch.object(manager, "_create_driver", side_effect=slow_create) as create:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                drivers = list(pool.map(lambda _: manager.get_driver(), range(8)))
+
+        create.assert_called_once()
+        assert all(driver is drivers[0] for driver in drivers)
+
+    def test_concurrent_quit_quits_once(self):
+        """quit() from several threads must quit the driver exactly once."""
+        manager = DriverManager({"name": "chrome"})
+        driver = manager._driver = Mock()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: manager.quit(), range(8)))
+
+        driver.quit.assert_called_once()
+        assert manager._driver is None
+
+    def test_thread_context_is_bound_per_thread(self):
+        """Each thread reuses its own context until it is closed."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        manager._driver = make_bidi_driver()
+        bound = {}
+
+        def use_context(name):
+            bound[name] = manager.thread_context()
+            assert manager.thread_context() is bound[name]
+
+        threads = [threading.Thread(target=use_context, args=(n,)) for n in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert bound["a"] is not bound["b"]
+        assert manager.open_contexts == 2
+
+    def test_thread_context_reopens_after_close(self):
+        """A closed context is replaced on the next call."""
+        manager = DriverManager({"name": "chrome", "user_contexts": True})
+        manager._driver = make_bidi_driver()
+        first = manager.thread_context()
+
+        first.quit()
+
+        assert manager.thread_context() is not first
+        assert manager.open_contexts == 1
@@ -0,0 +1,48 @@
+"""Unit tests for the Behave environment hooks.
+
+Tests the browser event report of after_scenario with a stub context.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from behave.model_core import Status
+
+from features.environment import after_scenario
+
+
+def make_context():
+    """Build a context with captured browser events and no recorders."""
+    events = Mock()
+    events.snapshot.return_value = {"errors": [{"text": "TypeError: x is null"}]}
+    events.console_errors.return_value = [{"text": "Failed to load resource"}]
+    return SimpleNamespace(
+        scenario_cached=False,
+        browser_events=events,
+        performance_recorder=None,
+        memory_monitor=None,
+        shared_driver_manager=None,
+        impact_tracer=None,
+    )
+
+
+class TestBrowserEventReport:
+    """Test printing captured browser errors of failed scenarios."""
+
+    @pytest.mark.parametrize("status", [Status.failed, Status.error])
+    def test_failed_or_errored_scenario_prints_events(self, status, capsys):
+        """Assertion failures and errors (e.g., TimeoutException) both report."""
+        with patch("features.environment.record_outcome"):
+            after_scenario(make_context(), Mock(status=status))
+
+        output = capsys.readouterr().out
+        assert "[browser] JS exception: TypeError: x is null" in output
+        assert "[browser] console error: Failed to load resource" in output
+
+    def test_passed_scenario_prints_nothing(self, capsys):
+        """Events of passing scenarios are not printed."""
+        with patch("features.environment.record_outcome"):
+            after_scenario(make_context(), Mock(status=Status.passed))
+
+        assert "[browser]" not in capsys.readouterr().out
@@ -0,0 +1,154 @@
+"""Unit tests for browser event capture.
+
+Tests BiDi payload normalization and bounded buffering without a browser.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from selenium.common.exceptions import WebDriverException
+
+from core.event_capture import (
+    EventCapture,
+    console_event_from_payload,
+    error_event_from_payload,
+    network_event_from_payload,
+)
+
+
+class TestNetworkEventFromPayload:
+    """Test normalization of network.responseCompleted payloads."""
+
+    def test_normalizes_dict_payload(self):
+        """Should extract url, status and in-browser duration from dicts."""
+        payload = {
+            "request": {
+                "url": "https://www.saucedemo.com/",
+                "method": "GET",
+                "timings": {"requestStart": 10.0, "responseEnd": 55.5},
+            },
+            "response": {"status": 200},
+            "timestamp": 1700000000000,
+        }
+
+        event = network_event_from_payload(payload)
+
+        assert event["url"] == "https://www.saucedemo.com/"
+        assert event["method"] == "GET"
+        assert event["status"] == 200
+        assert event["duration_ms"] == 45.5
+
+    def test_normalizes_dataclass_payload(self):
+        """Should read snake_case attributes from generated dataclasses."""
+        timings = SimpleNamespace(request_start=5.0, response_end=15.0)
+        payload = SimpleNamespace(
+            request={"url": "https://x/", "method": "GET", "timings": timings},
+            response={"status": 404},
+            timestamp=1,
+        )
+
+        event = network_event_from_payload(payload)
+
+        assert event["status"] == 404
+        assert event["duration_ms"] == 10.0
+
+    def test_duration_is_none_without_timings(self):
+        """Should report None duration when browser sends no timings."""
+        event = network_event_from_payload({"request": {"url": "https://x/"}})
+
+        assert event["duration_ms"] is None
+
+
+class TestLogEventFromPayload:
+    """Test normalization of console and JavaScript error entries."""
+
+    def test_console_event_reads_level_and_text(self):
+        """Should keep level and text of console entries."""
+        entry = SimpleNamespace(level="error", text="boom", timestamp=1)
+
+        event = console_event_from_payload(entry)
+
+        assert event == {"level": "error", "text": "boom", "timestamp": 1}
+
+    def test_error_event_reads_stacktrace(self):
+        """Should keep text and stack trace of JS exceptions."""
+        entry = SimpleNamespace(text="TypeError", stacktrace="at x", timestamp=2)
+
+        event = error_event_from_payload(entry)
+
+        assert event["text"] == "TypeError"
+        assert event["stack_trace"] == "at x"
+
+
+class TestEventCaptureBuffer:
+    """Test bounded buffering behaviour."""
+
+    def test_buffer_discards_oldest_events_when_full(self):
+        """Should keep only the newest max_events per channel."""
+        capture = EventCapture(max_events=2)
+
+        for index in range(3):
+            capture.record("console", {"level": "info", "text": str(index)})
+
+        events = capture.snapshot()
+        assert [e["text"] for e in events["console"]] == ["1", "2"]
+        assert events["dropped"]["console"] == 1
+
+    def test_drain_returns_and_clears_events(self):
+        """drain should return buffered events and reset buffers."""
+        capture = EventCapture()
+        capture.record("errors", {"text": "boom"})
+
+        drained = capture.drain()
+
+        assert drained["errors"] == [{"text": "boom"}]
+        assert capture.snapshot()["errors"] == []
+
+    def test_console_errors_filters_by_level(self):
+        """console_errors should return only error-level messages."""
+        capture = EventCapture()
+        capture.record("console", {"level": "info", "text": "ok"})
+        capture.record("console", {"level": "error", "text": "bad"})
+
+        assert capture.console_errors() == [{"level": "error", "text": "bad"}]
+
+
+class TestEventCaptureAttach:
+    """Test subscribing to BiDi events on a driver."""
+
+    def test_attach_registers_all_handlers(self):
+        """attach should subscribe to console, JS error and network events."""
+        driver = Mock()
+        capture = EventCapture()
+
+        assert capture.attach(driver) is True
+
+        driver.script.add_console_message_handler.assert_called_once()
+        driver.script.add_javascript_error_handler.assert_called_once()
+        driver.network.add_event_handler.assert_called_once()
+        assert driver.network.add_event_handler.call_args[0][0] == (
+            "response_completed"
+        )
+        assert capture.attached is True
+
+    def test_attach_handlers_record_into_buffers(self):
+        """Registered callbacks should push normalized events into buffers."""
+        driver = Mock()
+        capture = EventCapture()
+        capture.attach(driver)
+
+        console_callback = driver.script.add_console_message_handler.call_args[0][0]
+        console_callback(SimpleNamespace(level="warn", text="careful"))
+
+        assert capture.snapshot()["console"][0]["text"] == "careful"
+
+    def test_attach_returns_false_when_bidi_unavailable(self):
+        """attach should degrade gracefully without a BiDi session."""
+        driver = Mock()
+        driver.script.add_console_message_handler.side_effect = WebDriverException(
+            "Unable to find url to connect to"
+        )
+        capture = EventCapture()
+
+        assert capture.attach(driver) is False
+        assert capture.attached is False
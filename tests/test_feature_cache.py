@@ -0,0 +1,106 @@
+"""Unit tests for the parsed feature file cache.
+
+Tests cache hits, invalidation on content change and scenario selection
+by file location using temporary feature files.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from behave.runner_util import FileLocation
+
+from core.feature_cache import feature_cache_key, load_feature, parse_features
+
+FEATURE = """@e2e
+Feature: Login
+
+  @smoke
+  Scenario: Successful login
+    Given I am on the login page
+    When I login with "standard_user"
+
+  Scenario Outline: Failed login
+    When I login with "<user>"
+    Then I should see an error
+
+    Examples:
+      | user   |
+      | locked |
+      | bad    |
+"""
+
+
+@pytest.fixture
+def feature_file(tmp_path):
+    """Write a feature file."""
+    path = tmp_path / "login.feature"
+    path.write_text(FEATURE, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory isolated per test."""
+    return str(tmp_path / "cache")
+
+
+class TestLoadFeature:
+    """Test load_feature caching."""
+
+    def test_second_load_skips_parser(self, feature_file, cache_dir):
+        """Unchanged files should be loaded from the cache."""
+        load_feature(feature_file, cache_dir=cache_dir)
+
+        with patch("core.feature_cache.parse_feature") as mock_parse:
+            feature = load_feature(feature_file, cache_dir=cache_dir)
+
+        mock_parse.assert_not_called()
+        assert feature.name == "Login"
+
+    def test_cached_model_matches_parsed_model(self, feature_file, cache_dir):
+        """Cached features should keep tags, outlines and steps."""
+        load_feature(feature_file, cache_dir=cache_dir)
+        feature = load_feature(feature_file, cache_dir=cache_dir)
+
+        scenarios = list(feature.walk_scenarios())
+        assert len(scenarios) == 3
+        assert feature.tags == ["e2e"]
+        assert scenarios[0].tags[0].line == 4
+        assert scenarios[0].feature is feature
+
+    def test_changed_content_is_reparsed(self, feature_file, cache_dir, tmp_path):
+        """Editing a feature file should invalidate its cache entry."""
+        load_feature(feature_file, cache_dir=cache_dir)
+        (tmp_path / "login.feature").write_text(
+            FEATURE.replace("Feature: Login", "Feature: Sign in"), encoding="utf-8"
+        )
+
+        feature = load_feature(feature_file, cache_dir=cache_dir)
+
+        assert feature.name == "Sign in"
+
+    def test_corrupt_entry_is_reparsed(self, feature_file, cache_dir, tmp_path):
+        """A damaged cache entry should fall back to parsing."""
+        load_feature(feature_file, cache_dir=cache_dir)
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        assert load_feature(feature_file, cache_dir=cache_dir).name == "Login"
+
+    def test_key_depends_on_language(self):
+        """Parsing with another language should use another entry."""
+        assert feature_cache_key("a.feature", b"x", None) != feature_cache_key(
+            "a.feature", b"x", "pt"
+        )
+
+
+class TestParseFeatures:
+    """Test cached parse_features."""
+
+    def test_file_location_selects_scenario(self, feature_file, cache_dir):
+        """Line-number locations should select only that scenario."""
+        features = parse_features([FileLocation(feature_file, 5)], cache_dir=cache_dir)
+
+        feature = features[0]
+        selected = [s.name for s in feature.walk_scenarios() if s.should_run()]
+        assert selected == ["Successful login"]
@@ -0,0 +1,121 @@
+"""Unit tests for test outcome history and ordering.
+
+Tests outcome recording, merging across runs, ordering policies and
+in-place ordering of parsed Behave features.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from behave.parser import parse_feature
+
+from core.history import OutcomeHistory
+from core.runner import order_features
+
+FEATURE = """Feature: Cart
+  Scenario: Add
+    Given I add a product
+
+  Scenario Outline: Remove <n>
+    Given I remove <n>
+
+    Examples:
+      | n |
+      | 1 |
+      | 2 |
+
+  Scenario: Checkout
+    Given I check out
+"""
+
+
+def save_outcomes(path, worker):
+    """Save distinct outcomes from one process (e.g., an xdist worker)."""
+    history = OutcomeHistory(path)
+    for index in range(50):
+        history.record("pytest", f"test_{worker}_{index}", True, 0.1)
+    history.save()
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Create history stored in a temporary file."""
+    return OutcomeHistory(str(tmp_path / "history.json"), window=3)
+
+
+class TestRecording:
+    """Test recording and saving outcomes."""
+
+    def test_save_appends_outcomes_within_window(self, history):
+        """Outcomes should accumulate across runs, keeping the last N."""
+        for passed in (True, False, True, False):
+            history.record("pytest", "t", passed, 0.5)
+            history.save()
+
+        assert history.outcomes("pytest", "t") == "FPF"
+
+    def test_save_keeps_entries_of_concurrent_runs(self, history):
+        """Saving should merge with entries written by another run."""
+        other = OutcomeHistory(str(history.path))
+        other.record("behave", "features/a.feature:3", True, 1.0)
+        other.save()
+
+        history.record("pytest", "t", True, 0.1)
+        history.save()
+
+        assert history.outcomes("behave", "features/a.feature:3") == "P"
+        assert history.outcomes("pytest", "t") == "P"
+
+    def test_concurrent_processes_keep_all_entries(self, history):
+        """Saves of concurrent processes should not overwrite each other."""
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(save_outcomes, [str(history.path)] * 8, range(8)))
+
+        assert len(OutcomeHistory(str(history.path)).entries["pytest"]) == 400
+
+    def test_counts_failures_of_current_run(self, history):
+        """Failure count drives --fail-fast-after."""
+        history.record("pytest", "a", False, 0.1)
+        history.record("pytest", "b", True, 0.1)
+
+        assert history.failures == 1
+
+
+class TestOrdering:
+    """Test ordering policies."""
+
+    def test_none_keeps_original_order(self, history):
+        """Policy 'none' should not reorder."""
+        history.entries["pytest"] = {"b": {"outcomes": "F", "duration": 1}}
+
+        assert history.order("pytest", ["a", "b"], "none") == ["a", "b"]
+
+    def test_unknown_policy_raises(self, history):
+        """Unsupported policies should raise ValueError."""
+        with pytest.raises(ValueError):
+            history.order("pytest", ["a"], "random")
+
+    def test_orders_behave_features_and_scenarios(self, history):
+        """Failed scenarios (and their feature) should run first."""
+        cart = parse_feature(FEATURE, filename="features/cart.feature")
+        login = parse_feature(
+            "Feature: Login\n  Scenario: Ok\n    Given I log in\n",
+            filename="features/login.feature",
+        )
+        history.entries["behave"] = {
+            "features/login.feature:2": {"outcomes": "P", "duration": 1},
+            "features/cart.feature:2": {"outcomes": "P", "duration": 1},
+            "features/cart.feature:11": {"outcomes": "PF", "duration": 1},
+            "features/cart.feature:13": {"outcomes": "P", "duration": 1},
+        }
+        features = [login, cart]
+
+        order_features(features, history, "failed")
+
+        assert [f.name for f in features] == ["Cart", "Login"]
+        # The outline moves as a unit with its failed example row
+        assert [item.name for item in cart.run_items] == [
+            "Remove <n>",
+            "Add",
+            "Checkout",
+        ]
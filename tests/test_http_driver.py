@@ -0,0 +1,221 @@
+"""Unit tests for the HTTP-level WebDriver backend.
+
+Tests HTML parsing, locator strategies and page object compatibility using
+canned responses instead of a live server.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+)
+from selenium.webdriver.common.by import By
+
+from core.http_driver import HttpDriver, parse_html, select
+from pages.inventory_page import InventoryPage
+
+INVENTORY_HTML = """
+<html>
+<head><title>Swag Labs</title><script>var x = "ignored";</script></head>
+<body>
+<div id="inventory_container">
+  <span class="title">Products</span>
+  <a class="shopping_cart_link" href="/cart.html">
+    <span class="shopping_cart_badge">2</span>
+  </a>
+  <select class="product_sort_container" data-test="product-sort-container">
+    <option value="az">Name (A to Z)</option>
+    <option value="za" selected>Name (Z to A)</option>
+  </select>
+  <div class="inventory_item">
+    <div class="inventory_item_name">Sauce Labs Onesie</div>
+    <div class="inventory_item_price">$7.99</div>
+    <button id="add-to-cart-sauce-labs-onesie" disabled>Add</button>
+  </div>
+  <div class="inventory_item">
+    <div class="inventory_item_name">Sauce Labs
+      Backpack</div>
+    <div class="inventory_item_price">$29.99</div>
+    <img src="/img/backpack.jpg">
+  </div>
+  <div class="inventory_item" style="display: none">
+    <div class="inventory_item_name">Hidden Item</div>
+  </div>
+</div>
+<form action="/login" method="post">
+  <input name="user-name" id="user-name">
+  <input type="hidden" name="token" value="abc">
+  <input type="submit" id="login-button" value="Login">
+</form>
+</body>
+</html>
+"""
+
+
+def make_response(html, url="https://shop.test/inventory.html"):
+    """Build a canned requests response."""
+    response = Mock()
+    response.text = html
+    response.url = url
+    return response
+
+
+@pytest.fixture
+def driver():
+    """HttpDriver with the inventory page loaded."""
+    with patch("core.http_driver.requests.Session") as mock_session:
+        http_driver = HttpDriver()
+        mock_session.return_value.get.return_value = make_response(INVENTORY_HTML)
+        http_driver.get("https://shop.test/inventory.html")
+        yield http_driver
+
+
+class TestSelect:
+    """Test locator strategies on parsed HTML."""
+
+    def test_by_class_name_and_id(self):
+        """Should match class lists and ids."""
+        root = parse_html('<p class="a b" id="x"></p><p class="b"></p>')
+
+        assert len(select(root, By.CLASS_NAME, "b")) == 2
+        assert select(root, By.ID, "x")[0].tag == "p"
+
+    def test_css_compound_descendant_and_child(self):
+        """Should support tag/class/attribute compounds and combinators."""
+        root = parse_html(
+            '<div class="item"><span><img alt="x"></span></div><img alt="y">'
+        )
+
+        assert len(select(root, By.CSS_SELECTOR, ".item img")) == 1
+        assert select(root, By.CSS_SELECTOR, ".item > img") == []
+        assert len(select(root, By.CSS_SELECTOR, "img[alt='y'], div.item")) == 2
+
+    def test_css_attribute_with_spaces_like_selenium_select(self):
+        """Should parse selectors built by Select.select_by_value."""
+        root = parse_html('<option value="az"></option><option value="za"></option>')
+
+        matches = select(root, By.CSS_SELECTOR, 'option[value ="za"]')
+
+        assert [m.attrs["value"] for m in matches] == ["za"]
+
+    def test_xpath_not_supported(self):
+        """Should reject locator strategies without an HTML equivalent."""
+        with pytest.raises(InvalidSelectorException):
+            select(parse_html("<p></p>"), By.XPATH, "//p")
+
+
+class TestHttpDriver:
+    """Test WebDriver-compatible surface."""
+
+    def test_title_and_current_url(self, driver):
+        """Should expose document title and final URL."""
+        assert driver.title == "Swag Labs"
+        assert driver.current_url == "https://shop.test/inventory.html"
+
+    def test_text_is_whitespace_normalized(self, driver):
+        """Should collapse whitespace like rendered text."""
+        names = driver.find_elements(By.CLASS_NAME, "inventory_item_name")
+
+        assert names[1].text == "Sauce Labs Backpack"
+
+    def test_hidden_elements_report_not_displayed(self, driver):
+        """Should treat display:none and hidden inputs as not displayed."""
+        names = driver.find_elements(By.CLASS_NAME, "inventory_item_name")
+
+        assert names[2].is_displayed() is False
+        assert names[2].text == ""
+        assert driver.find_element(By.NAME, "token").is_displayed() is False
+
+    def test_find_element_raises_when_missing(self, driver):
+        """Should raise NoSuchElementException like WebDriver."""
+        with pytest.raises(NoSuchElementException):
+            driver.find_element(By.ID, "missing")
+
+    def test_disabled_button_not_enabled(self, driver):
+        """Should report disabled attribute through is_enabled."""
+        button = driver.find_element(By.ID, "add-to-cart-sauce-labs-onesie")
+
+        assert button.is_enabled() is False
+
+    def test_href_resolved_against_current_url(self, driver):
+        """Should resolve relative links like a browser."""
+        link = driver.find_element(By.CLASS_NAME, "shopping_cart_link")
+
+        assert link.get_attribute("href") == "https://shop.test/cart.html"
+
+    def test_click_link_navigates(self, driver):
+        """Clicking a link should GET its target."""
+        driver.session.get.return_value = make_response(
+            "<title>Cart</title>", "https://shop.test/cart.html"
+        )
+
+        driver.find_element(By.CLASS_NAME, "shopping_cart_badge").click()
+
+        driver.session.get.assert_called_with("https://shop.test/cart.html", timeout=10)
+        assert driver.title == "Cart"
+
+    def test_submit_posts_typed_values(self, driver):
+        """Clicking submit should post form fields including typed text."""
+        driver.session.post.return_value = make_response("<title>Home</title>")
+        field = driver.find_element(By.ID, "user-name")
+        field.clear()
+        field.send_keys("standard_user")
+
+        driver.find_element(By.ID, "login-button").click()
+
+        driver.session.post.assert_called_once_with(
+            "https://shop.test/login",
+            data={"user-name": "standard_user", "token": "abc"},
+            timeout=10,
+        )
+
+    def test_execute_script_is_noop(self, driver):
+        """Should return None so optional in-page helpers degrade gracefully."""
+        assert driver.execute_script("return 1") is None
+
+
+class TestPageObjectCompatibility:
+    """Test page objects running unchanged on HttpDriver."""
+
+    def test_inventory_page_reads_products(self, driver):
+        """InventoryPage non-visual checks should work over HTTP."""
+        page = InventoryPage(driver)
+
+        assert page.is_on_inventory_page()
+        assert page.get_page_title() == "Products"
+        assert page.get_product_prices() == [7.99, 29.99]
+        assert page.get_cart_item_count() == 2
+
+    def test_inventory_verify_order_checks_locally(self, driver):
+        """Without JavaScript, verify_order should check values in Python."""
+        page = InventoryPage(driver)
+
+        assert page.verify_order("price", "asc") == (True, None)
+        assert page.verify_order("price", "desc") == (False, (7.99, 29.99))
+
+    def test_inventory_snapshot_reads_elements(self, driver):
+        """Without JavaScript, snapshots should be read from elements."""
+        snapshot = InventoryPage(driver).snapshot()
+
+        assert snapshot["title"] == "Products"
+        assert snapshot["badge"] == "2"
+        assert snapshot["buttons"] == {"add-to-cart-sauce-labs-onesie": "Add"}
+
+    def test_inventory_index_reads_elements(self, driver):
+        """Without JavaScript, the product index should use element reads."""
+        page = InventoryPage(driver)
+
+        assert page.has_product("Sauce Labs Backpack")
+        assert page.index_products()["Sauce Labs Onesie"]["price"] == 7.99
+
+    def test_inventory_sort_dropdown(self, driver):
+        """Select-based helpers should read and change the selected option."""
+        page = InventoryPage(driver)
+
+        assert page.get_current_sort_option() == "za"
+
+        page.select_sort_option("az")
+
+        assert page.get_current_sort_option() == "az"
@@ -0,0 +1,205 @@
+"""Unit tests for test impact analysis.
+
+Tests call tracing, incremental map storage, diff-to-function mapping and
+test selection using temporary files and canned maps.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import Mock
+
+from core.impact import (
+    ImpactTracer,
+    changed_functions,
+    load_impact_map,
+    parse_diff_lines,
+    save_impact_map,
+    select_impacted,
+)
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+
+SOURCE = '''"""Module."""
+
+LOCATOR = ("id", "x")
+
+
+class Page:
+    TITLE = ("id", "title")
+
+    @property
+    def title(self):
+        return 1
+
+    def open(self):
+        def helper():
+            return 2
+
+        return helper()
+'''
+
+IMPACT_MAP = {
+    "behave": {
+        "features/cart.feature:11": [
+            "features/steps/cart_steps.py::step_add_to_cart",
+            "pages/inventory_page.py::InventoryPage.add_product_to_cart",
+        ],
+        "features/checkout.feature:12": [
+            "pages/checkout_step_two_page.py::CheckoutStepTwoPage.get_item_total",
+        ],
+    },
+    "pytest": {
+        "tests/test_cart_page.py::test_items": [
+            "pages/cart_page.py::CartPage.get_items"
+        ],
+        "tests/test_checkout_step_two_page.py::test_total": [
+            "pages/checkout_step_two_page.py::CheckoutStepTwoPage.get_item_total",
+        ],
+    },
+}
+
+
+def save_traced_tests(path, worker):
+    """Save distinct traced tests from one process (e.g., an xdist worker)."""
+    for index in range(20):
+        save_impact_map({"pytest": {f"test_{worker}_{index}": ["x"]}}, path)
+
+
+class TestImpactTracer:
+    """Test call recording."""
+
+    def test_records_traced_functions_only(self):
+        """Should record page object methods but not test or library code."""
+        tracer = ImpactTracer()
+
+        tracer.start()
+        CartPage(Mock())
+        sorted([3, 1])
+        tracer.stop("pytest", "tests/test_x.py::test_a")
+
+        assert tracer.entries["pytest"]["tests/test_x.py::test_a"] == [
+            "pages/base_page.py::BasePage.__init__",
+            "pages/base_page.py::BasePage.driver_state",
+            "pages/base_page.py::PageState.__init__",
+        ]
+
+    def test_restores_previous_profile_hook(self):
+        """Should not leave the profile hook installed after stop."""
+        import sys
+
+        previous = sys.getprofile()
+        tracer = ImpactTracer()
+
+        tracer.start()
+        BasePage(Mock())
+        tracer.stop("behave", "features/a.feature:3")
+
+        assert sys.getprofile() is previous
+
+
+class TestImpactMapStorage:
+    """Test incremental map updates."""
+
+    def test_save_merges_with_existing_entries(self, tmp_path):
+        """A partial run should replace only the entries it traced."""
+        map_path = str(tmp_path / "impact.json")
+        save_impact_map({"pytest": {"a": ["x"], "b": ["y"]}}, map_path)
+
+        save_impact_map({"pytest": {"b": ["z"]}, "behave": {}}, map_path)
+
+        assert load_impact_map(map_path)["pytest"] == {"a": ["x"], "b": ["z"]}
+
+    def test_concurrent_processes_keep_all_entries(self, tmp_path):
+        """Saves of concurrent workers should not overwrite each other."""
+        map_path = str(tmp_path / "impact.json")
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(save_traced_tests, [map_path] * 4, range(4)))
+
+        assert len(load_impact_map(map_path)["pytest"]) == 80
+
+    def test_missing_map_is_empty(self, tmp_path):
+        """Should return empty sections before the first traced run."""
+        assert load_impact_map(str(tmp_path / "none.json")) == {
+            "behave": {},
+            "pytest": {},
+        }
+
+
+class TestDiffMapping:
+    """Test diff parsing and changed function detection."""
+
+    def test_pure_deletion_records_position(self):
+        """Deleted lines should map to the line where they were removed."""
+        diff = "+++ b/pages/a.py\n@@ -5,2 +4,0 @@\n"
+
+        assert parse_diff_lines(diff) == {"pages/a.py": {4}}
+
+    def test_method_change_maps_to_qualname(self):
+        """Lines inside a method should map to Class.method."""
+        assert changed_functions(SOURCE, {11}) == {"Page.title"}
+
+    def test_decorator_belongs_to_function(self):
+        """Changing a decorator should affect the decorated function."""
+        assert changed_functions(SOURCE, {9}) == {"Page.title"}
+
+    def test_nested_function_uses_locals_qualname(self):
+        """Nested functions should match code.co_qualname."""
+        assert changed_functions(SOURCE, {15}) == {"Page.open.<locals>.helper"}
+
+    def test_module_or_class_level_change_affects_whole_file(self):
+        """Locator constants are not in a function: whole file is affected."""
+        assert changed_functions(SOURCE, {3}) is None
+        assert changed_functions(SOURCE, {7}) is None
+
+
+class TestSelectImpacted:
+    """Test selection rules."""
+
+    def test_function_change_selects_only_callers(self):
+        """Only tests that called the changed method should be selected."""
+        changes = {
+            "pages/checkout_step_two_page.py": {"CheckoutStepTwoPage.get_item_total"}
+        }
+
+        selection = select_impacted(IMPACT_MAP, changes)
+
+        assert selection["behave"] == ["features/checkout.feature:12"]
+        assert selection["pytest"] == [
+            "tests/test_checkout_step_two_page.py::test_total"
+        ]
+        assert selection["run_all"] == []
+
+    def test_whole_file_change_selects_all_users_of_file(self):
+        """A module-level change should select every test touching the file."""
+        selection = select_impacted(IMPACT_MAP, {"pages/cart_page.py": None})
+
+        assert selection["pytest"] == ["tests/test_cart_page.py::test_items"]
+        assert selection["behave"] == []
+
+    def test_feature_file_change_selects_whole_feature(self):
+        """An edited feature runs completely: recorded lines may be stale."""
+        selection = select_impacted(
+            IMPACT_MAP, {"features/cart.feature": None, "features/new.feature": None}
+        )
+
+        assert selection["behave"] == ["features/cart.feature", "features/new.feature"]
+
+    def test_test_module_change_selects_whole_module(self):
+        """An edited test module runs completely, including added tests."""
+        selection = select_impacted(
+            IMPACT_MAP, {"tests/test_cart_page.py": None, "pages/cart_page.py": None}
+        )
+
+        assert selection["pytest"] == ["tests/test_cart_page.py"]
+
+    def test_untraced_shared_files_run_everything(self):
+        """Hooks and config changes should run the whole suite of that kind."""
+        selection = select_impacted(IMPACT_MAP, {"features/environment.py": None})
+
+        assert selection["run_all"] == ["behave"]
+
+    def test_unrelated_files_select_nothing(self):
+        """Documentation changes should not select any test."""
+        selection = select_impacted(IMPACT_MAP, {"README.md": None})
+
+        assert selection == {"behave": [], "pytest": [], "run_all": []}
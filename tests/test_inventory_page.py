@@ -213,6 +213,112 @@ class TestGetProductPrices:
         assert result == [29.99, 15.99]
 
 
+class TestVerifyOrder:
+    """Test verify_order method."""
+
+    def test_verify_order_checks_in_one_script_call(self):
+        """verify_order should not fetch product elements into Python."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = {"sorted": True, "pair": None}
+
+        page = InventoryPage(mock_driver)
+        result = page.verify_order("price", "desc")
+
+        assert result == (True, None)
+        args = mock_driver.execute_script.call_args[0]
+        assert args[1:] == ("inventory_item_price", "price", True)
+        mock_driver.find_elements.assert_not_called()
+
+    def test_verify_order_returns_first_out_of_order_pair(self):
+        """verify_order should report the pair breaking the order."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = {
+            "sorted": False,
+            "pair": ["Sauce Labs Onesie", "Sauce Labs Backpack"],
+        }
+
+        page = InventoryPage(mock_driver)
+
+        assert page.verify_order("name") == (
+            False,
+            ("Sauce Labs Onesie", "Sauce Labs Backpack"),
+        )
+
+    def test_verify_order_falls_back_without_javascript(self):
+        """Drivers returning no script result should be checked locally."""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = None
+        mock_driver.find_elements.return_value = [
+            Mock(text="Sauce Labs Bike Light"),
+            Mock(text="Sauce Labs Backpack"),
+        ]
+
+        page = InventoryPage(mock_driver)
+
+        assert page.verify_order("name", "asc") == (
+            False,
+            ("Sauce Labs Bike Light", "Sauce Labs Backpack"),
+        )
+        assert page.verify_order("name", "desc") == (True, None)
+
+    def test_verify_order_rejects_unknown_key(self):
+        """Unsupported keys or directions should raise ValueError."""
+        import pytest
+
+        page = InventoryPage(Mock())
+
+        with pytest.raises(ValueError, match="Unsupported sort order"):
+            page.verify_order("rating", "asc")
+
+
+class TestLargeCatalog:
+    """Test streamed reads and the product index."""
+
+    @staticmethod
+    def streaming_driver(rows):
+        """Create a driver whose stream script returns rows in one chunk."""
+        mock_driver = Mock()
+        mock_driver.execute_async_script.return_value = {
+            "rows": rows,
+            "exhausted": True,
+        }
+        return mock_driver
+
+    def test_get_product_prices_streams_values(self):
+        """Prices should come from in-page reads, not element handles."""
+        mock_driver = self.streaming_driver(
+            [{"name": "A", "price": "$29.99"}, {"name": "B", "price": "$7.99"}]
+        )
+
+        page = InventoryPage(mock_driver)
+
+        assert page.get_product_prices() == [29.99, 7.99]
+        mock_driver.find_elements.assert_not_called()
+
+    def test_images_broken_from_streamed_sources(self):
+        """Image sources should be checked from streamed rows."""
+        mock_driver = self.streaming_driver(
+            [
+                {"name": "A", "image": "https://x/sl-404.jpg"},
+                {"name": "B", "image": "https://x/sl-404.jpg"},
+            ]
+        )
+
+        assert InventoryPage(mock_driver).are_product_images_broken() is True
+
+    def test_has_product_uses_index_built_once(self):
+        """Membership checks should reuse one name -> product index."""
+        mock_driver = self.streaming_driver(
+            [{"name": "Sauce Labs Backpack", "price": "$29.99", "image": "b.jpg"}]
+        )
+        page = InventoryPage(mock_driver)
+
+        assert page.has_product("Sauce Labs Backpack") is True
+        assert page.has_product("Sauce Labs Onesie") is False
+        assert page.index_products()["Sauce Labs Backpack"]["price"] == 29.99
+        assert mock_driver.execute_async_script.call_count == 1
+
+
 class TestGetCurrentSortOption:
     """Test get_current_sort_option method."""
 
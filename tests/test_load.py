@@ -0,0 +1,170 @@
+"""Unit tests for the load generation module.
+
+Tests journey extraction from feature files and HTTP virtual users with a
+mocked requests session.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from core.load import (
+    build_journeys,
+    check_load_target,
+    run_http_load,
+    run_virtual_user,
+    step_route,
+    summarize_load,
+)
+
+ROUTES = [
+    (r"login page", "/"),
+    (r"cart icon|cart page", "/cart.html"),
+    (r"^I login with|inventory page", "/inventory.html"),
+]
+
+FEATURE = """Feature: Journey
+
+  Background:
+    Given I am on the Sauce Demo login page
+
+  Scenario: Buy something
+    When I login with username "standard_user" and password "secret_sauce"
+    Then I should be on the inventory page
+    When I click the shopping cart icon
+    Then the cart should have 1 item
+"""
+
+
+@pytest.fixture
+def feature_file(tmp_path, monkeypatch):
+    """Write a minimal feature file (parse cache kept under tmp_path)."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "journey.feature"
+    path.write_text(FEATURE, encoding="utf-8")
+    return str(path)
+
+
+def make_session(status_code=200, side_effect=None):
+    """Build a mocked requests.Session usable as context manager."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.get.return_value.status_code = status_code
+    session.get.side_effect = side_effect
+    return session
+
+
+class TestBuildJourneys:
+    """Test conversion of scenarios into HTTP journeys."""
+
+    def test_includes_background_and_collapses_repeated_paths(self, feature_file):
+        """Should map steps to paths, collapsing consecutive duplicates."""
+        journeys = build_journeys([feature_file], ROUTES)
+
+        assert journeys == [
+            {
+                "feature": feature_file,
+                "name": "Buy something",
+                "paths": ["/", "/inventory.html", "/cart.html"],
+            }
+        ]
+
+    def test_step_route_returns_none_for_assertion_steps(self):
+        """Assertion-only steps should not produce requests."""
+        assert step_route("the cart should have 1 item", ROUTES) is None
+
+
+class TestRunVirtualUser:
+    """Test a single HTTP virtual user."""
+
+    def test_requests_each_path_per_iteration(self):
+        """Should GET every journey path for each iteration."""
+        journeys = [{"name": "j", "paths": ["/", "/cart.html"]}]
+        session = make_session()
+
+        with patch("core.load.requests.Session", return_value=session):
+            samples = run_virtual_user("http://app", journeys, 0, 2, 5)
+
+        assert len(samples) == 4
+        session.get.assert_any_call("http://app/cart.html", timeout=5)
+        assert all(sample["ok"] for sample in samples)
+
+    def test_records_connection_errors(self):
+        """Should record failed requests instead of raising."""
+        journeys = [{"name": "j", "paths": ["/"]}]
+        session = make_session(side_effect=requests.ConnectionError())
+
+        with patch("core.load.requests.Session", return_value=session):
+            samples = run_virtual_user("http://app", journeys, 0, 1, 5)
+
+        assert samples[0]["ok"] is False
+        assert samples[0]["error"] == "ConnectionError"
+
+    def test_http_error_status_is_not_ok(self):
+        """Should mark 4xx/5xx responses as errors."""
+        journeys = [{"name": "j", "paths": ["/"]}]
+        session = make_session(status_code=503)
+
+        with patch("core.load.requests.Session", return_value=session):
+            samples = run_virtual_user("http://app", journeys, 0, 1, 5)
+
+        assert samples[0]["ok"] is False
+
+
+class TestRunHttpLoad:
+    """Test concurrent load runs."""
+
+    def test_runs_all_virtual_users(self):
+        """Should aggregate requests from every virtual user."""
+        journeys = [{"name": "j", "paths": ["/"]}]
+
+        with patch("core.load.requests.Session", side_effect=lambda: make_session()):
+            summary = run_http_load("http://app", journeys, users=3, iterations=2)
+
+        assert summary["requests"] == 6
+        assert summary["errors"] == 0
+
+    def test_raises_without_journeys(self):
+        """Should refuse to run an empty load test."""
+        with pytest.raises(ValueError, match="No journeys"):
+            run_http_load("http://app", [], users=1, iterations=1)
+
+
+class TestCheckLoadTarget:
+    """Test the guard against loading third-party hosts."""
+
+    @pytest.mark.parametrize(
+        "url", ["http://localhost:8000", "http://127.0.0.1", "http://[::1]:3000"]
+    )
+    def test_local_hosts_are_allowed(self, url):
+        """Local targets need no flag."""
+        check_load_target(url)
+
+    def test_remote_host_requires_allow_remote(self):
+        """A remote host is refused unless explicitly allowed."""
+        with pytest.raises(ValueError, match="--allow-remote"):
+            check_load_target("https://www.saucedemo.com")
+
+        check_load_target("https://www.saucedemo.com", allow_remote=True)
+
+
+class TestSummarizeLoad:
+    """Test load result aggregation."""
+
+    def test_reports_throughput_percentiles_and_error_rate(self):
+        """Should compute throughput, p50/p95/p99 and error rate."""
+        samples = [
+            {"path": "/", "latency_ms": 10.0, "ok": True},
+            {"path": "/", "latency_ms": 30.0, "ok": True},
+            {"path": "/cart.html", "latency_ms": 20.0, "ok": True},
+            {"path": "/cart.html", "latency_ms": 40.0, "ok": False},
+        ]
+
+        summary = summarize_load(samples, elapsed_s=2.0)
+
+        assert summary["throughput_rps"] == 2.0
+        assert summary["error_rate"] == 0.25
+        assert summary["latency_ms"]["p50"] == 25.0
+        assert "p99" in summary["latency_ms"]
+        assert summary["paths"]["/cart.html"]["errors"] == 1
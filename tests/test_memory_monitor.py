@@ -0,0 +1,131 @@
+"""Unit tests for per-scenario browser memory monitoring.
+
+Tests JS heap reads, recycle thresholds, leak suspects and the JSON report
+using mocked drivers and measurements.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from selenium.common.exceptions import WebDriverException
+
+from core.driver_manager import DriverManager
+from core.memory_monitor import MemoryMonitor, read_js_heap_mb
+
+
+def memory(rss_mb, js_heap_mb=10.0):
+    """Build a memory measurement."""
+    return {"rss_mb": rss_mb, "js_heap_mb": js_heap_mb}
+
+
+def run_scenario(monitor, name, before, after, status="passed"):
+    """Record one scenario and return the recycle decision."""
+    monitor.start_scenario(name, before)
+    return monitor.end_scenario(status, after)
+
+
+class TestReadJsHeap:
+    """Test the Performance memory API read."""
+
+    def test_converts_bytes_to_mb(self):
+        """usedJSHeapSize is reported in MB."""
+        driver = Mock()
+        driver.execute_script.return_value = 52428800
+
+        assert read_js_heap_mb(driver) == 50.0
+
+    def test_unsupported_browser_returns_none(self):
+        """Firefox (no performance.memory) and script errors give None."""
+        driver = Mock()
+        driver.execute_script.return_value = None
+        assert read_js_heap_mb(driver) is None
+
+        driver.execute_script.side_effect = WebDriverException("closed")
+        assert read_js_heap_mb(driver) is None
+
+
+class TestMemoryMonitor:
+    """Test per-scenario recording and recycle decisions."""
+
+    def test_records_growth_per_scenario(self):
+        """Before/after measurements give the scenario's growth."""
+        monitor = MemoryMonitor()
+
+        run_scenario(monitor, "Checkout", memory(400.0, 8.0), memory(520.5, 30.0))
+
+        scenario = monitor.scenarios[0]
+        assert scenario["rss_growth_mb"] == 120.5
+        assert scenario["js_heap_growth_mb"] == 22.0
+        assert scenario["recycled"] is None
+
+    def test_recycles_above_rss_threshold(self):
+        """Crossing the RSS threshold should ask for a recycle."""
+        monitor = MemoryMonitor(recycle_rss_mb=1000)
+
+        reason = run_scenario(monitor, "Sort", memory(900.0), memory(1200.0))
+
+        assert reason == "rss 1200 MB > 1000 MB"
+        assert monitor.scenarios[0]["recycled"] == reason
+
+    def test_recycles_above_heap_threshold(self):
+        """A page heap above the threshold should ask for a recycle."""
+        monitor = MemoryMonitor(recycle_heap_mb=100)
+
+        assert run_scenario(monitor, "Cart", memory(500.0), memory(500.0, 150.0))
+
+    def test_zero_thresholds_never_recycle(self):
+        """Thresholds of 0 disable recycling."""
+        monitor = MemoryMonitor()
+
+        assert run_scenario(monitor, "Cart", memory(1.0), memory(99999.0)) is None
+
+    def test_leak_suspects_sorted_by_growth(self):
+        """Scenarios that grew the browser most are listed first."""
+        monitor = MemoryMonitor()
+        run_scenario(monitor, "Small", memory(400.0), memory(410.0))
+        run_scenario(monitor, "Freed", memory(410.0), memory(300.0))
+        run_scenario(monitor, "Large", memory(300.0), memory(700.0))
+        run_scenario(monitor, "Unknown", memory(None), memory(None))
+
+        names = [s["name"] for s in monitor.leak_suspects()]
+
+        assert names == ["Large", "Small"]
+        assert monitor.summary_lines()[0] == "[memory] Large: browser RSS +400.0 MB"
+
+    def test_write_report(self, tmp_path):
+        """The report lists thresholds, recycles, suspects and scenarios."""
+        monitor = MemoryMonitor(recycle_rss_mb=500)
+        run_scenario(monitor, "Checkout", memory(400.0), memory(600.0))
+
+        path = monitor.write_report(str(tmp_path / "reports" / "memory.json"))
+
+        report = json.loads(path.read_text())
+        assert report["recycles"] == 1
+        assert report["leak_suspects"] == ["Checkout"]
+        assert report["scenarios"][0]["after"]["rss_mb"] == 600.0
+
+
+class TestDriverManagerMemory:
+    """Test DriverManager memory measurement and recycling."""
+
+    @patch("core.driver_manager.tree_usage", return_value={"rss_mb": 800.0})
+    def test_memory_usage_reads_tree_and_page_heap(self, mock_tree_usage):
+        """RSS comes from the service process tree, heap from the page."""
+        manager = DriverManager({"name": "chrome"})
+        manager._driver = Mock(service=Mock(process=Mock(pid=4242)))
+        page_driver = Mock()
+        page_driver.execute_script.return_value = 10485760
+
+        assert manager.memory_usage(page_driver) == memory(800.0, 10.0)
+        mock_tree_usage.assert_called_once_with(4242)
+
+    def test_recycle_starts_new_browser_on_next_use(self):
+        """recycle quits the browser; get_driver then creates a new one."""
+        manager = DriverManager({"name": "chrome"})
+        old_driver = manager._driver = Mock()
+
+        manager.recycle()
+
+        old_driver.quit.assert_called_once()
+        with patch.object(manager, "_create_driver") as mock_create:
+            assert manager.get_driver() is mock_create.return_value
@@ -0,0 +1,182 @@
+"""Unit tests for navigation performance metrics.
+
+Tests percentile math and per-page aggregation using canned timing payloads.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from core.performance import (
+    INTERACTION_PROBE_SCRIPT,
+    NAVIGATION_TIMING_SCRIPT,
+    PAGE_LOAD_SCRIPT,
+    PerformanceRecorder,
+    collect_navigation_timing,
+    install_interaction_probe,
+    percentile,
+    read_interaction_response_ms,
+    read_page_load_ms,
+    summarize,
+)
+
+
+def make_timing(path="/inventory.html", time_origin=1.0, load_ms=500.0, resources=()):
+    """Build a payload shaped like NAVIGATION_TIMING_SCRIPT output."""
+    return {
+        "path": path,
+        "time_origin": time_origin,
+        "navigation": {
+            "dns_ms": 1.0,
+            "connect_ms": 2.0,
+            "ttfb_ms": 50.0,
+            "response_ms": 10.0,
+            "dom_content_loaded_ms": load_ms - 100,
+            "load_ms": load_ms,
+            "duration_ms": load_ms,
+        },
+        "resources": [{"name": r, "duration_ms": 20.0} for r in resources],
+    }
+
+
+class TestPercentile:
+    """Test percentile calculation."""
+
+    def test_single_value_is_every_percentile(self):
+        """A single sample should be returned for any percentile."""
+        assert percentile([42.0], 50) == 42.0
+        assert percentile([42.0], 95) == 42.0
+
+    def test_interpolates_between_values(self):
+        """Should interpolate linearly between neighbouring ranks."""
+        assert percentile([0, 100], 95) == pytest.approx(95.0)
+
+    def test_ignores_input_order(self):
+        """Should sort samples before computing percentiles."""
+        assert percentile([40, 10, 30, 20], 50) == 25.0
+
+    def test_summarize_reports_count_p50_p95_max(self):
+        """summarize should return all aggregate fields."""
+        assert summarize([10, 20, 30, 40]) == {
+            "count": 4,
+            "p50": 25.0,
+            "p95": 38.5,
+            "max": 40,
+        }
+
+
+class TestCollectNavigationTiming:
+    """Test collect_navigation_timing."""
+
+    def test_uses_single_script_call(self):
+        """Should fetch all timings with one execute_script round-trip."""
+        driver = Mock()
+        driver.execute_script.return_value = make_timing()
+
+        result = collect_navigation_timing(driver)
+
+        driver.execute_script.assert_called_once_with(NAVIGATION_TIMING_SCRIPT)
+        assert result["path"] == "/inventory.html"
+
+
+class TestInteractionProbe:
+    """Test in-browser interaction timing helpers."""
+
+    def test_install_probe_runs_probe_script(self):
+        """Should install the probe with a single script call."""
+        driver = Mock()
+
+        install_interaction_probe(driver)
+
+        driver.execute_script.assert_called_once_with(INTERACTION_PROBE_SCRIPT)
+
+    def test_read_page_load_passes_page_path(self):
+        """Should pass the page path as script argument."""
+        driver = Mock()
+        driver.execute_script.return_value = 812.5
+
+        result = read_page_load_ms(driver, "/cart.html")
+
+        driver.execute_script.assert_called_once_with(PAGE_LOAD_SCRIPT, "/cart.html")
+        assert result == 812.5
+
+    def test_read_interaction_returns_none_without_click(self):
+        """Should propagate None when no interaction was measured."""
+        driver = Mock()
+        driver.execute_script.return_value = None
+
+        assert read_interaction_response_ms(driver) is None
+
+
+class TestPerformanceRecorder:
+    """Test per-page aggregation."""
+
+    def test_attributes_samples_to_page_object_name(self):
+        """Should map URL paths to page object names."""
+        recorder = PerformanceRecorder({"/inventory.html": "InventoryPage"})
+
+        recorder.record(make_timing())
+
+        assert "InventoryPage" in recorder.summary()
+
+    def test_unknown_path_reported_by_path(self):
+        """Should fall back to the raw path for unknown pages."""
+        recorder = PerformanceRecorder()
+
+        recorder.record(make_timing(path="/about.html"))
+
+        assert "/about.html" in recorder.summary()
+
+    def test_same_document_recorded_once(self):
+        """Should not double-count a navigation measured after several steps."""
+        recorder = PerformanceRecorder()
+
+        recorder.record(make_timing(time_origin=1.0))
+        recorder.record(make_timing(time_origin=1.0))
+        recorder.record(make_timing(time_origin=2.0, load_ms=700.0))
+
+        load = recorder.summary()["/inventory.html"]["load_ms"]
+        assert load["count"] == 2
+        assert load["p50"] == 600.0
+
+    def test_incomplete_navigation_is_skipped(self):
+        """Should wait until loadEventEnd is set before recording."""
+        recorder = PerformanceRecorder()
+
+        recorder.record(make_timing(load_ms=0.0))
+
+        assert "load_ms" not in recorder.summary()["/inventory.html"]
+
+    def test_resources_aggregated_per_page(self):
+        """Should aggregate resource durations under resource_ms."""
+        recorder = PerformanceRecorder()
+
+        recorder.record(make_timing(resources=["a.js", "b.css"]))
+
+        assert recorder.summary()["/inventory.html"]["resource_ms"]["count"] == 2
+
+    def test_scenario_totals_compare_browser_and_wall_time(self):
+        """Should report wall-clock and in-browser navigation time per scenario."""
+        recorder = PerformanceRecorder()
+
+        recorder.start_scenario("Glitch user login")
+        recorder.record(make_timing(load_ms=4000.0))
+        recorder.end_scenario("passed", 6.5)
+
+        scenario = recorder.scenarios[0]
+        assert scenario["name"] == "Glitch user login"
+        assert scenario["duration_s"] == 6.5
+        assert scenario["browser_navigation_ms"] == 4000.0
+
+    def test_write_report_creates_json(self, tmp_path):
+        """Should write pages and scenarios sections to JSON."""
+        recorder = PerformanceRecorder()
+        recorder.record(make_timing())
+        report_path = tmp_path / "reports" / "performance.json"
+
+        recorder.write_report(str(report_path))
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert set(report) == {"pages", "scenarios"}
+        assert report["pages"]["/inventory.html"]["load_ms"]["p95"] == 500.0
@@ -0,0 +1,65 @@
+"""Unit tests for performance budget step definitions.
+
+Tests budget assertions with a mocked driver returning in-browser timings.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from features.steps.performance_steps import (
+    step_verify_interaction_budget,
+    step_verify_page_load_budget,
+)
+
+
+class TestStepVerifyPageLoadBudget:
+    """Test the page load budget step."""
+
+    def test_passes_when_load_within_budget(self):
+        """Should pass when the page loaded faster than the budget."""
+        context = Mock()
+        context.driver.execute_script.return_value = 450.0
+
+        step_verify_page_load_budget(context, "inventory", 800)
+
+        args = context.driver.execute_script.call_args[0]
+        assert args[1] == "/inventory.html"
+
+    def test_fails_when_load_exceeds_budget(self):
+        """Should fail with measured time when over budget."""
+        context = Mock()
+        context.driver.execute_script.return_value = 5123.4
+
+        with pytest.raises(AssertionError) as exc_info:
+            step_verify_page_load_budget(context, "inventory", 800)
+
+        assert "5123 ms, budget is 800 ms" in str(exc_info.value)
+
+    def test_fails_for_unknown_page(self):
+        """Should reject page names without a page object mapping."""
+        context = Mock()
+
+        with pytest.raises(AssertionError, match="Unknown page 'about'"):
+            step_verify_page_load_budget(context, "about", 800)
+
+
+class TestStepVerifyInteractionBudget:
+    """Test the interaction response budget step."""
+
+    def test_passes_when_response_within_budget(self):
+        """Should pass when the DOM updated within the budget."""
+        context = Mock()
+        context.driver.execute_script.return_value = 35.0
+
+        step_verify_interaction_budget(context, "adding to cart", 200)
+
+    def test_fails_when_response_exceeds_budget(self):
+        """Should fail naming the action when over budget."""
+        context = Mock()
+        context.driver.execute_script.return_value = 350.0
+
+        with pytest.raises(AssertionError) as exc_info:
+            step_verify_interaction_budget(context, "adding to cart", 200)
+
+        assert "Adding to cart responded in 350 ms" in str(exc_info.value)
@@ -0,0 +1,197 @@
+"""Unit tests for the browser resource governor.
+
+Tests process tree measurement against a fake /proc, footprint-based
+worker sizing, memory admission and footprint storage.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.driver_manager import DriverManager
+from core.resource_governor import (
+    DEFAULT_BROWSER_RSS_MB,
+    ResourceGovernor,
+    governor_from_config,
+    process_tree,
+    tree_usage,
+)
+
+TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_MB = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def write_process(proc, pid, ppid, cpu_ticks=0, rss_pages=0, start_ticks=0):
+    """Write a /proc/<pid>/stat file with the fields the governor reads."""
+    fields = ["S", str(ppid)] + ["0"] * 20
+    fields[11] = str(cpu_ticks)
+    fields[19] = str(start_ticks)
+    fields[21] = str(rss_pages)
+    (proc / str(pid)).mkdir()
+    (proc / str(pid) / "stat").write_text(f"{pid} (chrome renderer) {' '.join(fields)}")
+
+
+@pytest.fixture
+def proc(tmp_path):
+    """Fake /proc: chromedriver (10) -> chrome (11) -> renderer (12)."""
+    write_process(tmp_path, 1, 0)
+    # Started at 100s of uptime: 8s before "now"
+    write_process(tmp_path, 10, 1, TICKS, rss_pages=1000, start_ticks=100 * TICKS)
+    write_process(tmp_path, 11, 10, cpu_ticks=TICKS, rss_pages=3000)
+    write_process(tmp_path, 12, 11, cpu_ticks=2 * TICKS, rss_pages=6000)
+    write_process(tmp_path, 20, 1, cpu_ticks=99 * TICKS, rss_pages=99999)
+    (tmp_path / "uptime").write_text("108.0 50.0")
+    with patch("core.resource_governor.PROC", tmp_path):
+        yield tmp_path
+
+
+def save_measurements(path, worker):
+    """Save distinct measurements from one process (e.g., an xdist worker)."""
+    governor = ResourceGovernor(path, sample_browsers=10, window=100)
+    governor._new_samples = [
+        {"rss_mb": worker * 10.0 + i, "cpu": 0.5} for i in range(10)
+    ]
+    governor.save()
+
+
+def make_governor(tmp_path, samples=None, **kwargs):
+    """Create a governor with a temporary footprint file and samples."""
+    governor = ResourceGovernor(str(tmp_path / "footprint.json"), **kwargs)
+    if samples is not None:
+        governor.samples = samples
+    return governor
+
+
+class TestProcessTree:
+    """Test browser process tree measurement."""
+
+    def test_tree_contains_descendants_only(self, proc):
+        """The driver service, browser and renderers, not other processes."""
+        assert process_tree(10) == [10, 11, 12]
+        assert process_tree(99) == []
+
+    def test_usage_sums_tree_memory_and_cpu(self, proc):
+        """RSS is summed; CPU is averaged over the root's lifetime."""
+        usage = tree_usage(10)
+
+        assert usage["rss_mb"] == round(10000 * PAGE_MB, 1)
+        assert usage["cpu"] == 0.5  # 4 CPU seconds over 8 seconds
+
+    def test_usage_of_missing_process_is_none(self, proc):
+        """A browser that already exited cannot be measured."""
+        assert tree_usage(99) is None
+
+
+class TestWorkerLimit:
+    """Test worker sizing."""
+
+    def test_uses_default_footprint_without_measurements(self, tmp_path):
+        """Before any measurement a conservative default is assumed."""
+        governor = make_governor(tmp_path, reserve_mb=0)
+
+        assert governor.footprint()["rss_mb"] == DEFAULT_BROWSER_RSS_MB
+        assert governor.worker_limit(available_mb=6000, cores=64) == 10
+
+    def test_sizes_from_largest_recent_measurement(self, tmp_path):
+        """The largest browser in the window sizes the run."""
+        governor = make_governor(
+            tmp_path,
+            [{"rss_mb": 400.0, "cpu": 0.2}, {"rss_mb": 900.0, "cpu": 0.3}],
+            reserve_mb=1000,
+        )
+
+        assert governor.worker_limit(available_mb=10000, cores=64) == 10
+
+    def test_max_workers_bounds_the_limit(self, tmp_path):
+        """A configured maximum applies even with resources to spare."""
+        governor = make_governor(tmp_path, max_workers=3)
+
+        assert governor.worker_limit(available_mb=64000, cores=64) == 3
+
+    def test_without_memory_information_only_cores_limit(self, tmp_path):
+        """Without /proc/meminfo the core count alone sizes the run."""
+        governor = make_governor(tmp_path, [{"rss_mb": 500.0, "cpu": 1.0}])
+
+        with patch("core.resource_governor.available_memory_mb", return_value=None):
+            assert governor.worker_limit(cores=4) == 4
+
+
+class TestWaitForMemory:
+    """Test memory admission before a browser starts."""
+
+    @patch("core.resource_governor.time.sleep")
+    @patch("core.resource_governor.available_memory_mb")
+    def test_waits_until_a_browser_fits(self, mock_available, mock_sleep, tmp_path):
+        """A worker pauses while other browsers hold the memory."""
+        governor = make_governor(tmp_path, [{"rss_mb": 500.0, "cpu": 0.5}])
+        mock_available.side_effect = [800.0, 1200.0, 1600.0]
+
+        governor.wait_for_memory()
+
+        assert mock_sleep.call_count == 2
+
+    @patch("core.resource_governor.time.sleep")
+    @patch("core.resource_governor.time.monotonic")
+    @patch("core.resource_governor.available_memory_mb", return_value=100.0)
+    def test_gives_up_after_admission_timeout(
+        self, mock_available, mock_monotonic, mock_sleep, tmp_path
+    ):
+        """The browser starts anyway once the timeout is reached."""
+        governor = make_governor(tmp_path, admission_timeout=10)
+        mock_monotonic.side_effect = [0.0, 5.0, 10.0]
+
+        assert governor.wait_for_memory() == 10.0
+        assert mock_sleep.call_count == 1
+
+
+class TestMeasurements:
+    """Test footprint sampling and storage."""
+
+    def test_measures_only_first_browsers_of_run(self, proc, tmp_path):
+        """Sampling stops after sample_browsers measurements."""
+        governor = make_governor(tmp_path, sample_browsers=1)
+
+        assert governor.measure(10) is not None
+        assert governor.measure(10) is None
+        assert governor.sampling is False
+
+    def test_saved_measurements_size_next_run(self, proc, tmp_path):
+        """Measurements are merged into the footprint file."""
+        governor = make_governor(tmp_path)
+        governor.measure(10)
+        governor.save()
+
+        next_run = make_governor(tmp_path)
+
+        assert next_run.footprint()["rss_mb"] == round(10000 * PAGE_MB, 1)
+
+    def test_concurrent_workers_keep_all_measurements(self, tmp_path):
+        """Saves of concurrent workers should not overwrite each other."""
+        path = str(tmp_path / "footprint.json")
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(save_measurements, [path] * 8, range(8)))
+
+        assert len(ResourceGovernor(path, window=100).samples) == 80
+
+    def test_corrupt_footprint_file_is_ignored(self, tmp_path):
+        """An unreadable file behaves like no measurements."""
+        (tmp_path / "footprint.json").write_text("{not json")
+
+        assert make_governor(tmp_path).samples == []
+
+    def test_governor_disabled_by_config(self):
+        """govern_workers=false disables the governor."""
+        assert governor_from_config({"govern_workers": False}) is None
+        assert governor_from_config({"govern_workers": True}) is not None
+
+    def test_browser_pid_is_driver_service_pid(self):
+        """The driver service process is the root of the browser tree."""
+        manager = DriverManager({"name": "chrome"})
+        assert manager.browser_pid is None
+
+        manager._driver = Mock(service=Mock(process=Mock(pid=4242)))
+
+        assert manager.browser_pid == 4242
@@ -0,0 +1,218 @@
+"""Unit tests for the scenario result cache.
+
+Tests fingerprinting, pass storage and browser version detection using a
+temporary repository layout.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.result_cache import ScenarioResultCache, browser_version, scenario_inputs
+
+SCENARIO = "features/cart.feature:11"
+ENVIRONMENT = {"browser": {"name": "chrome"}, "browser_version": "Chrome 126"}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a minimal repository layout."""
+    for path, content in {
+        "config.yaml": "browser: {}",
+        "features/environment.py": "",
+        "features/cart.feature": "Feature: Cart",
+        "features/steps/cart_steps.py": "",
+        "pages/cart_page.py": "class CartPage: ...",
+        "pages/login_page.py": "class LoginPage: ...",
+    }.items():
+        file_path = tmp_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    return tmp_path
+
+
+def make_cache(repo, impact_calls=None, environment=ENVIRONMENT, force=False):
+    """Create a cache whose impact map has an optional entry for SCENARIO."""
+    impact_map = {"behave": {}, "pytest": {}}
+    if impact_calls is not None:
+        impact_map["behave"][SCENARIO] = impact_calls
+    return ScenarioResultCache(
+        environment,
+        impact_map,
+        path=str(repo / ".uat_cache" / "results.json"),
+        root=str(repo),
+        force=force,
+    )
+
+
+class TestScenarioInputs:
+    """Test scenario input files."""
+
+    def test_untraced_scenario_depends_on_all_traced_modules(self, repo):
+        """Without an impact entry every step and page module is an input."""
+        files = scenario_inputs("features/cart.feature", None, root=str(repo))
+
+        assert "features/steps/cart_steps.py" in files
+        assert "pages/login_page.py" in files
+
+    def test_traced_scenario_depends_on_modules_it_called(self, repo):
+        """Impact entries restrict inputs to the modules the scenario used."""
+        files = scenario_inputs(
+            "features/cart.feature",
+            ["pages/cart_page.py::CartPage.get_items"],
+            root=str(repo),
+        )
+
+        assert "pages/cart_page.py" in files
+        assert "pages/login_page.py" not in files
+
+
+class TestFingerprint:
+    """Test fingerprint invalidation."""
+
+    def test_changes_when_used_module_changes(self, repo):
+        """Editing a page object the scenario used should invalidate it."""
+        calls = ["pages/cart_page.py::CartPage.get_items"]
+        before = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", calls)
+
+        (repo / "pages/cart_page.py").write_text("class CartPage: pass")
+
+        after = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", calls)
+        assert before != after
+
+    def test_ignores_modules_the_scenario_did_not_use(self, repo):
+        """Editing an unrelated page object should keep a traced fingerprint."""
+        calls = ["pages/cart_page.py::CartPage.get_items"]
+        before = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", calls)
+
+        (repo / "pages/login_page.py").write_text("class LoginPage: pass")
+
+        after = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", calls)
+        assert before == after
+
+    def test_untraced_fingerprint_covers_every_traced_module(self, repo):
+        """Without traced calls any step or page module change invalidates."""
+        before = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature")
+
+        (repo / "pages/login_page.py").write_text("class LoginPage: pass")
+
+        after = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature")
+        assert before != after
+
+    @pytest.mark.parametrize(
+        "path", ["features/cart.feature", "config.yaml", "features/environment.py"]
+    )
+    def test_changes_when_feature_or_shared_input_changes(self, repo, path):
+        """Feature text, config and hooks are inputs of every scenario."""
+        before = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", [])
+
+        (repo / path).write_text("changed")
+
+        after = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature", [])
+        assert before != after
+
+    def test_changes_when_browser_version_changes(self, repo):
+        """A browser upgrade should invalidate every scenario."""
+        upgraded = {**ENVIRONMENT, "browser_version": "Chrome 127"}
+
+        before = make_cache(repo).fingerprint(SCENARIO, "features/cart.feature")
+        after = make_cache(repo, environment=upgraded).fingerprint(
+            SCENARIO, "features/cart.feature"
+        )
+
+        assert before != after
+
+
+class TestResults:
+    """Test pass storage and cache hits."""
+
+    def test_saved_pass_is_cached_in_next_run(self, repo):
+        """A scenario that passed should be reported as cached next run."""
+        cache = make_cache(repo)
+        cache.record(SCENARIO, "features/cart.feature", passed=True)
+        cache.save()
+
+        next_run = make_cache(repo)
+
+        assert next_run.is_cached(SCENARIO, "features/cart.feature") is True
+        assert next_run.cached == [SCENARIO]
+
+    def test_traced_pass_is_cached_while_its_modules_are_unchanged(self, repo):
+        """A pass traced in its run only depends on the modules it called."""
+        calls = ["pages/cart_page.py::CartPage.get_items"]
+        cache = make_cache(repo)
+        cache.record(SCENARIO, "features/cart.feature", True, traced_calls=calls)
+        cache.save()
+
+        (repo / "pages/login_page.py").write_text("class LoginPage: pass")
+
+        next_run = make_cache(repo, calls)
+        assert next_run.is_cached(SCENARIO, "features/cart.feature") is True
+
+    def test_untraced_pass_ignores_stale_impact_entry(self, repo):
+        """A pass recorded without tracing must not trust an old entry.
+
+        The entry lists cart_page only; the steps may call login_page now,
+        so editing it must run the scenario again.
+        """
+        calls = ["pages/cart_page.py::CartPage.get_items"]
+        cache = make_cache(repo, calls)
+        cache.record(SCENARIO, "features/cart.feature", passed=True)
+        cache.save()
+
+        (repo / "pages/login_page.py").write_text("class LoginPage: pass")
+
+        next_run = make_cache(repo, calls)
+        assert next_run.is_cached(SCENARIO, "features/cart.feature") is False
+
+    def test_failure_removes_stored_pass(self, repo):
+        """A failing scenario must run again next time."""
+        cache = make_cache(repo)
+        cache.record(SCENARIO, "features/cart.feature", passed=True)
+
+        cache.record(SCENARIO, "features/cart.feature", passed=False)
+
+        assert cache.is_cached(SCENARIO, "features/cart.feature") is False
+
+    def test_force_never_reports_cached(self, repo):
+        """Forced runs execute everything but still refresh stored passes."""
+        cache = make_cache(repo, force=True)
+        cache.record(SCENARIO, "features/cart.feature", passed=True)
+
+        assert cache.is_cached(SCENARIO, "features/cart.feature") is False
+        assert SCENARIO in cache.results
+
+    def test_corrupt_results_file_is_ignored(self, repo):
+        """An unreadable results file should behave like an empty cache."""
+        results_file = repo / ".uat_cache" / "results.json"
+        results_file.parent.mkdir()
+        results_file.write_text("{not json")
+
+        assert make_cache(repo).results == {}
+
+
+class TestBrowserVersion:
+    """Test browser version detection."""
+
+    def test_http_backend_uses_requests_version(self):
+        """The HTTP backend has no browser: its client version is used."""
+        assert browser_version("http").startswith("requests ")
+
+    @patch("core.result_cache.subprocess.run")
+    @patch("core.result_cache.shutil.which")
+    def test_queries_first_installed_executable(self, mock_which, mock_run):
+        """Should run --version on the first executable found."""
+        mock_which.side_effect = [None, "/usr/bin/google-chrome-stable"]
+        mock_run.return_value = Mock(returncode=0, stdout="Google Chrome 126.0\n")
+
+        assert browser_version("chrome") == "Google Chrome 126.0"
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "/usr/bin/google-chrome-stable",
+            "--version",
+        ]
+
+    @patch("core.result_cache.shutil.which", return_value=None)
+    def test_returns_none_when_browser_missing(self, mock_which):
+        """Unknown versions disable caching instead of guessing."""
+        assert browser_version("firefox") is None
@@ -0,0 +1,230 @@
+"""Unit tests for transient failure retries.
+
+Tests failure classification, retry budget accounting, the Behave
+scenario retry wrapper using mocked scenarios and the pytest retry hooks of
+tests/integration/conftest.py in isolated pytester runs.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from core.retry import (
+    RetryPolicy,
+    classify_failure,
+    patch_scenario_with_retry,
+    step_exception,
+)
+
+pytest_plugins = ["pytester"]
+
+# Conftest of a pytester run: the integration retry hooks with a fixed budget
+RETRY_CONFTEST = """
+from core.retry import RetryPolicy
+
+pytest_plugins = ["tests.integration.conftest"]
+
+
+def pytest_configure(config):
+    config.retry_policy = RetryPolicy(budget={budget})
+"""
+
+
+class TestClassifyFailure:
+    """Test transient failure classification."""
+
+    @pytest.mark.parametrize(
+        "exception, reason",
+        [
+            (TimeoutException(), "TimeoutException"),
+            (StaleElementReferenceException(), "StaleElementReferenceException"),
+            (InvalidSessionIdException(), "session lost"),
+            (NoSuchWindowException(), "session lost"),
+            (WebDriverException("invalid session id"), "session lost"),
+        ],
+    )
+    def test_transient_failures(self, exception, reason):
+        """Timeouts, stale elements and lost sessions are transient."""
+        assert classify_failure(exception) == reason
+
+    @pytest.mark.parametrize(
+        "exception",
+        [
+            AssertionError("Expected 2 items in cart"),
+            NoSuchElementException("no such element"),
+            WebDriverException("unknown error"),
+            None,
+        ],
+    )
+    def test_real_failures_are_not_retried(self, exception):
+        """Assertions and other errors must not be retried."""
+        assert classify_failure(exception) is None
+
+
+class TestRetryPolicy:
+    """Test retry decisions and reporting."""
+
+    def test_disabled_without_budget(self):
+        """Budget 0 (default) disables retries."""
+        assert RetryPolicy().enabled is False
+        assert RetryPolicy(budget=3).enabled is True
+
+    def test_does_not_retry_real_failures(self):
+        """A failure without transient reason is never retried."""
+        policy = RetryPolicy(budget=3)
+
+        assert policy.should_retry("t", None) is False
+        assert policy.retries == []
+
+    def test_attempts_bounded_per_test(self):
+        """A test runs at most max_attempts times."""
+        policy = RetryPolicy(budget=10, max_attempts=2)
+
+        assert policy.should_retry("t", "TimeoutException") is True
+        assert policy.should_retry("t", "TimeoutException") is False
+
+    def test_budget_bounded_per_run(self):
+        """Retries across tests stop when the run budget is used."""
+        policy = RetryPolicy(budget=1, max_attempts=3)
+
+        assert policy.should_retry("a", "TimeoutException") is True
+        assert policy.should_retry("b", "TimeoutException") is False
+
+    def test_pending_retry_is_taken_once(self):
+        """A scheduled retry should be consumed by the next run."""
+        policy = RetryPolicy(budget=1)
+        policy.should_retry("t", "session lost")
+
+        assert policy.take_pending("t") is True
+        assert policy.take_pending("t") is False
+
+    def test_summary_reports_retries_distinctly(self):
+        """Retries that passed are reported as flaky, not hidden."""
+        policy = RetryPolicy(budget=3)
+        policy.should_retry("a", "TimeoutException")
+        policy.record_outcome("a", True)
+        policy.should_retry("b", "session lost")
+        policy.record_outcome("b", False)
+
+        assert policy.summary_lines() == [
+            "[retry] a: TimeoutException on attempt 1, retry passed",
+            "[retry] b: session lost on attempt 1, retry failed",
+            "[retry] 2 retry(ies) used of 3: 1 passed only on retry (flaky)",
+        ]
+
+
+class TestScenarioRetry:
+    """Test the Behave scenario wrapper."""
+
+    def test_step_exception_returns_failed_step_error(self):
+        """Should return the exception of the failed step."""
+        error = TimeoutException()
+        scenario = Mock(
+            all_steps=[
+                Mock(status="passed", exception=None),
+                Mock(status="error", exception=error),
+            ]
+        )
+
+        assert step_exception(scenario) is error
+
+    def test_reruns_scenario_while_retry_is_scheduled(self):
+        """The scenario should run again only when a retry was scheduled."""
+        policy = RetryPolicy(budget=3)
+        scenario = Mock(location="features/cart.feature:5")
+        scenario.name = "Add product"
+        # First attempt fails (and schedules a retry), the second passes
+        scenario.run.side_effect = [True, False]
+        policy.should_retry("features/cart.feature:5", "TimeoutException")
+
+        patch_scenario_with_retry(scenario, policy)
+        failed = scenario.run(Mock())
+
+        assert failed is False
+
+    def test_failure_without_scheduled_retry_is_final(self):
+        """Failures the policy did not schedule are returned as-is."""
+        policy = RetryPolicy(budget=3)
+        scenario = Mock(location="features/cart.feature:5")
+        original_run = scenario.run
+        original_run.return_value = True
+
+        patch_scenario_with_retry(scenario, policy)
+
+        assert scenario.run(Mock()) is True
+        original_run.assert_called_once()
+
+
+class TestIntegrationRetryHooks:
+    """Test the pytest retry loop of tests/integration/conftest.py."""
+
+    def run_with_budget(self, pytester, budget, source):
+        """Run test source with the integration retry hooks."""
+        pytester.makeconftest(RETRY_CONFTEST.format(budget=budget))
+        pytester.makepyfile(source)
+        return pytester.runpytest("-v", "-p", "no:cacheprovider")
+
+    def test_transient_failure_reported_as_rerun_then_passes(self, pytester):
+        """A transient failure should show as RERUN and the retry pass."""
+        result = self.run_with_budget(
+            pytester,
+            1,
+            """
+            from selenium.common.exceptions import TimeoutException
+
+            attempts = []
+
+            def test_flaky():
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise TimeoutException("button not clickable")
+            """,
+        )
+
+        result.stdout.fnmatch_lines(["*test_flaky RERUN*", "*test_flaky PASSED*"])
+        assert result.parseoutcomes() == {"passed": 1, "rerun": 1}
+        assert result.ret == pytest.ExitCode.OK
+
+    def test_assertion_failure_not_retried(self, pytester):
+        """Assertion failures should fail on the first attempt."""
+        result = self.run_with_budget(
+            pytester,
+            1,
+            """
+            def test_wrong_total():
+                assert 1 + 1 == 3
+            """,
+        )
+
+        assert result.parseoutcomes() == {"failed": 1}
+        result.stdout.no_fnmatch_line("*RERUN*")
+
+    def test_budget_limits_retries(self, pytester):
+        """Once the run's budget is spent, transient failures fail."""
+        result = self.run_with_budget(
+            pytester,
+            1,
+            """
+            from selenium.common.exceptions import TimeoutException
+
+            def test_first():
+                raise TimeoutException("first")
+
+            def test_second():
+                raise TimeoutException("second")
+            """,
+        )
+
+        # One retry for test_first (which fails again); none left for test_second
+        result.stdout.fnmatch_lines(
+            ["*test_first RERUN*", "*test_first FAILED*", "*test_second FAILED*"]
+        )
+        assert result.parseoutcomes() == {"failed": 2, "rerun": 1}
@@ -0,0 +1,150 @@
+"""Unit tests for the framework runner's feature thread pool.
+
+Runs Behave in-process on small generated projects (features, steps and
+hooks in a temporary directory) and checks thread count resolution.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from behave.configuration import Configuration
+from behave.step_registry import registry
+
+from core.runner import FrameworkRunner, resolve_threads
+
+ENVIRONMENT = """
+import threading
+
+
+def before_all(context):
+    # Both features must be in this step at the same time to pass
+    context.barrier = threading.Barrier(2, timeout=5)
+    context.thread_names = []
+"""
+
+STEPS = """
+import threading
+
+from behave import then, when
+
+
+@when("the feature waits for the other feature")
+def step_wait(context):
+    context.thread_names.append(threading.current_thread().name)
+    context.barrier.wait()
+
+
+@then("the step fails")
+def step_fail(context):
+    raise AssertionError("failed on purpose")
+"""
+
+FEATURE = """
+Feature: {name}
+
+  Scenario: {name} meets the other feature
+    When the feature waits for the other feature
+{extra}"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Behave project with two features, run from its directory."""
+    steps_dir = tmp_path / "features" / "steps"
+    steps_dir.mkdir(parents=True)
+    (tmp_path / "features" / "environment.py").write_text(ENVIRONMENT)
+    (steps_dir / "steps.py").write_text(STEPS)
+    (tmp_path / "config.yaml").write_text(
+        "history:\n  test_order: none\nresources:\n  govern_workers: false\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    # Step modules register into Behave's global registry
+    saved_steps = {kind: list(steps) for kind, steps in registry.steps.items()}
+    yield tmp_path
+    registry.steps.update(saved_steps)
+
+
+def write_features(project, second_extra=""):
+    """Write the two features (the second may get extra steps)."""
+    features_dir = project / "features"
+    (features_dir / "a.feature").write_text(FEATURE.format(name="First", extra=""))
+    (features_dir / "b.feature").write_text(
+        FEATURE.format(name="Second", extra=second_extra)
+    )
+
+
+def run_behave(project, *args):
+    """Run the framework runner; return (failed, runner, formatted output)."""
+    output = project / "output.txt"
+    config = Configuration(
+        ["features", "-f", "plain", "-o", str(output), "--no-summary", *args]
+    )
+    runner = FrameworkRunner(config)
+    failed = runner.run()
+    return failed, runner, output.read_text()
+
+
+class TestThreadPool:
+    """Test features running concurrently in one process."""
+
+    def test_features_run_concurrently(self, project):
+        """Both features reach the barrier together in worker threads."""
+        write_features(project)
+
+        failed, runner, output = run_behave(project, "-Dthreads=2")
+
+        assert not failed
+        assert all(name.startswith("feature") for name in runner.context.thread_names)
+        # Output is written per feature, in feature order
+        assert output.index("Feature: First") < output.index("Feature: Second")
+
+    def test_failed_feature_fails_the_run(self, project):
+        """A failing scenario in one thread fails the run; others pass."""
+        write_features(project, second_extra="    Then the step fails\n")
+
+        failed, runner, output = run_behave(project, "-Dthreads=2")
+
+        assert failed
+        assert "failed on purpose" in output
+        assert [feature.status.name for feature in runner.features] == [
+            "passed",
+            "failed",
+        ]
+
+    def test_before_all_can_lower_threads(self, project):
+        """context.threads set by before_all limits the pool."""
+        write_features(project)
+        (project / "features" / "environment.py").write_text(
+            ENVIRONMENT
+            + "    context.threads = 1\n"
+            + "    context.barrier = threading.Barrier(1)\n"
+        )
+
+        failed, runner, _ = run_behave(project, "-Dthreads=4")
+
+        assert not failed
+        assert set(runner.context.thread_names) == {"feature_0"}
+
+
+class TestResolveThreads:
+    """Test the thread count hierarchy."""
+
+    def test_defaults_to_sequential(self):
+        """Without configuration features run sequentially."""
+        assert resolve_threads({}, {"resources": {"govern_workers": False}}) == 0
+
+    def test_cli_value_wins(self):
+        """-Dthreads overrides config.yaml."""
+        config = {"resources": {"threads": 2, "govern_workers": False}}
+
+        assert resolve_threads({"threads": "6"}, config) == 6
+
+    def test_capped_by_governor(self):
+        """With govern_workers, only browsers that fit run at once."""
+        config = {"resources": {"threads": 8, "govern_workers": True}}
+
+        with patch(
+            "core.resource_governor.ResourceGovernor.worker_limit", return_value=3
+        ):
+            assert resolve_threads({}, config) == 3
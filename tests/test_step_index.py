@@ -0,0 +1,142 @@
+"""Unit tests for the step definition matcher index.
+
+Tests candidate bucketing, first-match equivalence with Behave's registry
+and ambiguity reporting using an isolated step registry.
+"""
+
+import pytest
+from behave.matchers import ParseMatcher
+from behave.model import Step
+from behave.parser import parse_feature
+from behave.step_registry import StepRegistry
+
+from core.runner import format_ambiguous_step
+from core.step_index import StepMatcherIndex, literal_prefix_words
+
+
+def step_func(context, **kwargs):
+    """Placeholder step implementation."""
+
+
+def other_func(context, **kwargs):
+    """Second placeholder step implementation."""
+
+
+class CaseInsensitiveMatcher(ParseMatcher):
+    """Parse matcher ignoring case, like ParseMatcher.CASE_SENSITIVE = False."""
+
+    CASE_SENSITIVE = False
+
+
+def make_step(step_type, name):
+    """Build a Behave step."""
+    return Step("test.feature", 1, step_type.capitalize(), step_type, name)
+
+
+@pytest.fixture
+def registry():
+    """Registry with broad and specific patterns, like cart_steps.py."""
+    step_registry = StepRegistry()
+    step_registry.add_step_definition("when", 'I click "{button_text}"', step_func)
+    step_registry.add_step_definition(
+        "when", 'I add "{product_name}" to the cart', step_func
+    )
+    step_registry.add_step_definition("when", "I click the shopping cart", other_func)
+    step_registry.add_step_definition(
+        "then", "the cart should have {n:d} items", step_func
+    )
+    step_registry.add_step_definition("step", "{action} should respond", step_func)
+    return step_registry
+
+
+class TestLiteralPrefixWords:
+    """Test bucket keys derived from patterns."""
+
+    def test_stops_at_first_field(self, registry):
+        """Only complete literal words before the first field are used."""
+        matcher = registry.steps["when"][0]
+
+        assert literal_prefix_words(matcher) == ("i", "click")
+
+    def test_pattern_starting_with_field_has_empty_prefix(self, registry):
+        """Patterns starting with a field are candidates for every step."""
+        assert literal_prefix_words(registry.steps["step"][0]) == ()
+
+
+class TestStepMatcherIndex:
+    """Test candidate selection and matching."""
+
+    def test_candidates_exclude_other_prefixes(self, registry):
+        """Only definitions sharing the step's leading words are candidates."""
+        index = StepMatcherIndex(registry)
+
+        candidates = index.candidates("when", 'I add "Sauce Labs Onesie" to the cart')
+
+        assert [c.pattern for c in candidates] == [
+            'I add "{product_name}" to the cart',
+            "{action} should respond",
+        ]
+
+    def test_find_match_same_as_registry(self, registry):
+        """The index should return the same first match as Behave."""
+        index = StepMatcherIndex(registry)
+        steps = [
+            make_step("when", 'I click "Checkout"'),
+            make_step("when", "I click the shopping cart"),
+            make_step("then", "the cart should have 2 items"),
+            make_step("then", "adding to cart should respond"),
+            make_step("then", "nothing matches this"),
+        ]
+
+        for step in steps:
+            expected = registry.find_match(step)
+            actual = index.find_match(step)
+            assert (actual and actual.func) == (expected and expected.func)
+
+    def test_new_definitions_are_indexed(self, registry):
+        """Definitions registered after the first lookup should be found."""
+        index = StepMatcherIndex(registry)
+        index.candidates("given", "I am logged in")
+
+        registry.add_step_definition("given", "I am logged in", step_func)
+
+        assert index.find_match(make_step("given", "I am logged in")) is not None
+
+    def test_case_insensitive_matcher_found_in_any_case(self, registry):
+        """Steps differing only in case should reach case-insensitive matchers."""
+        registry.steps["given"].append(
+            CaseInsensitiveMatcher(other_func, "I open the {page} page", "given")
+        )
+        index = StepMatcherIndex(registry)
+        step = make_step("given", "i OPEN the inventory page")
+
+        assert registry.find_match(step).func is other_func
+        assert index.find_match(step).func is other_func
+
+    def test_delegates_registry_attributes(self, registry):
+        """Other registry attributes should stay reachable."""
+        assert StepMatcherIndex(registry).steps is registry.steps
+
+
+class TestAmbiguousSteps:
+    """Test ambiguity reporting."""
+
+    def test_reports_shadowed_definition(self, registry):
+        """A step matched by two functions should report the shadowed one.
+
+        Behave only rejects a broad pattern registered before a specific
+        one; registered afterwards, it silently overlaps.
+        """
+        registry.add_step_definition("when", "I click {target}", step_func)
+        feature = parse_feature(
+            "Feature: Cart\n  Scenario: Open cart\n"
+            "    When I click the shopping cart\n"
+            "    When I click the shopping cart\n"
+        )
+
+        ambiguities = StepMatcherIndex(registry).ambiguous_steps([feature])
+
+        assert len(ambiguities) == 1
+        assert ambiguities[0]["step"] == "When I click the shopping cart"
+        assert "I click {target}" in ambiguities[0]["shadowed"][0]
+        assert "shadowed:" in format_ambiguous_step(ambiguities[0])